@@ -0,0 +1,199 @@
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import random
+import sys
+import time
+import numpy as np
+from typing   import Dict, List, Optional
+from .board   import Board
+from .search  import Search
+
+# Fixed positions searched by the benchmark, changing them changes the signature
+POSITIONS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "4k3/8/8/8/8/8/4P3/4K3 w - - 0 1",
+]
+
+# Functions reported by the move generation profile, besides Piece.moves()
+MOVEGEN = {
+    'piece_mask', 'capture_mask', 'masks', 'slide', 'legal_moves', 'get_moves',
+    'check_masks', 'attackers', 'is_legal', 'is_in_check', 'iter_moves',
+    'move_masks', 'select_moves',
+}
+
+def bench(
+        positions : List[str] = POSITIONS,
+        depth     : int = 3,
+        seed      : int = 0,
+    ) -> Dict[str, object]:
+    """Search fixed positions to a fixed depth.
+
+        Every position is searched by a new Search, such that no hash table,
+        killer moves or history carry over between positions or runs. The
+        total number of nodes is a signature of the search: any change to
+        move generation, ordering or pruning changes it.
+
+        Parameters
+        ----------
+        positions : List[str], default=POSITIONS
+            Positions in FEN notation to search.
+
+        depth : int, default=3
+            Depth in plies to search each position.
+
+        seed : int, default=0
+            Seed of the random generators, fixed such that runs are
+            reproducible.
+
+        Returns
+        -------
+        result : Dict[str, object]
+            Total 'nodes', 'seconds' and 'nps', and the 'move', 'score',
+            'nodes' and 'seconds' of each position in 'positions'.
+        """
+    # Fix random generators
+    random.seed(seed)
+    np.random.seed(seed)
+
+    # Initialise result
+    result = list()
+
+    # Search each position with an empty hash table
+    for fen in positions:
+        board  = Board.from_fen(fen)
+        search = Search(board)
+        start  = time.perf_counter()
+        move, score = search.run(depth)
+        result.append({
+            'fen'    : fen,
+            'move'   : board.uci(move) if move is not None else None,
+            'score'  : score,
+            'nodes'  : search.nodes,
+            'seconds': time.perf_counter() - start,
+        })
+
+    # Compute totals
+    nodes   = sum(position['nodes'  ] for position in result)
+    seconds = sum(position['seconds'] for position in result)
+
+    # Return result
+    return {
+        'depth'    : depth,
+        'nodes'    : nodes,
+        'seconds'  : seconds,
+        'nps'      : nodes / seconds if seconds else 0.0,
+        'positions': result,
+    }
+
+def profile(
+        positions : List[str] = POSITIONS,
+        depth     : int = 3,
+        seed      : int = 0,
+        output    : Optional[str] = None,
+    ) -> pstats.Stats:
+    """Run the benchmark under cProfile, see bench().
+
+        Parameters
+        ----------
+        positions : List[str], default=POSITIONS
+            Positions in FEN notation to search.
+
+        depth : int, default=3
+            Depth in plies to search each position.
+
+        seed : int, default=0
+            Seed of the random generators.
+
+        output : Optional[str]
+            If given, write the raw profile to this file, e.g., for snakeviz.
+
+        Returns
+        -------
+        stats : pstats.Stats
+            Statistics of the profiled run.
+        """
+    # Profile benchmark
+    profiler = cProfile.Profile()
+    profiler.runcall(bench, positions, depth, seed)
+
+    # Write raw profile, if required
+    if output is not None:
+        profiler.dump_stats(output)
+
+    # Return statistics
+    return pstats.Stats(profiler)
+
+def report(stats: pstats.Stats, file = None) -> None:
+    """Print calls and time of the move generation functions in a profile.
+
+        Parameters
+        ----------
+        stats : pstats.Stats
+            Statistics of a profiled run.
+
+        file : Optional[TextIO]
+            File object to write to, defaults to sys.stdout.
+        """
+    # Default to standard output
+    file = file if file is not None else sys.stdout
+
+    # Select Piece.moves() of all pieces and other move generation functions
+    pieces = os.path.join(os.path.dirname(__file__), 'pieces')
+    rows   = list()
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():
+        if (name == 'moves' and filename.startswith(pieces)) or (
+                name in MOVEGEN and filename.startswith(os.path.dirname(__file__))
+            ):
+            location = os.path.relpath(filename, os.path.dirname(os.path.dirname(__file__)))
+            rows.append((cumulative, total, calls, f"{location}:{line}({name})"))
+
+    # Print rows, most expensive first
+    file.write(f"{'calls':>10} {'tottime':>9} {'cumtime':>9} {'percall':>9}  function\n")
+    for cumulative, total, calls, name in sorted(rows, reverse=True):
+        file.write(
+            f"{calls:>10} {total:>9.3f} {cumulative:>9.3f} "
+            f"{1e6 * cumulative / calls:>7.1f}us  {name}\n"
+        )
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Search fixed positions to measure speed")
+    parser.add_argument('--depth'         , type=int, default=3, help="depth in plies")
+    parser.add_argument('--seed'          , type=int, default=0, help="seed of random generators")
+    parser.add_argument('--profile'       , action='store_true', help="report move generation profile")
+    parser.add_argument('--profile-output', help="write raw cProfile output to this file")
+    parser.add_argument('--json'          , help="write results to this file")
+    args = parser.parse_args()
+
+    # Run benchmark
+    result = bench(depth=args.depth, seed=args.seed)
+
+    # Print result
+    for index, position in enumerate(result['positions'], 1):
+        print(
+            f"position {index:>2}  {position['move'] or '-':<6} "
+            f"score {position['score']:>7}  nodes {position['nodes']:>8}  "
+            f"{position['seconds']:>7.3f}s"
+        )
+    print(f"nodes {result['nodes']}")
+    print(f"nps   {result['nps']:.0f}")
+    print(f"time  {result['seconds']:.3f}s")
+
+    # Write result, if required
+    if args.json is not None:
+        with open(args.json, 'w') as outfile:
+            json.dump(result, outfile, indent=4)
+
+    # Report profile of a second run, such that profiling does not affect the
+    # measured speed
+    if args.profile or args.profile_output is not None:
+        print()
+        report(profile(depth=args.depth, seed=args.seed, output=args.profile_output))
@@ -1,6 +1,62 @@
+import copy
+import logging
+import re
 import numpy as np
-import pieces
-from typing import Optional, Tuple
+from .          import pieces, render, zobrist
+from .move     import Move
+from .pieces   import geometry
+from .snapshot import Snapshot, decode_pieces, encode_pieces
+from typing    import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Logger for moves made on boards
+logger = logging.getLogger(__name__)
+
+# Moves in standard algebraic notation: piece, source file, source rank,
+# capture, destination square and promotion piece
+SAN = re.compile(r"([NBRQK])?([a-wyz])?(\d+)?x?([a-z]\d+)(?:=?([NBRQnbrq]))?")
+
+# Moves in {src}{dst}[promotion] notation, e.g., e2e4 or e7e8q
+UCI = re.compile(r"([a-z]\d+)([a-z]\d+)([nbrq]?)")
+
+# Maximum number of positions of which legal moves are cached for notation
+MOVE_CACHE_SIZE = 64
+
+class MoveMasks(NamedTuple):
+    """Pseudo-legal moves of all pieces of the color to move, see
+        Board.move_masks().
+
+        Attributes
+        ----------
+        color : pieces.Color
+            Color to move.
+
+        king : Optional[Tuple[int, int]]
+            Square of the king of the color to move, None if there is none.
+
+        checkers : Optional[List[Tuple[int, int]]]
+            Squares of pieces giving check, None if there is no king.
+
+        safe_black : Optional[np.ndarray of shape=(n_ranks, n_files)]
+            Mask of black pieces without the king of the color to move.
+
+        safe_white : Optional[np.ndarray of shape=(n_ranks, n_files)]
+            Mask of white pieces without the king of the color to move.
+
+        en_passant : Optional[Tuple[int, int]]
+            En passant square, None if there is none.
+
+        moves : List[Tuple[int, int, np.ndarray, np.ndarray, bool]]
+            Per piece the source rank and file, the mask of moves restricted
+            to resolve checks and stay on pin rays, the mask of squares that
+            are captures and whether the piece may capture en passant.
+        """
+    color      : pieces.Color
+    king       : Optional[Tuple[int, int]]
+    checkers   : Optional[List[Tuple[int, int]]]
+    safe_black : Optional[np.ndarray]
+    safe_white : Optional[np.ndarray]
+    en_passant : Optional[Tuple[int, int]]
+    moves      : List[Tuple[int, int, np.ndarray, np.ndarray, bool]]
 
 class Board(object):
 
@@ -21,12 +77,24 @@ class Board(object):
             """
         self.n_files    = n_files
         self.n_ranks    = n_ranks
-        self.board      = np.zeros((n_ranks, n_files), dtype=object)
+        self.board      = np.full((n_ranks, n_files), None, dtype=object)
         self.color      = pieces.Color.WHITE.value
         self.castling   = 'KQkq'
         self.en_passant = '-'
-        self.halfmove   = 1
-        self.fullmove   = 0
+        self.halfmove   = 0
+        self.fullmove   = 1
+
+        # Stack of states to restore when a move is undone
+        self.stack      = list()
+
+        # Zobrist hashes of all positions, the last is the current position
+        self.hashes     = [self.compute_zobrist_hash()]
+
+        # Attack maps of the position with the hash they were computed for
+        self.attack_cache = None
+
+        # Legal moves used by move notation, indexed by position hash
+        self.move_cache = dict()
 
     ########################################################################
     #                              Get square                              #
@@ -52,7 +120,7 @@ class Board(object):
         if square == '-':
             return None
         else:
-            return self.n_ranks - int(square[1]), ord(square[0].lower()) - ord('a')
+            return self.n_ranks - int(square[1:]), ord(square[0].lower()) - ord('a')
 
     def internal2square(self, rank: int, file: int) -> str:
         """Returns string representation of square.
@@ -81,8 +149,9 @@ class Board(object):
             self,
             src_rank : int,
             src_file : int,
-            dst_rank : int,
-            dst_file : int,
+            dst_rank  : int,
+            dst_file  : int,
+            promotion : Optional[str] = None,
         ) -> bool:
         """Perform a move by moving the piece from src square to dst square.
 
@@ -100,28 +169,28 @@ class Board(object):
             dst_file : int
                 File of destination square to move to.
 
+            promotion : Optional[str] ('n'|'b'|'r'|'q')
+                Piece to promote to. If None and the move promotes a pawn, the
+                user is queried for a piece.
+
             Returns
             -------
             success : bool
                 True if move was successful.
             """
-        # Check if move is allowed
-        if self.get_moves(src_rank, src_file)[dst_rank, dst_file]:
-
-            print(f"{self.internal2square(src_rank, src_file)} ({src_rank}, {src_file}) -> {self.internal2square(dst_rank, dst_file)} ({dst_rank}, {dst_file})")
+        # Create move
+        move = Move(src_rank, src_file, dst_rank, dst_file, promotion)
 
-            print(self.is_in_check(self.board[src_rank, src_file].color))
+        # Check if move is allowed
+        if (
+                self.get_moves(src_rank, src_file)[dst_rank, dst_file] and
+                self.is_legal(move)
+            ):
 
-            # Handle special cases
-            self.handle_en_passant(src_rank, src_file, dst_rank, dst_file)
-            self.handle_castling  (src_rank, src_file, dst_rank, dst_file)
-            self.handle_promotion (src_rank, src_file, dst_rank, dst_file)
+            logger.debug(f"{self.internal2square(src_rank, src_file)} ({src_rank}, {src_file}) -> {self.internal2square(dst_rank, dst_file)} ({dst_rank}, {dst_file})")
 
             # Perform move
-            self.move_piece(src_rank, src_file, dst_rank, dst_file)
-
-            # Update internals after a move was made
-            self.move_update()
+            self.push(move)
 
             # Return successful move
             return True
@@ -130,6 +199,94 @@ class Board(object):
         return False
 
 
+    def push(self, move: Move) -> None:
+        """Perform a move and remember the state required to undo it.
+
+            Note
+            ----
+            Method does not perform any checks of whether the move is possible.
+            Use self.move() to perform all necessary checks.
+
+            Parameters
+            ----------
+            move : Move
+                Move to perform.
+            """
+        # Store state before the move, the board itself is copied on write
+        self.stack.append((
+            self.board,
+            self.color,
+            self.castling,
+            self.en_passant,
+            self.halfmove,
+            self.fullmove,
+        ))
+        self.board = self.board.copy()
+
+        # Unpack move
+        src_rank, src_file, dst_rank, dst_file, promotion = move
+
+        # Captures and pawn moves cannot be undone in a game
+        irreversible = (
+            self.is_capture(move) or
+            isinstance(self.board[src_rank, src_file], pieces.Pawn)
+        )
+
+        # Handle special cases
+        self.handle_en_passant(src_rank, src_file, dst_rank, dst_file)
+        self.handle_castling  (src_rank, src_file, dst_rank, dst_file)
+        self.handle_promotion (src_rank, src_file, dst_rank, dst_file, promotion)
+
+        # Perform move
+        self.move_piece(src_rank, src_file, dst_rank, dst_file)
+
+        # Update internals after a move was made
+        self.move_update(irreversible)
+        self.hashes.append(self.update_zobrist_hash(*self.stack[-1][:4]))
+
+
+    def pop(self) -> None:
+        """Undo the last move performed by self.push()."""
+        self.hashes.pop()
+        (
+            self.board,
+            self.color,
+            self.castling,
+            self.en_passant,
+            self.halfmove,
+            self.fullmove,
+        ) = self.stack.pop()
+
+
+    def make_null_move(self) -> None:
+        """Pass the turn to the opponent without moving a piece.
+
+            Used by null-move pruning in the search, undo the null move using
+            self.unmake_null_move(). The en passant square is cleared and the
+            null move resets the halfmove clock, such that repetitions are
+            never detected across it.
+            """
+        # Store state before the null move, the board itself is not modified
+        self.stack.append((
+            self.board,
+            self.color,
+            self.castling,
+            self.en_passant,
+            self.halfmove,
+            self.fullmove,
+        ))
+
+        # Pass turn
+        self.en_passant = '-'
+        self.move_update(irreversible=True)
+        self.hashes.append(self.update_zobrist_hash(*self.stack[-1][:4]))
+
+
+    def unmake_null_move(self) -> None:
+        """Undo the last null move performed by self.make_null_move()."""
+        self.pop()
+
+
     def move_piece(
             self,
             src_rank : int,
@@ -201,10 +358,442 @@ class Board(object):
                 mask_white = self.piece_mask(color=pieces.Color.WHITE),
             )
 
+    def legal_moves(
+            self,
+            captures : bool = False,
+            quiets   : bool = False,
+        ) -> List[Move]:
+        """Get all legal moves for the color to move.
+
+            Checkers and pinned pieces are computed once per position, after
+            which the pseudo-legal moves of each piece are restricted to the
+            squares that resolve a check and to the ray of a pin. Only king
+            moves and en passant captures are tested individually.
+
+            Parameters
+            ----------
+            captures : bool, default=False
+                If True, only return captures, including en passant.
+
+            quiets : bool, default=False
+                If True, only return moves that do not capture, including
+                castling and promotions without capture.
+
+            Returns
+            -------
+            moves : List[Move]
+                Moves that do not leave the king of the moving color in check.
+                Promotions are returned once for every promotion piece.
+            """
+        return self.select_moves(self.move_masks(), captures, quiets)
+
+
+    def move_masks(self) -> MoveMasks:
+        """Get the pseudo-legal moves of all pieces of the color to move,
+            restricted to resolve checks and to stay on pin rays.
+
+            Masks are computed once per position, such that the legal moves
+            of several stages can be selected by self.select_moves() without
+            generating them again.
+
+            Returns
+            -------
+            masks : MoveMasks
+                Pseudo-legal moves of all pieces of the color to move.
+            """
+        # Initialise result
+        result = list()
+
+        # Get masks once for all pieces
+        color      = pieces.Color(self.color)
+        mask_black = self.piece_mask(color=pieces.Color.BLACK)
+        mask_white = self.piece_mask(color=pieces.Color.WHITE)
+        en_passant = self.square2internal(self.en_passant)
+
+        # Get squares that are captures, including en passant for pawns
+        targets = mask_black if color == pieces.Color.WHITE else mask_white
+        targets_pawn = targets
+        if en_passant is not None:
+            targets_pawn = targets.copy()
+            targets_pawn[en_passant] = True
+
+        # Get king, checkers and pins once for all pieces
+        checkers = safe_black = safe_white = None
+        king = self.king(color)
+        if king is not None:
+            checkers, evasions, pins = self.check_masks(
+                color, king, mask_black, mask_white,
+            )
+
+            # Get masks without own king, such that the king cannot hide from
+            # a sliding piece behind its own square
+            safe_black = mask_black.copy()
+            safe_white = mask_white.copy()
+            safe_black[king] = safe_white[king] = False
+
+        # Loop over all pieces of color to move
+        for src_rank, src_file in zip(*np.nonzero(self.piece_mask(color))):
+            src_rank, src_file = int(src_rank), int(src_file)
+            piece = self.board[src_rank, src_file]
+            pawn  = isinstance(piece, pieces.Pawn)
+
+            # Get pseudo-legal moves for piece
+            moves = piece.moves(
+                rank       = src_rank,
+                file       = src_file,
+                castling   = self.castling,
+                en_passant = en_passant,
+                mask_black = mask_black,
+                mask_white = mask_white,
+            )
+
+            # Check whether piece may capture en passant, which is tested by
+            # making the move as it removes a piece from another square
+            capture_en_passant = bool(en_passant is not None and pawn and moves[en_passant])
+
+            # Restrict moves to resolve checks and stay on pin rays
+            if king is not None and (src_rank, src_file) != king:
+                if evasions is not None:
+                    moves = moves & evasions
+                if (src_rank, src_file) in pins:
+                    moves = moves & pins[src_rank, src_file]
+
+            # Add moves of piece
+            result.append((
+                src_rank,
+                src_file,
+                moves,
+                targets_pawn if pawn else targets,
+                capture_en_passant,
+            ))
+
+        # Return result
+        return MoveMasks(
+            color      = color,
+            king       = king,
+            checkers   = checkers,
+            safe_black = safe_black,
+            safe_white = safe_white,
+            en_passant = en_passant,
+            moves      = result,
+        )
+
+
+    def select_moves(
+            self,
+            masks    : MoveMasks,
+            captures : bool = False,
+            quiets   : bool = False,
+        ) -> List[Move]:
+        """Select the legal moves from masks computed by self.move_masks().
+
+            Parameters
+            ----------
+            masks : MoveMasks
+                Pseudo-legal moves of the current position.
+
+            captures : bool, default=False
+                If True, only return captures, including en passant.
+
+            quiets : bool, default=False
+                If True, only return moves that do not capture, including
+                castling and promotions without capture.
+
+            Returns
+            -------
+            moves : List[Move]
+                Legal moves, see self.legal_moves().
+            """
+        # Initialise result
+        result = list()
+        color  = masks.color
+        king   = masks.king
+
+        # Loop over all pieces of color to move
+        for src_rank, src_file, moves, targets, capture_en_passant in masks.moves:
+            # Only keep captures or quiet moves if required
+            if captures:
+                moves = moves & targets
+            elif quiets:
+                moves = moves & ~targets
+                capture_en_passant = False
+
+            # Loop over all destination squares
+            for dst_rank, dst_file in zip(*np.nonzero(moves)):
+                dst_rank, dst_file = int(dst_rank), int(dst_file)
+
+                # Test king moves for attacks on the destination square
+                if (src_rank, src_file) == king:
+                    if self.is_castle_move(src_rank, src_file, dst_rank, dst_file):
+                        if masks.checkers or self.is_attacked(
+                                rank  = src_rank,
+                                file  = (src_file + dst_file) // 2,
+                                color = color.opposite,
+                            ):
+                            continue
+                    if next(self.attackers(
+                            rank       = dst_rank,
+                            file       = dst_file,
+                            color      = color.opposite,
+                            mask_black = masks.safe_black,
+                            mask_white = masks.safe_white,
+                        ), None) is not None:
+                        continue
+
+                # Get possible promotions
+                if self.is_promotion(src_rank, src_file, dst_rank, dst_file):
+                    promotions = 'qrbn'
+                else:
+                    promotions = [None]
+
+                # Add legal moves
+                for promotion in promotions:
+                    result.append(Move(src_rank, src_file, dst_rank, dst_file, promotion))
+
+            # Test en passant capture by making the move
+            if capture_en_passant:
+                move = Move(src_rank, src_file, *masks.en_passant)
+                if move not in result and self.is_legal(move):
+                    result.append(move)
+                elif move in result and not self.is_legal(move):
+                    result.remove(move)
+
+        # Without a king, test every move by making the move
+        if king is None:
+            result = [move for move in result if self.is_legal(move)]
+
+        # Return result
+        return result
+
+
+    def iter_moves(
+            self,
+            hash_move : Optional[Move] = None,
+            order     : Optional[Callable[[List[Move]], List[Move]]] = None,
+        ) -> Iterator[Move]:
+        """Iterate over all legal moves for the color to move in stages.
+
+            Moves are generated lazily in the following stages:
+            1. The hash move, if it is legal in this position.
+            2. Captures, including en passant.
+            3. Quiet moves.
+            Pseudo-legal moves of all pieces are generated once, after the
+            hash move is consumed, and each stage only selects its legal moves
+            once all moves of the previous stage are consumed, so a search
+            that cuts off on the hash move never generates moves and one that
+            cuts off on a capture never tests quiet moves for legality. The
+            board must be in the same position whenever the iterator is
+            resumed.
+
+            Parameters
+            ----------
+            hash_move : Optional[Move]
+                Best move previously found in this position, if any. It is
+                checked for legality, as positions may share a hash.
+
+            order : Optional[Callable[[List[Move]], List[Move]]]
+                If given, used to sort the moves of each stage.
+
+            Yields
+            ------
+            move : Move
+                Legal move, every legal move is yielded exactly once.
+            """
+        # Yield hash move if legal
+        if hash_move is not None and self.is_pseudo_legal(hash_move) and self.is_legal(hash_move):
+            yield hash_move
+        else:
+            hash_move = None
+
+        # Generate pseudo-legal moves once for all stages
+        masks = self.move_masks()
+
+        # Yield captures, followed by quiet moves
+        for stage in ('captures', 'quiets'):
+            moves = self.select_moves(masks, **{stage: True})
+            if order is not None:
+                moves = order(moves)
+            for move in moves:
+                if move != hash_move:
+                    yield move
+
+
+    def is_pseudo_legal(self, move: Move) -> bool:
+        """Check whether a move can be made by a piece of the color to move,
+            without checking whether the king is left in check."""
+        return (
+            # Check whether squares are on the board
+            all(0 <= rank < self.n_ranks for rank in (move.src_rank, move.dst_rank)) and
+            all(0 <= file < self.n_files for file in (move.src_file, move.dst_file)) and
+            # Check whether the piece can move to the destination
+            bool(self.get_moves(move.src_rank, move.src_file)[move.dst_rank, move.dst_file]) and
+            # Check whether a promotion piece is given exactly for promotions
+            (move.promotion in tuple('qrbn')) == self.is_promotion(*move[:4])
+        )
+
+
+    def check_masks(
+            self,
+            color      : pieces.Color,
+            king       : Tuple[int, int],
+            mask_black : np.ndarray,
+            mask_white : np.ndarray,
+        ) -> Tuple[List[Tuple[int, int]], Optional[np.ndarray], dict]:
+        """Compute checkers, check evasions and pins of a king.
+
+            Parameters
+            ----------
+            color : pieces.Color
+                Color of king.
+
+            king : Tuple[int, int]
+                Rank and file of king.
+
+            mask_black : np.ndarray of shape=(n_ranks, n_files)
+                Mask of black pieces.
+
+            mask_white : np.ndarray of shape=(n_ranks, n_files)
+                Mask of white pieces.
+
+            Returns
+            -------
+            checkers : List[Tuple[int, int]]
+                Squares of pieces giving check.
+
+            evasions : Optional[np.ndarray] of shape=(n_ranks, n_files)
+                If in check, mask of squares other pieces may move to in order
+                to capture or block the checking piece, None otherwise.
+
+            pins : Dict[Tuple[int, int], np.ndarray]
+                Mask of squares each pinned piece may move to, i.e., the ray
+                between the king and the pinning piece, including the latter.
+            """
+        # Get checkers
+        checkers = list(self.attackers(
+            *king, color.opposite, mask_black=mask_black, mask_white=mask_white,
+        ))
+
+        # Get evasions
+        evasions = None
+        if len(checkers) > 1:
+            # Only the king can move out of a double check
+            evasions = np.zeros((self.n_ranks, self.n_files), dtype=bool)
+        elif checkers:
+            evasions = np.zeros((self.n_ranks, self.n_files), dtype=bool)
+            evasions[checkers[0]] = True
+            # Add squares between king and a sliding checker
+            if isinstance(self.board[checkers[0]], (
+                    pieces.Bishop, pieces.Rook, pieces.Queen,
+                )):
+                for square in self.ray(king, checkers[0]):
+                    evasions[square] = True
+
+        # Get pins by walking from the king in every direction
+        pins = dict()
+        own = mask_white if color == pieces.Color.WHITE else mask_black
+        for delta_rank, delta_file in [
+                (-1,  0), (1, 0), (0, -1), ( 0, 1),
+                (-1, -1), (1, 1), (-1, 1), ( 1, -1),
+            ]:
+            # Get sliders pinning along direction
+            if delta_rank == 0 or delta_file == 0:
+                sliders = (pieces.Rook, pieces.Queen)
+            else:
+                sliders = (pieces.Bishop, pieces.Queen)
+
+            # Walk from king until the second piece
+            pinned = None
+            rank, file = king[0] + delta_rank, king[1] + delta_file
+            while 0 <= rank < self.n_ranks and 0 <= file < self.n_files:
+                piece = self.board[rank, file]
+                if own[rank, file] and pinned is None:
+                    pinned = (rank, file)
+                elif own[rank, file]:
+                    break
+                elif piece is not None:
+                    # Piece of opposite color, pins if it slides along ray
+                    if pinned is not None and isinstance(piece, sliders):
+                        pins[pinned] = np.zeros(
+                            (self.n_ranks, self.n_files), dtype=bool,
+                        )
+                        pins[pinned][rank, file] = True
+                        for square in self.ray(king, (rank, file)):
+                            pins[pinned][square] = True
+                    break
+                rank, file = rank + delta_rank, file + delta_file
+
+        # Return result
+        return checkers, evasions, pins
+
+
+    def ray(
+            self,
+            src : Tuple[int, int],
+            dst : Tuple[int, int],
+        ) -> Iterator[Tuple[int, int]]:
+        """Iterate over squares strictly between two squares on a line."""
+        # Get direction
+        delta_rank = (dst[0] > src[0]) - (dst[0] < src[0])
+        delta_file = (dst[1] > src[1]) - (dst[1] < src[1])
+
+        # Walk from source to destination
+        rank, file = src[0] + delta_rank, src[1] + delta_file
+        while (rank, file) != dst:
+            yield rank, file
+            rank, file = rank + delta_rank, file + delta_file
+
+
+    def king(self, color: pieces.Color) -> Optional[Tuple[int, int]]:
+        """Get rank and file of the king of a given color, None if absent."""
+        for rank, file in zip(*np.nonzero(self.piece_mask(color))):
+            if isinstance(self.board[rank, file], pieces.King):
+                return int(rank), int(file)
+        return None
+
     ########################################################################
     #                           Check functions                            #
     ########################################################################
 
+    def is_legal(self, move: Move) -> bool:
+        """Check whether a pseudo-legal move does not leave the king in check.
+
+            Parameters
+            ----------
+            move : Move
+                Pseudo-legal move to check, as given by self.get_moves().
+
+            Returns
+            -------
+            is_legal : bool
+                True if move does not leave or put the king in check.
+            """
+        # Get color of moving piece
+        color = pieces.Color(self.color)
+
+        # Castling is not allowed out of or through check
+        if self.is_castle_move(*move[:4]) and (
+                self.is_in_check(color) or
+                self.is_attacked(
+                    rank  = move.src_rank,
+                    file  = (move.src_file + move.dst_file) // 2,
+                    color = color.opposite,
+                )
+            ):
+            return False
+
+        # Promotion piece does not influence legality, avoid querying the user
+        if move.promotion is None and self.is_promotion(*move[:4]):
+            move = move._replace(promotion='q')
+
+        # Perform move and check whether king is left in check
+        self.push(move)
+        result = not self.is_in_check(color)
+        self.pop()
+
+        # Return result
+        return result
+
+
     def is_in_check(self, color : Optional[pieces.Color] = None) -> bool:
         """Check wheter a given color is in check.
 
@@ -219,43 +808,330 @@ class Board(object):
             is_in_check : boolean
                 True if given color (or any color if color is None) is in check.
             """
-        # Get pieces of opposite colour
-        if color == pieces.Color.WHITE:
-            opposite_color = pieces.Color.BLACK
-        elif color == pieces.Color.BLACK:
-            opposite_color = pieces.Color.WHITE
-        else:
-            opposite_color = None
+        # Check both colors if no color is given
+        if color is None:
+            return (
+                self.is_in_check(pieces.Color.WHITE) or
+                self.is_in_check(pieces.Color.BLACK)
+            )
+
+        # Check if king is attacked by opposite color
+        king = self.king(color)
+        if king is not None:
+            return self.is_attacked(*king, color.opposite)
 
-        # Get piece mask
-        mask = self.piece_mask(opposite_color)
+        # Without a king, a color cannot be in check
+        return False
 
-        # Get corresponding files and ranks
-        # TODO
 
-        # Loop over all pieces
-        for piece in self.board[self.piece_mask(opposite_color)]:
-            # Get moves for piece
-            moves = piece.moves(
+    def is_attacked(self, rank: int, file: int, color: pieces.Color) -> bool:
+        """Check whether a square is attacked by pieces of a given color.
+
+            Parameters
+            ----------
+            rank : int
+                Rank of square to check.
+
+            file : int
+                File of square to check.
+
+            color : pieces.Color
+                Color of attacking pieces.
+
+            Returns
+            -------
+            is_attacked : bool
+                True if any piece of given color attacks the square.
+            """
+        return next(self.attackers(rank, file, color), None) is not None
+
+
+    def attackers(
+            self,
+            rank       : int,
+            file       : int,
+            color      : pieces.Color,
+            mask_black : Optional[np.ndarray] = None,
+            mask_white : Optional[np.ndarray] = None,
+        ) -> Iterator[Tuple[int, int]]:
+        """Iterate over all pieces of a given color attacking a square.
+
+            Parameters
+            ----------
+            rank : int
+                Rank of square to check.
+
+            file : int
+                File of square to check.
+
+            color : pieces.Color
+                Color of attacking pieces.
+
+            mask_black : Optional[np.ndarray] of shape=(n_ranks, n_files)
+                If given, use as mask of black pieces instead of the board.
+                Pieces removed from the mask neither attack nor block, which
+                reveals x-ray attacks behind them.
+
+            mask_white : Optional[np.ndarray] of shape=(n_ranks, n_files)
+                If given, use as mask of white pieces instead of the board.
+                Pieces removed from the mask neither attack nor block, which
+                reveals x-ray attacks behind them.
+
+            Yields
+            ------
+            rank : int
+                Rank of attacking piece.
+
+            file : int
+                File of attacking piece.
+            """
+        # Get masks
+        if mask_black is None:
+            mask_black = self.piece_mask(color=pieces.Color.BLACK)
+        if mask_white is None:
+            mask_white = self.piece_mask(color=pieces.Color.WHITE)
+
+        # Get mask of attacking color
+        mask = mask_white if color == pieces.Color.WHITE else mask_black
+
+        # Look from the square as each piece type, any piece of the same type
+        # that can be captured this way attacks the square
+        for piece_type, attackers in [
+                (pieces.Knight, (pieces.Knight,)),
+                (pieces.Bishop, (pieces.Bishop, pieces.Queen)),
+                (pieces.Rook  , (pieces.Rook  , pieces.Queen)),
+                (pieces.King  , (pieces.King  ,)),
+            ]:
+            # Get moves of piece type on square
+            moves = piece_type(
+                color.opposite,
+                n_files = self.n_files,
+                n_ranks = self.n_ranks,
+            ).moves(
                 rank       = rank,
                 file       = file,
-                castling   = self.castling,
-                en_passant = self.square2internal(self.en_passant),
-                mask_black = self.piece_mask(color=pieces.Color.BLACK),
-                mask_white = self.piece_mask(color=pieces.Color.WHITE),
+                mask_black = mask_black,
+                mask_white = mask_white,
             )
 
-            # Check if king capture is in possible moves
-            print(moves)
+            # Check whether any of the reached squares contains an attacker
+            for attacker_rank, attacker_file in zip(*np.nonzero(moves & mask)):
+                if isinstance(self.board[attacker_rank, attacker_file], attackers):
+                    yield int(attacker_rank), int(attacker_file)
 
-        raise ValueError("Not yet implemented")
+        # Check pawns, which attack diagonally forward
+        pawn_rank = rank + 1 if color == pieces.Color.WHITE else rank - 1
+        if 0 <= pawn_rank < self.n_ranks:
+            for pawn_file in (file - 1, file + 1):
+                if 0 <= pawn_file < self.n_files and mask[pawn_rank, pawn_file]:
+                    if isinstance(self.board[pawn_rank, pawn_file], pieces.Pawn):
+                        yield pawn_rank, pawn_file
+
+    ########################################################################
+    #                             Attack maps                              #
+    ########################################################################
+
+    def attacks(self, color: pieces.Color) -> np.ndarray:
+        """Return mask of all squares attacked by pieces of a given color.
+
+            Parameters
+            ----------
+            color : pieces.Color
+                Color of attacking pieces.
+
+            Returns
+            -------
+            attacks : np.ndarray of shape=(n_ranks, n_files)
+                Read-only boolean mask that is True for every square attacked
+                by a piece of color, including squares of defended pieces.
+            """
+        return self.attack_maps()[color][0]
+
+    def mobility(self, color: Optional[pieces.Color] = None) -> int:
+        """Return the mobility of a given color.
+
+            Parameters
+            ----------
+            color : Optional[pieces.Color]
+                Color for which to compute mobility, defaults to the color to
+                move.
+
+            Returns
+            -------
+            mobility : int
+                Number of squares attacked by each piece other than pawns,
+                excluding squares occupied by pieces of the same color, summed
+                over all pieces of color.
+            """
+        color = pieces.Color(self.color) if color is None else color
+        return self.attack_maps()[color][1]
+
+    def attack_maps(self) -> Dict[pieces.Color, Tuple[np.ndarray, int]]:
+        """Compute attacks and mobility of both colors in a single pass.
+
+            Results are cached for the hash of the current position, such that
+            evaluating the same position again, e.g., by both attacks() and
+            mobility(), does not recompute them. Any move changes the hash,
+            which invalidates the cache.
+
+            Returns
+            -------
+            maps : Dict[pieces.Color, Tuple[np.ndarray, int]]
+                Mask of attacked squares and mobility for each color.
+            """
+        # Return cached maps of current position
+        key = self.hashes[-1]
+        if self.attack_cache is not None and self.attack_cache[0] == key:
+            return self.attack_cache[1]
+
+        # Get move tables and masks of pieces in a single pass over the board
+        table    = geometry.get(self.n_ranks, self.n_files)
+        shape    = (self.n_ranks, self.n_files)
+        own      = {color: np.zeros(shape, dtype=bool) for color in pieces.Color}
+        pawns    = {color: np.zeros(shape, dtype=bool) for color in pieces.Color}
+        located  = list()
+        for rank, row in enumerate(self.board.tolist()):
+            for file, piece in enumerate(row):
+                if piece is not None:
+                    own[piece.color][rank, file] = True
+                    if isinstance(piece, pieces.Pawn):
+                        pawns[piece.color][rank, file] = True
+                    else:
+                        located.append((rank, file, piece))
+        occupied = own[pieces.Color.WHITE] | own[pieces.Color.BLACK]
+        empty    = np.zeros(shape, dtype=bool)
+
+        # Initialise attacks with pawns, which attack diagonally forward
+        attacks  = {color: np.zeros(shape, dtype=bool) for color in pieces.Color}
+        mobility = {color: 0 for color in pieces.Color}
+        white, black = pawns[pieces.Color.WHITE], pawns[pieces.Color.BLACK]
+        attacks[pieces.Color.WHITE][:-1, 1: ] |= white[1: , :-1]
+        attacks[pieces.Color.WHITE][:-1, :-1] |= white[1: , 1: ]
+        attacks[pieces.Color.BLACK][1: , 1: ] |= black[:-1, :-1]
+        attacks[pieces.Color.BLACK][1: , :-1] |= black[:-1, 1: ]
+
+        # Add attacks of other pieces from the shared move tables
+        for rank, file, piece in located:
+            if isinstance(piece, pieces.Knight):
+                mask = table.knight[rank, file]
+            elif isinstance(piece, pieces.King):
+                mask = table.king[rank, file]
+            else:
+                directions = (
+                    geometry.ORTHOGONAL if isinstance(piece, pieces.Rook  ) else
+                    geometry.DIAGONAL   if isinstance(piece, pieces.Bishop) else
+                    geometry.ORTHOGONAL + geometry.DIAGONAL
+                )
+                mask = table.slide(rank, file, directions, empty, occupied)
+
+            attacks [piece.color] |= mask
+            mobility[piece.color] += int(np.count_nonzero(mask & ~own[piece.color]))
+
+        # Protect cached masks against modification
+        for mask in attacks.values():
+            mask.flags.writeable = False
+
+        # Cache and return result
+        result = {color: (attacks[color], mobility[color]) for color in pieces.Color}
+        self.attack_cache = (key, result)
+        return result
+
+    ########################################################################
+    #                      Static exchange evaluation                      #
+    ########################################################################
+
+    def see(self, move: Move) -> int:
+        """Static exchange evaluation of a capture.
+
+            Computes the material outcome of the sequence of captures on the
+            destination square of a move, where each side recaptures with its
+            least valuable attacker and may stop capturing when it is ahead.
+            Attackers behind pieces that already captured are revealed (x-ray
+            attacks). No moves are made on the board.
+
+            Parameters
+            ----------
+            move : Move
+                Move to evaluate, usually a capture.
+
+            Returns
+            -------
+            score : int
+                Material gained by the moving color in centipawns, negative
+                if the capture loses material.
+            """
+        # Get value of a piece in an exchange, the king can never be captured
+        def value(piece):
+            return piece.value if not isinstance(piece, pieces.King) else 100 * pieces.Queen.value
+
+        # Get occupancy masks, these are updated as pieces are exchanged
+        mask_black = self.piece_mask(color=pieces.Color.BLACK)
+        mask_white = self.piece_mask(color=pieces.Color.WHITE)
+
+        # Get initial victim, en passant always captures a pawn
+        attacker = self.board[move.src_rank, move.src_file]
+        victim   = self.board[move.dst_rank, move.dst_file]
+        if victim is None and self.is_en_passant(*move[:4]):
+            victim = self.board[move.src_rank, move.dst_file]
+            mask_black[move.src_rank, move.dst_file] = False
+            mask_white[move.src_rank, move.dst_file] = False
+
+        # Initialise gains of each capture in the sequence
+        gains = [value(victim) if victim is not None else 0]
+
+        # Perform first capture
+        mask_black[move.src_rank, move.src_file] = False
+        mask_white[move.src_rank, move.src_file] = False
+        on_square = value(attacker)
+        color     = attacker.color.opposite
+
+        # Alternate captures with the least valuable attacker
+        while True:
+            # Get least valuable attacker of color to capture
+            attackers = [
+                (value(self.board[rank, file]), rank, file)
+                for rank, file in self.attackers(
+                    rank       = move.dst_rank,
+                    file       = move.dst_file,
+                    color      = color,
+                    mask_black = mask_black,
+                    mask_white = mask_white,
+                )
+            ]
+            if not attackers:
+                break
+            attacker_value, rank, file = min(attackers)
+
+            # Store gain of capture, assuming the piece is captured back
+            gains.append(on_square - gains[-1])
+
+            # Remove attacker from its square, revealing pieces behind it
+            mask_black[rank, file] = False
+            mask_white[rank, file] = False
+            on_square = attacker_value
+            color     = color.opposite
+
+        # Let each side choose between capturing and stopping, last to first
+        while len(gains) > 1:
+            gain = gains.pop()
+            gains[-1] = -max(-gains[-1], gain)
+
+        # Return result
+        return gains[0]
 
     ########################################################################
     #                       Auxiliary move functions                       #
     ########################################################################
 
-    def move_update(self):
-        """Update all internal variables after a successful move."""
+    def move_update(self, irreversible: bool = False):
+        """Update all internal variables after a successful move.
+
+            Parameters
+            ----------
+            irreversible : bool, default=False
+                True if the move was a capture or pawn move, which resets the
+                halfmove clock.
+            """
         # Flip active color
         if self.color == pieces.Color.WHITE.value:
             self.color = pieces.Color.BLACK.value
@@ -264,7 +1140,10 @@ class Board(object):
             self.fullmove += 1
 
         # Increment clocks
-        self.halfmove += 1
+        if irreversible:
+            self.halfmove = 0
+        else:
+            self.halfmove += 1
 
     ########################################################################
     #                         En passant functions                         #
@@ -352,6 +1231,25 @@ class Board(object):
         )
 
 
+    def is_capture(self, move: Move) -> bool:
+        """Check whether a move captures a piece, including en passant.
+
+            Parameters
+            ----------
+            move : Move
+                Move to check.
+
+            Returns
+            -------
+            is_capture : bool
+                True if move captures a piece.
+            """
+        return (
+            self.board[move.dst_rank, move.dst_file] is not None or
+            self.is_en_passant(*move[:4])
+        )
+
+
     def is_double_pawn_move(
             self,
             src_rank : int,
@@ -427,6 +1325,16 @@ class Board(object):
             else:
                 self.move_piece(src_rank, self.n_files-1, dst_rank, dst_file-1)
 
+        # Check if a rook is captured on its initial square
+        if (dst_rank, dst_file) == (self.n_ranks-1, 0):
+            self.castling = ''.join(x for x in self.castling if x!='Q')
+        elif (dst_rank, dst_file) == (self.n_ranks-1, self.n_files-1):
+            self.castling = ''.join(x for x in self.castling if x!='K')
+        elif (dst_rank, dst_file) == (0, 0):
+            self.castling = ''.join(x for x in self.castling if x!='q')
+        elif (dst_rank, dst_file) == (0, self.n_files-1):
+            self.castling = ''.join(x for x in self.castling if x!='k')
+
         # Check if the king moved
         if isinstance(self.board[src_rank, src_file], pieces.King):
             # Remove castling rights of king colour
@@ -498,14 +1406,15 @@ class Board(object):
             self,
             src_rank : int,
             src_file : int,
-            dst_rank : int,
-            dst_file : int,
+            dst_rank  : int,
+            dst_file  : int,
+            promotion : Optional[str] = None,
         ) -> None:
         """Handle moves involving promotion of a piece.
 
             This involves the following actions:
-            1. If a pawn reaches the last rank, prompt the user for a piece to
-               promote to.
+            1. If a pawn reaches the last rank and no promotion piece is given,
+               prompt the user for a piece to promote to.
             2. If the piece is chosen, replace the pawn by said piece.
 
             Parameters
@@ -521,13 +1430,16 @@ class Board(object):
 
             dst_file : int
                 File of destination square to move to.
+
+            promotion : Optional[str] ('n'|'b'|'r'|'q')
+                Piece to promote to. If None, the user is queried for a piece.
             """
         # Check if the move promotes a pawn
         if self.is_promotion(src_rank, src_file, dst_rank, dst_file):
             # Get possible promotion pieces
             possibilities = set('nbrq')
             # Initialise promotion piece
-            piece = None
+            piece = promotion
 
             # Query user until we receive a correct promotion piece
             while piece not in possibilities:
@@ -539,13 +1451,13 @@ class Board(object):
 
             # Create new piece
             if piece == 'q':
-                piece = pieces.Queen(color)
+                piece = pieces.Queen(color, n_files=self.n_files, n_ranks=self.n_ranks)
             elif piece == 'r':
-                piece = pieces.Rook(color)
+                piece = pieces.Rook(color, n_files=self.n_files, n_ranks=self.n_ranks)
             elif piece == 'b':
-                piece = pieces.Bishop(color)
+                piece = pieces.Bishop(color, n_files=self.n_files, n_ranks=self.n_ranks)
             elif piece == 'n':
-                piece = pieces.Knight(color)
+                piece = pieces.Knight(color, n_files=self.n_files, n_ranks=self.n_ranks)
             else:
                 raise ValueError(
                     f"Unknown piece {piece}, should be one of {possibilities}"
@@ -618,6 +1530,442 @@ class Board(object):
         # Return piece
         return piece
 
+    ########################################################################
+    #                            Move notation                             #
+    ########################################################################
+
+    def cached_legal_moves(self) -> List[Move]:
+        """Return legal moves of the current position, generated once per
+            position hash.
+
+            Used by move notation, such that formatting or parsing all moves
+            of a position, or of a game and the positions following it, does
+            not generate the same moves for every move. Up to MOVE_CACHE_SIZE
+            positions are kept.
+
+            Returns
+            -------
+            moves : List[Move]
+                Legal moves of the current position, must not be modified.
+            """
+        # Return cached moves of current position
+        key = self.hashes[-1]
+        moves = self.move_cache.get(key)
+        if moves is not None:
+            return moves
+
+        # Clear cache when full
+        if len(self.move_cache) >= MOVE_CACHE_SIZE:
+            self.move_cache.clear()
+
+        # Generate, cache and return moves
+        moves = self.move_cache[key] = self.legal_moves()
+        return moves
+
+    def uci(self, move: Move) -> str:
+        """Format move in {src}{dst}[promotion] notation, e.g., e2e4 or e7e8q.
+
+            Parameters
+            ----------
+            move : Move
+                Move to format.
+
+            Returns
+            -------
+            notation : str
+                Move in {src}{dst}[promotion] notation.
+            """
+        return (
+            self.internal2square(move.src_rank, move.src_file) +
+            self.internal2square(move.dst_rank, move.dst_file) +
+            (move.promotion or '')
+        )
+
+    def parse_uci(self, text: str) -> Move:
+        """Parse a legal move in {src}{dst}[promotion] notation.
+
+            Parameters
+            ----------
+            text : str
+                Move in {src}{dst}[promotion] notation, e.g., e2e4 or e7e8q.
+
+            Returns
+            -------
+            move : Move
+                Legal move.
+
+            Raises
+            ------
+            ValueError
+                If the notation is invalid or the move is not legal.
+            """
+        # Check notation
+        match = UCI.fullmatch(text.strip().lower())
+        if match is None:
+            raise ValueError(f"invalid move {text}")
+
+        # Parse squares
+        squares = list()
+        for square in match.group(1, 2):
+            rank, file = self.square2internal(square)
+            if not (0 <= rank < self.n_ranks and 0 <= file < self.n_files):
+                raise ValueError(f"invalid square {square}")
+            squares.extend((rank, file))
+        move = Move(*squares, match.group(3) or None)
+
+        # Check legality
+        moves = self.cached_legal_moves()
+        if move in moves:
+            return move
+        if move.promotion is None and any(other[:4] == move[:4] for other in moves):
+            raise ValueError("missing promotion piece")
+        raise ValueError(f"illegal move {text}")
+
+    def san(self, move: Move) -> str:
+        """Format a legal move in standard algebraic notation.
+
+            Parameters
+            ----------
+            move : Move
+                Legal move to format.
+
+            Returns
+            -------
+            notation : str
+                Move in standard algebraic notation, including a check (+) or
+                checkmate (#) suffix.
+            """
+        # Get moving piece and squares
+        piece = self.board[move.src_rank, move.src_file]
+        src   = self.internal2square(move.src_rank, move.src_file)
+        dst   = self.internal2square(move.dst_rank, move.dst_file)
+
+        # Format castling
+        if self.is_castle_move(*move[:4]):
+            result = 'O-O' if move.dst_file > move.src_file else 'O-O-O'
+
+        # Format pawn moves
+        elif isinstance(piece, pieces.Pawn):
+            result = (src[0] + 'x' + dst) if self.is_capture(move) else dst
+            if move.promotion is not None:
+                result += '=' + move.promotion.upper()
+
+        # Format piece moves, disambiguating between pieces of the same type
+        # moving to the same square
+        else:
+            others = [
+                other for other in self.cached_legal_moves()
+                if other[2:4] == move[2:4] and other[:2] != move[:2]
+                and type(self.board[other.src_rank, other.src_file]) is type(piece)
+            ]
+            if not others:
+                disambiguation = ''
+            elif all(other.src_file != move.src_file for other in others):
+                disambiguation = src[0]
+            elif all(other.src_rank != move.src_rank for other in others):
+                disambiguation = src[1:]
+            else:
+                disambiguation = src
+
+            result = (
+                piece.symbol.value + disambiguation +
+                ('x' if self.is_capture(move) else '') + dst
+            )
+
+        # Add check or checkmate suffix
+        self.push(move)
+        try:
+            if self.is_in_check(pieces.Color(self.color)):
+                result += '#' if not self.cached_legal_moves() else '+'
+        finally:
+            self.pop()
+
+        # Return result
+        return result
+
+    def parse_san(self, text: str) -> Move:
+        """Parse a legal move in standard algebraic notation.
+
+            Parameters
+            ----------
+            text : str
+                Move in standard algebraic notation, e.g., e4, Nbd7, exd5,
+                e8=Q or O-O. Check, checkmate and annotation suffixes are
+                ignored.
+
+            Returns
+            -------
+            move : Move
+                Legal move.
+
+            Raises
+            ------
+            ValueError
+                If the notation is invalid, or does not match exactly one
+                legal move.
+            """
+        # Remove suffixes
+        notation = text.strip().rstrip('+#!?')
+
+        # Get legal moves, generated once per position
+        moves = self.cached_legal_moves()
+
+        # Select castling moves
+        if notation.replace('0', 'O') in ('O-O', 'O-O-O'):
+            kingside   = notation.replace('0', 'O') == 'O-O'
+            candidates = [
+                move for move in moves
+                if self.is_castle_move(*move[:4]) and
+                (move.dst_file > move.src_file) == kingside
+            ]
+
+        # Select moves matching piece, source and destination
+        else:
+            match = SAN.fullmatch(notation)
+            if match is None:
+                raise ValueError(f"invalid move {text}")
+            symbol, file, rank, dst, promotion = match.groups()
+            dst_rank, dst_file = self.square2internal(dst)
+
+            candidates = [
+                move for move in moves
+                if move.dst_rank == dst_rank and move.dst_file == dst_file
+                and self.board[move.src_rank, move.src_file].symbol.value == (symbol or 'P')
+                and (file is None or self.internal2square(*move[:2])[0] == file)
+                and (rank is None or self.internal2square(*move[:2])[1:] == rank)
+                and move.promotion == (promotion.lower() if promotion else None)
+            ]
+
+        # Return move if unique
+        if len(candidates) == 1:
+            return candidates[0]
+        if candidates:
+            raise ValueError(f"ambiguous move {text}")
+        raise ValueError(f"illegal move {text}")
+
+    ########################################################################
+    #                               Hashing                                #
+    ########################################################################
+
+    def zobrist_hash(self) -> int:
+        """Return the Zobrist hash of the current position.
+
+            Note
+            ----
+            The hash is updated incrementally by self.push() and self.pop(). If
+            the board is changed in any other way, use
+            self.compute_zobrist_hash() to compute the hash from scratch.
+
+            Returns
+            -------
+            hash : int
+                64-bit hash of pieces, color to move, castling rights and en
+                passant square, if a pawn can capture on it.
+            """
+        return self.hashes[-1]
+
+
+    def compute_zobrist_hash(self) -> int:
+        """Compute the Zobrist hash of the current position from scratch.
+
+            Returns
+            -------
+            hash : int
+                64-bit hash of pieces, color to move, castling rights and en
+                passant square, if a pawn can capture on it.
+            """
+        # Get keys for board size
+        keys = zobrist.get(self.n_ranks, self.n_files)
+
+        # Initialise result
+        result = 0
+
+        # Add pieces
+        for rank, file in zip(*np.nonzero(self.piece_mask())):
+            result ^= keys.pieces[self.board[rank, file].index][rank][file]
+
+        # Add color to move
+        if self.color == pieces.Color.BLACK.value:
+            result ^= keys.color
+
+        # Add castling rights
+        for right in self.castling:
+            result ^= keys.castling.get(right, 0)
+
+        # Add en passant square, if it can be captured
+        file = self.en_passant_file(self.board, self.color, self.en_passant)
+        if file is not None:
+            result ^= keys.en_passant[file]
+
+        # Return result
+        return result
+
+
+    def update_zobrist_hash(
+            self,
+            board      : np.ndarray,
+            color      : str,
+            castling   : str,
+            en_passant : str,
+        ) -> int:
+        """Compute the Zobrist hash of the current position from the hash of
+            the previous position, only considering what changed.
+
+            Parameters
+            ----------
+            board : np.ndarray of shape=(n_ranks, n_files)
+                Pieces of previous position.
+
+            color : str
+                Color to move in previous position.
+
+            castling : str
+                Castling rights of previous position.
+
+            en_passant : str
+                En passant square of previous position.
+
+            Returns
+            -------
+            hash : int
+                64-bit hash of the current position.
+            """
+        # Get keys for board size
+        keys = zobrist.get(self.n_ranks, self.n_files)
+
+        # Get hash of previous position
+        result = self.hashes[-1]
+
+        # Replace pieces on changed squares
+        for rank, file in zip(*np.nonzero(board != self.board)):
+            if board[rank, file] is not None:
+                result ^= keys.pieces[board[rank, file].index][rank][file]
+            if self.board[rank, file] is not None:
+                result ^= keys.pieces[self.board[rank, file].index][rank][file]
+
+        # Replace color to move
+        if color != self.color:
+            result ^= keys.color
+
+        # Replace changed castling rights
+        for right in set(castling) ^ set(self.castling):
+            result ^= keys.castling.get(right, 0)
+
+        # Replace en passant square, if it can be captured
+        for file in (
+                self.en_passant_file(board, color, en_passant),
+                self.en_passant_file(self.board, self.color, self.en_passant),
+            ):
+            if file is not None:
+                result ^= keys.en_passant[file]
+
+        # Return result
+        return result
+
+
+    def en_passant_file(
+            self,
+            board      : np.ndarray,
+            color      : str,
+            en_passant : str,
+        ) -> Optional[int]:
+        """Return the file of the en passant square if a pawn of the color to
+            move can capture on it, such that positions that only differ in an
+            en passant square that can not be captured have the same hash.
+
+            Parameters
+            ----------
+            board : np.ndarray of shape=(n_ranks, n_files)
+                Pieces of position.
+
+            color : str
+                Color to move in position.
+
+            en_passant : str
+                En passant square of position.
+
+            Returns
+            -------
+            file : Optional[int]
+                File of en passant square, None if no pawn can capture on it.
+            """
+        # Get en passant square
+        square = self.square2internal(en_passant)
+        if square is None:
+            return None
+
+        # Get rank of pawns that could capture, white pawns move up the board
+        rank = square[0] + 1 if color == pieces.Color.WHITE.value else square[0] - 1
+        if not 0 <= rank < self.n_ranks:
+            return None
+
+        # Check for a pawn of the color to move next to the en passant file
+        for file in (square[1] - 1, square[1] + 1):
+            if 0 <= file < self.n_files:
+                piece = board[rank, file]
+                if isinstance(piece, pieces.Pawn) and piece.color.value == color:
+                    return square[1]
+
+        # En passant square can not be captured
+        return None
+
+    ########################################################################
+    #                            Draw detection                            #
+    ########################################################################
+
+    def is_repetition(self, count: int = 3) -> bool:
+        """Check whether the current position occurred a number of times.
+
+            Only positions since the last capture or pawn move are checked, as
+            earlier positions can never occur again.
+
+            Parameters
+            ----------
+            count : int, default=3
+                Number of occurrences, including the current position.
+
+            Returns
+            -------
+            is_repetition : bool
+                True if the current position occurred at least count times.
+            """
+        # Get positions since last irreversible move
+        positions = self.hashes[max(0, len(self.hashes) - 1 - self.halfmove):]
+
+        # Count positions with the same color to move
+        return positions[::-2].count(positions[-1]) >= count
+
+
+    def is_fifty_moves(self) -> bool:
+        """Check whether fifty moves were made without capture or pawn move."""
+        return self.halfmove >= 100
+
+
+    def result(self) -> Optional[str]:
+        """Adjudicate the game in the current position.
+
+            Returns
+            -------
+            result : Optional[str] ('1-0'|'0-1'|'1/2-1/2')
+                Result of game, None if the game is not over.
+            """
+        # Check for checkmate and stalemate
+        if not self.legal_moves():
+            color = pieces.Color(self.color)
+            if not self.is_in_check(color):
+                return '1/2-1/2'
+            elif color == pieces.Color.WHITE:
+                return '0-1'
+            else:
+                return '1-0'
+
+        # Check for draws
+        if self.is_repetition() or self.is_fifty_moves():
+            return '1/2-1/2'
+
+        # Game is not over
+        return None
+
     ########################################################################
     #                             Piece masks                              #
     ########################################################################
@@ -655,67 +2003,218 @@ class Board(object):
     #                             I/O methods                              #
     ########################################################################
 
+    def copy(self) -> 'Board':
+        """Return a copy of the board that can be modified independently."""
+        # Copy all attributes
+        result = copy.copy(self)
+        # Copy mutable attributes
+        result.board  = self.board.copy()
+        result.stack  = list(self.stack)
+        result.hashes = list(self.hashes)
+        result.move_cache = dict(self.move_cache)
+        # Return result
+        return result
+
+    def snapshot(self) -> Snapshot:
+        """Return the immutable state of the board.
+
+            The snapshot stores pieces as a bitboard per piece index and the
+            hashes of positions since the last irreversible move, such that
+            repetitions are still detected after Board.from_snapshot(). The
+            history of moves, required for Board.pop(), is not stored.
+
+            Returns
+            -------
+            snapshot : Snapshot
+                Immutable state of board.
+            """
+        return Snapshot(
+            n_ranks    = self.n_ranks,
+            n_files    = self.n_files,
+            pieces     = encode_pieces(self.board),
+            color      = self.color,
+            castling   = self.castling,
+            en_passant = self.en_passant,
+            halfmove   = self.halfmove,
+            fullmove   = self.fullmove,
+            hashes     = tuple(self.hashes[-1-self.halfmove:]),
+        )
+
+    @classmethod
+    def from_snapshot(cls, state: Snapshot) -> 'Board':
+        """Create a board from a snapshot, see Board.snapshot().
+
+            The array of pieces is decoded once per snapshot and shared by
+            all boards created from it, it is only copied when a board makes
+            a move, so branching from a snapshot takes constant time.
+
+            Parameters
+            ----------
+            state : Snapshot
+                Snapshot to create board from.
+
+            Returns
+            -------
+            board : Board
+                Board in the position of the snapshot.
+            """
+        # Create board without initialising an empty position
+        board = cls.__new__(cls)
+
+        # Set state
+        board.n_ranks    = state.n_ranks
+        board.n_files    = state.n_files
+        board.board      = decode_pieces(state.n_ranks, state.n_files, state.pieces)
+        board.color      = state.color
+        board.castling   = state.castling
+        board.en_passant = state.en_passant
+        board.halfmove   = state.halfmove
+        board.fullmove   = state.fullmove
+        board.stack      = list()
+        board.hashes     = list(state.hashes)
+
+        # Attack maps and legal moves are computed when needed
+        board.attack_cache = None
+        board.move_cache   = dict()
+
+        # Return result
+        return board
+
     @classmethod
     def from_fen(cls, fen):
-        """"""
-        # Parse FEN
-        position, color, castling, en_passant, halfmove, fullmove = fen.split()
+        """Create a board from its FEN notation.
+
+            Parameters
+            ----------
+            fen : str
+                FEN notation of position. Boards of other sizes than 8x8 are
+                supported, empty squares may be counted with multiple digits,
+                e.g., '10' for an empty rank of a 10 file board.
+
+            Returns
+            -------
+            board : Board
+                Board in the given position.
 
-        # Parse position
+            Raises
+            ------
+            ValueError
+                If the FEN notation is malformed.
+            """
+        # Parse FEN
+        fields = fen.split()
+        if len(fields) != 6:
+            raise ValueError(f"invalid fen: expected 6 fields, got {len(fields)}")
+        position, color, castling, en_passant, halfmove, fullmove = fields
+
+        # Check state
+        if color not in ('w', 'b'):
+            raise ValueError(f"invalid fen: unknown color '{color}'")
+        if castling != '-' and not set(castling) <= set('KQkq'):
+            raise ValueError(f"invalid fen: invalid castling rights '{castling}'")
+        if en_passant != '-' and not re.fullmatch(r"[a-z]\d+", en_passant):
+            raise ValueError(f"invalid fen: invalid en passant square '{en_passant}'")
+        if not (halfmove.isdigit() and fullmove.isdigit()):
+            raise ValueError(f"invalid fen: invalid move counters '{halfmove} {fullmove}'")
+
+        # Parse position as symbols, None for empty squares
         setup = list()
         # Loop over all ranks in FEN
         for rank in position.split('/'):
             # Start new rank
             setup.append(list())
+            empty = ''
 
-            # Loop over each individual piece
-            for piece in rank:
-                # Get color from piece
-                if piece.islower():
-                    piece_color = pieces.Color.BLACK
-                else:
-                    piece_color = pieces.Color.WHITE
-
-                # Set specific piece
-                if piece.lower() == 'p':
-                    setup[-1].append(pieces.Pawn(piece_color))
-                elif piece.lower() == 'n':
-                    setup[-1].append(pieces.Knight(piece_color))
-                elif piece.lower() == 'b':
-                    setup[-1].append(pieces.Bishop(piece_color))
-                elif piece.lower() == 'r':
-                    setup[-1].append(pieces.Rook(piece_color))
-                elif piece.lower() == 'q':
-                    setup[-1].append(pieces.Queen(piece_color))
-                elif piece.lower() == 'k':
-                    setup[-1].append(pieces.King(piece_color))
-                else:
-                    for _ in range(int(piece)):
-                        setup[-1].append(None)
+            # Loop over each individual character
+            for symbol in rank + '/':
+                # Collect digits of number of empty squares
+                if symbol.isdigit():
+                    empty += symbol
+                    continue
 
-        # Setup board as numpy array
-        setup = np.asarray(setup, dtype=object)
+                # Add empty squares
+                setup[-1].extend([None] * int(empty or 0))
+                empty = ''
+
+                # Add piece
+                if symbol != '/':
+                    setup[-1].append(symbol)
 
         # Ensure we have 2 dimensions
-        assert setup.ndim == 2, "FEN notation differed per rank."
+        if len(set(map(len, setup))) != 1 or not setup[0]:
+            raise ValueError("invalid fen: number of squares differs per rank")
 
         # Create board
         board = cls(
-            n_files = setup.shape[0],
-            n_ranks = setup.shape[1],
+            n_ranks = len(setup),
+            n_files = len(setup[0]),
         )
 
-        # Setup board
-        board.board      = setup
+        # Create pieces
+        types = {
+            'p': pieces.Pawn, 'n': pieces.Knight, 'b': pieces.Bishop,
+            'r': pieces.Rook, 'q': pieces.Queen , 'k': pieces.King  ,
+        }
+        for rank, row in enumerate(setup):
+            for file, symbol in enumerate(row):
+                if symbol is not None:
+                    if symbol.lower() not in types:
+                        raise ValueError(f"invalid fen: unknown piece '{symbol}'")
+                    board.board[rank, file] = types[symbol.lower()](
+                        pieces.Color.BLACK if symbol.islower() else pieces.Color.WHITE,
+                        n_files = board.n_files,
+                        n_ranks = board.n_ranks,
+                    )
+
+        # Setup state
         board.color      = color
         board.castling   = castling
         board.en_passant = en_passant
         board.halfmove   = int(halfmove)
         board.fullmove   = int(fullmove)
+        board.hashes     = [board.compute_zobrist_hash()]
 
         # Return result
         return board
 
+    def to_fen(self) -> str:
+        """Return the FEN notation of the current position.
+
+            Returns
+            -------
+            fen : str
+                FEN notation of board, can be read using Board.from_fen().
+            """
+        # Initialise ranks
+        ranks = list()
+
+        # Loop over all ranks
+        for row in self.board:
+            # Initialise rank
+            rank  = ''
+            empty = 0
+
+            # Loop over all squares, counting consecutive empty squares
+            for square in row:
+                if square is None:
+                    empty += 1
+                else:
+                    rank += (str(empty) if empty else '') + str(square)
+                    empty = 0
+
+            # Add rank
+            ranks.append(rank + (str(empty) if empty else ''))
+
+        # Return result
+        return ' '.join([
+            '/'.join(ranks),
+            self.color,
+            self.castling or '-',
+            self.en_passant,
+            str(self.halfmove),
+            str(self.fullmove),
+        ])
+
 
 
 ################################################################################
@@ -726,38 +2225,24 @@ class Board(object):
         """"""
         return self.string()
 
-    def string(self, moves=None):
-        # Setup board top
-        result  = "╔" + "═══╤"*(self.n_files-1) + "═══╗\n"
+    def string(self, moves=None, unicode=False):
+        """Render board as text.
 
-        # Setup board rows
-        for index_rank, row in enumerate(self.board):
-            result += "║"
-
-            for index_file, square in enumerate(row):
-                if square:
-                    square = str(square)
-                else:
-                    square = ''
-
-                if moves is not None and moves[index_rank, index_file]:
-                    if square:
-                        square = '[' + square + ']'
-                    else:
-                        square = '.'
+            Parameters
+            ----------
+            moves : Optional[np.ndarray]
+                If given, boolean mask of squares to highlight, e.g., the
+                destination squares of a piece.
 
-                result += "{:^3}".format(square)
+            unicode : bool, default=False
+                If True, draw pieces using their Unicode symbols.
 
-                if index_file == self.n_files-1 and index_rank != self.n_ranks-1:
-                    result += "║\n╟" + "───┼"*(self.n_files-1) + "───╢\n"
-                elif index_file == self.n_files-1 and index_rank == self.n_ranks-1:
-                    # Setup board bottom
-                    result += "║\n╚" + "═══╧"*(self.n_files-1) + "═══╝"
-                else:
-                    result += '│'
-
-        # Return result
-        return result
+            Returns
+            -------
+            result : str
+                Rendered board.
+            """
+        return render.get(self.n_ranks, self.n_files, unicode).render(self, moves)
 
 if __name__ == "__main__":
 
@@ -769,7 +2254,7 @@ if __name__ == "__main__":
     ))
     exit()
 
-    from utils import print_boards_grid
+    from .utils import print_boards_grid
 
     from time import time
     start = time()
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Optional
+
+# Directory containing the sources of the engine
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+def engine_version() -> str:
+    """Return the version of the engine as a hash of its move generation
+        sources, such that cached results are invalidated by any change."""
+    # Initialise hash
+    result = hashlib.sha1()
+
+    # Hash board, move and piece sources in a fixed order
+    for path in sorted(
+            [os.path.join(DIRECTORY, 'board.py'), os.path.join(DIRECTORY, 'move.py')] +
+            [os.path.join(DIRECTORY, 'pieces', file)
+             for file in os.listdir(os.path.join(DIRECTORY, 'pieces'))
+             if file.endswith('.py')]
+        ):
+        with open(path, 'rb') as infile:
+            result.update(infile.read())
+
+    # Return result
+    return result.hexdigest()[:16]
+
+def default_path() -> str:
+    """Return the default path of the cache in the user cache directory."""
+    return os.path.join(
+        os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+        'chess', 'nodes.sqlite',
+    )
+
+class NodeCache(object):
+
+    def __init__(
+            self,
+            path        : Optional[str] = None,
+            max_entries : int = 1_000_000,
+            version     : Optional[str] = None,
+        ):
+        """Persistent cache of node counts stored in SQLite.
+
+            Results are keyed by (position hash, depth, engine version), so
+            repeated runs on unchanged positions cost a single lookup. When
+            the cache holds more than max_entries results, the least recently
+            used results are evicted.
+
+            Parameters
+            ----------
+            path : Optional[str]
+                Path of SQLite database, defaults to default_path().
+
+            max_entries : int, default=1_000_000
+                Maximum number of results to keep.
+
+            version : Optional[str]
+                Version of engine, defaults to a hash of the engine sources.
+            """
+        # Initialise variables
+        self.path        = path or default_path()
+        self.max_entries = max_entries
+        self.version     = version or engine_version()
+
+        # Number of results stored since the last eviction
+        self.stored      = 0
+
+        # Open database
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                hash    INTEGER NOT NULL,
+                depth   INTEGER NOT NULL,
+                version TEXT    NOT NULL,
+                nodes   INTEGER NOT NULL,
+                used    REAL    NOT NULL,
+                PRIMARY KEY (hash, depth, version)
+            )
+        """)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS nodes_used ON nodes (used)"
+        )
+
+    ########################################################################
+    #                          Get/set methods                             #
+    ########################################################################
+
+    def get(self, key: int, depth: int) -> Optional[int]:
+        """Get the cached node count of a position hash at a depth, if any."""
+        # Get cached result
+        row = self.connection.execute(
+            "SELECT nodes FROM nodes WHERE hash=? AND depth=? AND version=?",
+            (self.signed(key), depth, self.version),
+        ).fetchone()
+
+        # Mark result as recently used
+        if row is not None:
+            with self.connection:
+                self.connection.execute(
+                    "UPDATE nodes SET used=? WHERE hash=? AND depth=? AND version=?",
+                    (time.time(), self.signed(key), depth, self.version),
+                )
+            return row[0]
+
+        # Return miss
+        return None
+
+    def set(self, key: int, depth: int, nodes: int) -> None:
+        """Store the node count of a position hash at a depth."""
+        # Store result
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO nodes VALUES (?, ?, ?, ?, ?)",
+                (self.signed(key), depth, self.version, nodes, time.time()),
+            )
+
+        # Evict results once in a while, as eviction scans the cache
+        self.stored += 1
+        if self.stored >= 1000:
+            self.evict()
+
+    def evict(self) -> None:
+        """Evict least recently used results exceeding the maximum size."""
+        with self.connection:
+            self.connection.execute("""
+                DELETE FROM nodes WHERE rowid IN (
+                    SELECT rowid FROM nodes ORDER BY used DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+        self.stored = 0
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self.connection:
+            self.connection.execute("DELETE FROM nodes")
+
+    def close(self) -> None:
+        """Evict results exceeding the maximum size and close the database."""
+        self.evict()
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    ########################################################################
+    #                          Auxiliary methods                           #
+    ########################################################################
+
+    def signed(self, key: int) -> int:
+        """Convert a 64-bit hash to a signed integer, as stored by SQLite."""
+        return key - (1 << 64) if key >= (1 << 63) else key
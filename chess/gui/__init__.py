@@ -0,0 +1,24 @@
+import importlib
+
+# Module of each attribute of the package, pygame is only imported on first
+# use of an attribute, such that importing the package itself is cheap
+ATTRIBUTES = {
+    'GUI'     : 'gui',
+    'GridGUI' : 'grid',
+}
+
+__all__ = list(ATTRIBUTES)
+
+def __getattr__(name):
+    """Import attribute of package on first use."""
+    # Check if attribute exists
+    if name not in ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import attribute and store it, such that it is only imported once
+    value = getattr(importlib.import_module(f".{ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
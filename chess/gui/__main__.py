@@ -1,15 +1,46 @@
-from gui import GUI
-
-import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-from board import Board
+import argparse
+import random
+from ..board import Board
 
 if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Chess GUI")
+    parser.add_argument('--engine', choices=['w', 'b'], help="color played by engine")
+    parser.add_argument('--depth' , type=int, default=3, help="search depth of engine")
+    parser.add_argument('--grid'  , type=int, help="show given number of engine-vs-engine games")
+    args = parser.parse_args()
+
+    # Starting position
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+    # Create grid of engine-vs-engine games, pygame is only imported here
+    # such that parsing arguments stays fast
+    if args.grid:
+        from .grid import GridGUI
+        boards = list()
+        for seed in range(args.grid):
+            # Play two random moves such that games differ
+            board  = Board.from_fen(fen)
+            rng    = random.Random(seed)
+            for _ in range(2):
+                board.push(rng.choice(board.legal_moves()))
+            boards.append(board)
+
+        # Create new grid GUI
+        gui = GridGUI(
+            boards = boards,
+            engine = True,
+            depth  = args.depth,
+        )
+
     # Create new GUI
-    gui = GUI(
-        board = Board.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
-    )
+    else:
+        from .gui import GUI
+        gui = GUI(
+            board  = Board.from_fen(fen),
+            engine = args.engine,
+            depth  = args.depth,
+        )
 
     # Run GUI
     gui.run()
@@ -0,0 +1,186 @@
+import io
+import os
+import re
+import pygame
+
+class Atlas(object):
+
+    # Symbols of all pieces, in the order in which they are packed
+    symbols = 'KQRBNPkqrbnp'
+
+    def __init__(self, directory, cache=None):
+        """Piece images packed into a single surface, scaled once per size.
+
+            Images are rendered from the SVG sources at the requested size if
+            pygame supports SVG, otherwise the PNG sources are decoded once and
+            scaled down. Scaled atlases are kept in memory for every size and,
+            if a cache directory is given, stored on disk as well.
+
+            Parameters
+            ----------
+            directory : str
+                Directory containing {symbol}.svg and/or {symbol}.png images.
+
+            cache : Optional[str]
+                If given, directory in which to store scaled atlases on disk.
+            """
+        # Initialise variables
+        self.directory = directory
+        self.cache     = cache
+
+        # Decoded PNG sources, only loaded when SVG rendering is unavailable
+        self.sources = None
+
+        # Scaled atlases and their sprites per (width, height) of a square
+        self.atlases = dict()
+        self.sprites = dict()
+
+    ########################################################################
+    #                             Get sprites                              #
+    ########################################################################
+
+    def get(self, width, height):
+        """Get images of all pieces for a given square size.
+
+            Parameters
+            ----------
+            width : int
+                Width of a square in pixels.
+
+            height : int
+                Height of a square in pixels.
+
+            Returns
+            -------
+            images : Dict[str, pygame.Surface]
+                Image of each piece indexed by its symbol, e.g. 'K' or 'k'.
+                Images are subsurfaces sharing the pixels of a single atlas.
+            """
+        # Use squares of at least a single pixel
+        size = (max(1, round(width)), max(1, round(height)))
+
+        # Create atlas on first use of size
+        if size not in self.sprites:
+            # Load or create atlas
+            atlas = self.load(*size)
+            if atlas is None:
+                atlas = self.create(*size)
+                self.save(atlas, *size)
+
+            # Split atlas into sprites
+            self.atlases[size] = atlas
+            self.sprites[size] = {
+                symbol: atlas.subsurface((index * size[0], 0, *size))
+                for index, symbol in enumerate(self.symbols)
+            }
+
+        # Return sprites
+        return self.sprites[size]
+
+    ########################################################################
+    #                            Create atlas                              #
+    ########################################################################
+
+    def create(self, width, height):
+        """Create an atlas with all pieces side by side for a square size."""
+        # Initialise atlas
+        atlas = pygame.Surface(
+            (width * len(self.symbols), height),
+            pygame.SRCALPHA,
+        )
+
+        # Draw each piece on its own part of the atlas
+        for index, symbol in enumerate(self.symbols):
+            atlas.blit(self.render(symbol, width, height), (index * width, 0))
+
+        # Return atlas in display format
+        return atlas.convert_alpha()
+
+    def render(self, symbol, width, height):
+        """Render a single piece at the given size."""
+        # Render SVG source directly at the requested size
+        path = os.path.join(self.directory, f"{symbol}.svg")
+        if self.sources is None and os.path.isfile(path):
+            try:
+                return self.render_svg(path, width, height)
+            except pygame.error:
+                # SVG is not supported, fall back to PNG sources
+                pass
+
+        # Decode PNG sources once
+        if self.sources is None:
+            self.sources = dict()
+            for source in self.symbols:
+                path = os.path.join(self.directory, f"{source}.png")
+                self.sources[source] = pygame.image.load(path)
+
+        # Scale PNG source
+        return pygame.transform.smoothscale(
+            self.sources[symbol].convert_alpha(),
+            (width, height),
+        )
+
+    def render_svg(self, path, width, height):
+        """Render an SVG image at a given size, raises pygame.error if SVG
+            images are not supported."""
+        # Read SVG
+        with open(path, 'rb') as infile:
+            data = infile.read()
+
+        # Get root element
+        root = re.search(rb'<svg\b[^>]*>', data).group(0)
+        new  = root
+
+        # Use original size as view box such that the drawing is scaled
+        if b'viewBox' not in root:
+            new = new.replace(b'<svg', b'<svg viewBox="0 0 %s %s"' % (
+                re.search(rb'\swidth="([\d.]+)', root).group(1),
+                re.search(rb'\sheight="([\d.]+)', root).group(1),
+            ), 1)
+
+        # Set requested size
+        new = re.sub(rb'\swidth="[^"]*"' , b' width="%d"'  % width , new, 1)
+        new = re.sub(rb'\sheight="[^"]*"', b' height="%d"' % height, new, 1)
+
+        # Render image
+        return pygame.image.load(
+            io.BytesIO(data.replace(root, new, 1)),
+            os.path.basename(path),
+        )
+
+    ########################################################################
+    #                              Disk cache                              #
+    ########################################################################
+
+    def path(self, width, height):
+        """Return path of cached atlas on disk."""
+        return os.path.join(self.cache, f"atlas_{width}x{height}.png")
+
+    def load(self, width, height):
+        """Load atlas from disk cache if it is newer than all sources.
+
+            Returns
+            -------
+            atlas : Optional[pygame.Surface]
+                Cached atlas, None if no up-to-date atlas was cached.
+            """
+        # Check if a cached atlas exists
+        if self.cache is None or not os.path.isfile(self.path(width, height)):
+            return None
+
+        # Check if cached atlas is up to date
+        modified = max(
+            os.path.getmtime(os.path.join(self.directory, file))
+            for file in os.listdir(self.directory)
+        )
+        if os.path.getmtime(self.path(width, height)) < modified:
+            return None
+
+        # Load atlas
+        return pygame.image.load(self.path(width, height)).convert_alpha()
+
+    def save(self, atlas, width, height):
+        """Store atlas in disk cache, if any."""
+        if self.cache is not None:
+            os.makedirs(self.cache, exist_ok=True)
+            pygame.image.save(atlas, self.path(width, height))
@@ -0,0 +1,50 @@
+import queue
+import threading
+from ..search import Search
+
+class Engine(threading.Thread):
+
+    def __init__(self, board, depth=3):
+        """Search a board in a background thread.
+
+            Progress of the search is put on self.queue as dictionaries
+            containing the 'depth', 'score', 'pv' and 'nodes' of every completed
+            iteration. When the search is done, a dictionary containing the
+            'bestmove' is put on the queue.
+
+            Parameters
+            ----------
+            board : Board
+                Board to search, the engine searches a copy of the board such
+                that the original board can still be used while searching.
+
+            depth : int, default=3
+                Maximum depth in plies to search.
+            """
+        # Initialise thread, do not keep the program alive for a search
+        super().__init__(daemon=True)
+
+        # Initialise variables
+        self.board   = board.copy()
+        self.depth   = depth
+        self.queue   = queue.Queue()
+        self.stopped = threading.Event()
+
+    def run(self):
+        """Search board and put the results on the queue."""
+        # Create search streaming its progress to the queue
+        search = Search(
+            board    = self.board,
+            callback = self.queue.put,
+            stop     = self.stopped,
+        )
+
+        # Perform search
+        move, score = search.run(self.depth)
+
+        # Put result on the queue
+        self.queue.put({'bestmove': move, 'score': score})
+
+    def abort(self):
+        """Abort the search, the best move found so far is still returned."""
+        self.stopped.set()
@@ -0,0 +1,277 @@
+import math
+import queue
+import numpy as np
+import pygame
+from .engine import Engine
+from .gui    import GUI
+
+class GridGUI(GUI):
+
+    def __init__(self,
+            boards,
+            columns = None,
+            title   = "Chess",
+            fps     = 30,
+            width   = 1280,
+            height  = 720,
+            margin  = 4,
+            style   = {
+                "square": {
+                    "light": [255, 228, 196],
+                    "dark" : [205, 133,  63],
+                }
+            },
+            engine  = False,
+            depth   = 1,
+            workers = 2,
+            cache   = None,
+        ):
+        """Show many boards in a single window as a grid of thumbnails.
+
+            Parameters
+            ----------
+            boards : List[Board]
+                Boards to show, boards may be changed while they are shown.
+                Only boards whose position changed are drawn again.
+
+            columns : Optional[int]
+                Number of boards per row. If None, boards are laid out in a
+                square grid.
+
+            margin : int, default=4
+                Space in pixels between boards.
+
+            engine : bool, default=False
+                If True, the engine plays both colors on every board.
+
+            depth : int, default=1
+                Maximum depth in plies the engine searches.
+
+            workers : int, default=2
+                Maximum number of boards the engine searches at the same time.
+                Searches share the interpreter with the GUI, so more workers
+                lower the frame rate without searching faster.
+
+            cache : Optional[str]
+                If given, directory in which scaled piece images are cached.
+            """
+        # Initialise single board GUI using the first board
+        super().__init__(
+            board  = boards[0],
+            title  = title,
+            fps    = fps,
+            width  = width,
+            height = height,
+            style  = style,
+            depth  = depth,
+            cache  = cache,
+        )
+
+        # Setup grid variables
+        self.boards  = boards
+        self.margin  = margin
+        self.columns = columns or math.ceil(math.sqrt(len(boards)))
+        self.rows    = math.ceil(len(boards) / self.columns)
+        self.layout()
+
+        # Setup engine for both colors of each board
+        self.engine   = engine
+        self.workers  = workers
+        self.thinkers = [None for _ in boards]
+        self.searched = [None for _ in boards]
+
+    def layout(self):
+        """Compute thumbnail size for the current window size."""
+        # Setup thumbnail size, all boards share the same square size
+        self.size = min(
+            self.width  // self.columns,
+            self.height // self.rows,
+        ) - self.margin
+        self.square_width = self.square_height = max(1, self.size // max(
+            max(board.n_files for board in self.boards),
+            max(board.n_ranks for board in self.boards),
+        ))
+
+        # Forget drawn positions such that all boards are drawn again
+        self.rendered = [None for _ in self.boards]
+
+    def resize(self, width, height):
+        """Resize the window and the boards drawn in it."""
+        # Set new size
+        self.width  = width
+        self.height = height
+        self.layout()
+
+        # Resize and clear display
+        self.display = pygame.display.set_mode(
+            (self.width, self.height),
+            pygame.RESIZABLE,
+        )
+        self.display.fill((0, 0, 0))
+        pygame.display.update()
+
+        # Get images for new size, these are scaled only once per size
+        self.images = self.atlas.get(self.square_width, self.square_height)
+
+    ########################################################################
+    #                             Loop method                              #
+    ########################################################################
+
+    def loop(self):
+        # Clear display
+        self.display.fill((0, 0, 0))
+        pygame.display.update()
+
+        while self.running:
+            # Draw boards whose position changed
+            rects = self.draw_boards()
+
+            # Update only the changed parts of the display
+            if rects:
+                pygame.display.update(rects)
+            self.clock.tick(self.fps)
+
+            # Handle any events
+            self.handle_events()
+            # Handle engine progress
+            self.handle_engine()
+
+        # Stop engines when closing
+        for thinker in self.thinkers:
+            if thinker is not None:
+                thinker.abort()
+
+    ########################################################################
+    #                      Auxiliary drawing methods                       #
+    ########################################################################
+
+    def draw_boards(self):
+        """Draw all boards whose position changed since they were last drawn.
+
+            Returns
+            -------
+            rects : List[pygame.Rect]
+                Areas of the display that were drawn.
+            """
+        # Initialise result
+        result = list()
+
+        # Loop over all boards
+        for index, board in enumerate(self.boards):
+            # Skip boards whose position did not change
+            if (
+                    self.rendered[index] is not None and
+                    np.array_equal(self.rendered[index], board.board)
+                ):
+                continue
+
+            # Remember drawn position
+            self.rendered[index] = board.board.copy()
+
+            # Get top left corner of board
+            x = (index % self.columns) * (self.size + self.margin)
+            y = (index // self.columns) * (self.size + self.margin)
+
+            # Draw board and pieces
+            result.append(self.draw_thumbnail(board, x, y))
+
+        # Return result
+        return result
+
+    def draw_thumbnail(self, board, x, y):
+        """Draw a single board with its top left corner at (x, y).
+
+            Returns
+            -------
+            rect : pygame.Rect
+                Area of the display that was drawn.
+            """
+        # Loop over all ranks
+        for rank in range(board.n_ranks):
+            # Loop over all files
+            for file in range(board.n_files):
+                # Get area of square
+                rect = (
+                    x + file * self.square_width,
+                    y + rank * self.square_height,
+                    self.square_width,
+                    self.square_height,
+                )
+
+                # Draw square
+                pygame.draw.rect(
+                    surface = self.display,
+                    color   = self.colors[(rank + file) % 2],
+                    rect    = rect,
+                )
+
+                # Draw piece, if any
+                piece = board.board[rank, file]
+                if piece:
+                    self.display.blit(self.images[str(piece)], rect)
+
+        # Return drawn area
+        return pygame.Rect(
+            x,
+            y,
+            board.n_files * self.square_width,
+            board.n_ranks * self.square_height,
+        )
+
+    ########################################################################
+    #                          Auxiliary methods                           #
+    ########################################################################
+
+    def handle_engine(self):
+        """Let the engine play both colors of all boards in the background."""
+        # Check if engine should play
+        if not self.engine:
+            return
+
+        # Start engine on boards with fewest moves first, once per position
+        for index in sorted(
+                range(len(self.boards)),
+                key = lambda index: len(self.boards[index].stack),
+            ):
+            # Limit number of simultaneous searches
+            if sum(thinker is not None for thinker in self.thinkers) >= self.workers:
+                break
+
+            # Start engine, unless the game is over
+            board = self.boards[index]
+            if (
+                    self.thinkers[index] is None and
+                    self.searched[index] != len(board.stack)
+                ):
+                self.searched[index] = len(board.stack)
+                if board.result() is None:
+                    self.thinkers[index] = Engine(board, depth=self.depth)
+                    self.thinkers[index].start()
+
+        # Loop over all boards
+        for index, board in enumerate(self.boards):
+            # Process all progress of the engine
+            while self.thinkers[index] is not None:
+                try:
+                    info = self.thinkers[index].queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                # Perform best move once the engine finished
+                if 'bestmove' in info:
+                    self.thinkers[index] = None
+                    if info['bestmove'] is not None:
+                        board.push(info['bestmove'])
+
+    def handle_events(self):
+        """Handle pygame events."""
+        # Loop over all events
+        for event in pygame.event.get():
+            # Exit event
+            if event.type == pygame.QUIT:
+                # Set running to False
+                self.running = False
+
+            # Resize event
+            if event.type == pygame.VIDEORESIZE:
+                self.resize(event.w, event.h)
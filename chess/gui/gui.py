@@ -1,6 +1,9 @@
 import os
 import io
+import queue
 import pygame
+from .atlas  import Atlas
+from .engine import Engine
 
 class GUI(object):
 
@@ -15,7 +18,10 @@ class GUI(object):
                     "light": [255, 228, 196],
                     "dark" : [205, 133,  63],
                 }
-            }
+            },
+            engine = None,
+            depth  = 3,
+            cache  = None,
         ):
 
         # Initialise variables
@@ -23,6 +29,7 @@ class GUI(object):
         self.height = height
         self.width  = width
         self.fps    = fps
+        self.cache  = cache
 
         # Setup color schemes
         self.square_light = style.get('square',{}).get('light', [255, 228, 196])
@@ -38,6 +45,12 @@ class GUI(object):
         self.overlay      = None
         self.last_clicked = (None, None)
 
+        # Setup engine opponent, engine is the color ('w'|'b') it plays
+        self.engine       = engine
+        self.depth        = depth
+        self.thinker      = None
+        self.searched     = None
+
         # Set running to false
         self.running = True
 
@@ -62,7 +75,10 @@ class GUI(object):
         pygame.init()
 
         # Setup display
-        self.display = pygame.display.set_mode((self.width, self.height))
+        self.display = pygame.display.set_mode(
+            (self.width, self.height),
+            pygame.RESIZABLE,
+        )
 
         # Set Title
         pygame.display.set_caption(self.title)
@@ -70,36 +86,30 @@ class GUI(object):
         # Set FPS
         self.clock = pygame.time.Clock()
 
-        # Load images
-        self.images = self.load_images(
-            os.path.join(os.path.dirname(__file__), 'img')
+        # Load images, scaled images are shared by all boards and sizes
+        self.atlas  = Atlas(
+            directory = os.path.join(os.path.dirname(__file__), 'img'),
+            cache     = self.cache,
         )
+        self.images = self.atlas.get(self.square_width, self.square_height)
 
-    def load_images(self, directory):
-        """Load all images from a directory"""
-        # Initialise result
-        result = dict()
-
-        # Loop over all files in directory
-        for file in os.listdir(directory):
-            # Get path to file
-            path = os.path.join(directory, file)
-
-            # Parse PNG extension
-            if file.lower().endswith('.png'):
-                with open(path) as infile:
-                    # Load image
-                    image = pygame.image.load(infile).convert_alpha()
-                    # Scale image
-                    image = pygame.transform.scale(
-                        image,
-                        (round(self.square_width), round(self.square_height))
-                    )
-                    # Store image
-                    result[file] = image
+    def resize(self, width, height):
+        """Resize the window and the board drawn in it."""
+        # Set new size
+        self.width  = width
+        self.height = height
+
+        self.square_width  = self.width  / self.board.n_ranks
+        self.square_height = self.height / self.board.n_files
+
+        # Resize display
+        self.display = pygame.display.set_mode(
+            (self.width, self.height),
+            pygame.RESIZABLE,
+        )
 
-        # Return result
-        return result
+        # Get images for new size, these are scaled only once per size
+        self.images = self.atlas.get(self.square_width, self.square_height)
 
     ########################################################################
     #                             Loop method                              #
@@ -120,6 +130,12 @@ class GUI(object):
 
             # Handle any events
             self.handle_events()
+            # Handle engine progress
+            self.handle_engine()
+
+        # Stop engine when closing
+        if self.thinker is not None:
+            self.thinker.abort()
 
     ########################################################################
     #                      Auxiliary drawing methods                       #
@@ -155,7 +171,7 @@ class GUI(object):
                 # Check if there is a piece on the board
                 if piece:
                     # If so, get corresponding image
-                    image = self.images[f"{str(piece)}.png"]
+                    image = self.images[str(piece)]
                     # Display image
                     self.display.blit(
                         image, (
@@ -189,6 +205,56 @@ class GUI(object):
     #                          Auxiliary methods                           #
     ########################################################################
 
+    def handle_engine(self):
+        """Start the engine on its turn and process its progress.
+
+            The engine searches in a background thread, this method only polls
+            its queue such that the GUI keeps rendering while it is thinking.
+            """
+        # Check if we are playing against an engine
+        if self.engine is None:
+            return
+
+        # Adjudicate game and start engine on its turn, once for every position
+        if (
+                self.thinker is None and
+                self.searched != len(self.board.stack)
+            ):
+            self.searched = len(self.board.stack)
+
+            # Show result if game is over
+            result = self.board.result()
+            if result is not None:
+                pygame.display.set_caption(f"{self.title} - {result}")
+
+            # Otherwise start engine on its turn
+            elif self.board.color == self.engine:
+                self.thinker = Engine(self.board, depth=self.depth)
+                self.thinker.start()
+
+        # Process all progress of the engine
+        while self.thinker is not None:
+            try:
+                info = self.thinker.queue.get_nowait()
+            except queue.Empty:
+                break
+
+            # Perform best move once the engine finished
+            if 'bestmove' in info:
+                self.thinker = None
+                pygame.display.set_caption(self.title)
+                if info['bestmove'] is not None:
+                    self.board.move(*info['bestmove'])
+
+            # Show progress of engine
+            else:
+                pv = ' '.join(self.board.uci(move) for move in info['pv'])
+                pygame.display.set_caption(
+                    f"{self.title} - depth {info['depth']} "
+                    f"score {info['score'] / 100:+.2f} "
+                    f"nodes {info['nodes']} pv {pv}"
+                )
+
     def handle_events(self):
         """Handle pygame events."""
         # Loop over all events
@@ -198,6 +264,22 @@ class GUI(object):
                 # Set running to False
                 self.running = False
 
+            # Resize event
+            if event.type == pygame.VIDEORESIZE:
+                self.resize(event.w, event.h)
+
+            # Abort engine search, engine plays the best move found so far
+            if (
+                    event.type == pygame.KEYDOWN and
+                    event.key  == pygame.K_ESCAPE and
+                    self.thinker is not None
+                ):
+                self.thinker.abort()
+
+            # Ignore clicks while it is the turn of the engine
+            if self.engine is not None and self.board.color == self.engine:
+                continue
+
             # Mouse press event
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Get coordinates of mouse press
@@ -0,0 +1,490 @@
+import argparse
+import heapq
+import json
+import os
+import re
+import numpy as np
+from typing   import BinaryIO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from .board   import Board
+from .move    import Move
+
+# Starting position of games without a FEN
+START = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Tag pair in PGN notation
+TAG = re.compile(r'\[(\w+)\s+"(.*)"\]')
+
+# Result of a game from the perspective of white
+RESULTS = {'1-0': 1, '1/2-1/2': 0, '0-1': -1}
+
+# Result of unfinished games or games with an unknown result
+UNKNOWN = 2
+
+# Field of POSITION counting each result
+RESULT_FIELDS = {1: 3, 0: 4, -1: 5, UNKNOWN: 6}
+
+# Position reached in a game, as written to sorted runs
+RECORD = np.dtype([
+    ('hash'  , '<u8'),
+    ('game'  , '<u4'),
+    ('result', 'i1' ),
+])
+
+# Aggregated statistics of a position in the index
+POSITION = np.dtype([
+    ('hash'  , '<u8'),
+    ('count' , '<u4'),
+    ('games' , '<u4'),
+    ('white' , '<u4'),
+    ('draw'  , '<u4'),
+    ('black' , '<u4'),
+    ('other' , '<u4'),
+    ('offset', '<u8'),
+])
+
+class Game(NamedTuple):
+    """Game read from a collection.
+
+        Attributes
+        ----------
+        fen : str
+            FEN notation of the starting position.
+
+        moves : List[Move]
+            Moves of the game.
+
+        result : str ('1-0'|'0-1'|'1/2-1/2'|'*')
+            Result of the game.
+
+        offset : Optional[int]
+            Byte offset of the game in its file, if read from a file.
+        """
+    fen    : str
+    moves  : List[Move]
+    result : str
+    offset : Optional[int] = None
+
+################################################################################
+#                                 Read games                                   #
+################################################################################
+
+def read_games(path: str) -> Iterator[Game]:
+    """Stream games from a file with one game per line.
+
+        Each line contains the result, an optional FEN between square brackets
+        and the moves in {src}{dst}[promotion] notation, e.g.::
+
+            1-0 e2e4 e7e5 d1h5 b8c6 f1c4 g8f6 h5f7
+            1/2-1/2 [8/8/8/4k3/8/8/4P3/4K3 w - - 0 1] e2e4 e5e4
+
+        Parameters
+        ----------
+        path : str
+            Path of file to read.
+
+        Yields
+        ------
+        game : Game
+            Games in order of the file.
+        """
+    with open(path, 'rb') as infile:
+        # Loop over lines, remembering where each game starts
+        offset = 0
+        for line in infile:
+            start, offset = offset, offset + len(line)
+            text = line.decode().strip()
+            if not text:
+                continue
+
+            # Parse result and starting position
+            result, _, text = text.partition(' ')
+            fen = START
+            if text.startswith('['):
+                fen, _, text = text[1:].partition(']')
+
+            # Parse moves
+            board = Board.from_fen(fen)
+            moves = list()
+            for notation in text.split():
+                moves.append(board.parse_uci(notation))
+                board.push(moves[-1])
+
+            # Yield game
+            yield Game(fen, moves, result, start)
+
+def read_pgn(path: str) -> Iterator[Game]:
+    """Stream games from a file in PGN notation.
+
+        Comments, variations and annotations are ignored. Games start from the
+        position in their FEN tag, if any.
+
+        Parameters
+        ----------
+        path : str
+            Path of file to read.
+
+        Yields
+        ------
+        game : Game
+            Games in order of the file.
+        """
+    with open(path, 'rb') as infile:
+        for offset, lines in split_pgn(infile):
+            # Parse tags
+            tags = dict(
+                TAG.fullmatch(line).groups() for line in lines
+                if TAG.fullmatch(line)
+            )
+
+            # Get move text without comments, variations and annotations
+            text = ' '.join(
+                line.partition(';')[0] for line in lines
+                if not TAG.fullmatch(line)
+            )
+            text = re.sub(r"\{[^}]*\}|\$\d+", ' ', text)
+            while True:
+                text, changes = re.subn(r"\([^()]*\)", ' ', text)
+                if not changes:
+                    break
+
+            # Parse moves
+            fen   = tags.get('FEN', START)
+            board = Board.from_fen(fen)
+            moves = list()
+            for token in text.split():
+                token = re.sub(r"^\d+\.+", '', token)
+                if not token or token in ('1-0', '0-1', '1/2-1/2', '*'):
+                    continue
+                moves.append(board.parse_san(token))
+                board.push(moves[-1])
+
+            # Yield game
+            yield Game(fen, moves, tags.get('Result', '*'), offset)
+
+def split_pgn(infile: BinaryIO) -> Iterator[Tuple[int, List[str]]]:
+    """Split a PGN file opened in binary mode into games.
+
+        Yields
+        ------
+        offset : int
+            Byte offset of game relative to the current position of infile.
+
+        lines : List[str]
+            Non-empty lines of game.
+        """
+    # Initialise game
+    offset = 0
+    start  = 0
+    lines  = list()
+    moves  = False
+
+    # Loop over lines
+    for line in infile:
+        text = line.decode(errors='replace').strip()
+
+        # A tag following move text starts the next game
+        if text.startswith('[') and moves:
+            yield start, lines
+            lines = list()
+            moves = False
+
+        # Add line, remembering where the game starts
+        if text:
+            if not lines:
+                start = offset
+            lines.append(text)
+            moves = moves or not text.startswith('[')
+        offset += len(line)
+
+    # Yield last game
+    if lines:
+        yield start, lines
+
+################################################################################
+#                                 Build index                                  #
+################################################################################
+
+def build(
+        games     : Iterable[Game],
+        directory : str,
+        run_size  : int = 1 << 20,
+        source    : Optional[str] = None,
+    ) -> int:
+    """Build an on-disk index of all positions reached in a collection.
+
+        Positions are identified by their Zobrist hash, which only includes
+        the en passant square if a pawn can capture on it, such that
+        transpositions share the same record. Records of positions are
+        collected in memory until run_size records are buffered, then sorted
+        and written to disk as a run. Finally, all runs are merged
+        while aggregating records of the same position, such that the index
+        can be built for collections that do not fit in memory.
+
+        The index consists of the following files in directory:
+        positions.bin : Sorted POSITION records, one per distinct position.
+        games.bin     : Game numbers reaching each position, a position owns
+                        games[offset : offset + games].
+        offsets.bin   : Byte offset of each game in the source file.
+        index.json    : Metadata, such as the source file.
+
+        Parameters
+        ----------
+        games : Iterable[Game]
+            Games to index, numbered in order starting at 0.
+
+        directory : str
+            Directory in which to store the index.
+
+        run_size : int, default=1048576
+            Number of records to sort in memory.
+
+        source : Optional[str]
+            Path of file the games were read from, used to look up games.
+
+        Returns
+        -------
+        n_games : int
+            Number of indexed games.
+        """
+    # Create directory
+    os.makedirs(directory, exist_ok=True)
+
+    # Initialise buffer of records and runs on disk
+    buffer  = np.empty(run_size, dtype=RECORD)
+    size    = 0
+    runs    = list()
+    n_games = 0
+
+    with open(os.path.join(directory, 'offsets.bin'), 'wb') as offsets:
+        # Loop over all games
+        for game in games:
+            offsets.write(np.uint64(game.offset or 0).tobytes())
+
+            # Replay game, recording every position including the first
+            board  = Board.from_fen(game.fen)
+            result = RESULTS.get(game.result, UNKNOWN)
+            for move in [None] + list(game.moves):
+                if move is not None:
+                    board.push(move)
+
+                # Write sorted run when buffer is full
+                if size == run_size:
+                    runs.append(write_run(buffer[:size], directory, len(runs)))
+                    size = 0
+
+                # Add record
+                buffer[size] = (board.zobrist_hash(), n_games, result)
+                size += 1
+
+            n_games += 1
+
+    # Write last run
+    if size:
+        runs.append(write_run(buffer[:size], directory, len(runs)))
+
+    # Merge runs into index
+    merge(runs, directory)
+
+    # Remove runs
+    for run in runs:
+        os.remove(run)
+
+    # Write metadata
+    with open(os.path.join(directory, 'index.json'), 'w') as outfile:
+        json.dump({
+            'games' : n_games,
+            'source': os.path.abspath(source) if source is not None else None,
+        }, outfile, indent=4)
+
+    # Return number of games
+    return n_games
+
+def write_run(records: np.ndarray, directory: str, number: int) -> str:
+    """Sort records by position and game, and write them as a run."""
+    path = os.path.join(directory, f"run_{number:06d}.bin")
+    records[np.lexsort((records['game'], records['hash']))].tofile(path)
+    return path
+
+def read_run(path: str, chunk: int = 1 << 16) -> Iterator[Tuple[int, int, int]]:
+    """Stream records of a run as (hash, game, result), reading in chunks."""
+    records = np.memmap(path, dtype=RECORD, mode='r')
+    for start in range(0, len(records), chunk):
+        yield from records[start : start + chunk].tolist()
+
+def merge(runs: List[str], directory: str, chunk: int = 1 << 16) -> None:
+    """Merge sorted runs, aggregating records per position."""
+    # Initialise output buffers
+    positions = list()
+    games     = list()
+    offset    = 0
+
+    with open(os.path.join(directory, 'positions.bin'), 'wb') as out_positions, \
+         open(os.path.join(directory, 'games.bin'    ), 'wb') as out_games:
+
+        # Write buffered output
+        def flush():
+            np.asarray(positions, dtype=POSITION).tofile(out_positions)
+            np.asarray(games    , dtype='<u4'   ).tofile(out_games)
+            positions.clear()
+            games    .clear()
+
+        # Loop over all records, ordered by position and game
+        current = None
+        for key, game, result in heapq.merge(*[read_run(run, chunk) for run in runs]):
+            # Start a new position
+            if current is None or current[0] != key:
+                if current is not None:
+                    positions.append(tuple(current))
+                    offset += current[2]
+                current = [key, 0, 0, 0, 0, 0, 0, offset]
+                last    = None
+
+            # Count occurrence
+            current[1] += 1
+
+            # Count each game and its result once per position
+            if game != last:
+                games.append(game)
+                current[2] += 1
+                current[RESULT_FIELDS[result]] += 1
+                last = game
+
+            # Write output when buffers are full
+            if len(games) >= chunk:
+                flush()
+
+        # Write last position
+        if current is not None:
+            positions.append(tuple(current))
+        flush()
+
+################################################################################
+#                                 Query index                                  #
+################################################################################
+
+class PositionIndex(object):
+
+    def __init__(self, directory: str):
+        """Query an index built by build().
+
+            Files are memory mapped, such that queries only read the pages
+            they need and the index need not fit in memory.
+
+            Parameters
+            ----------
+            directory : str
+                Directory containing the index.
+            """
+        # Load metadata
+        self.directory = directory
+        with open(os.path.join(directory, 'index.json')) as infile:
+            self.meta = json.load(infile)
+
+        # Map index files
+        self.positions = self.map('positions.bin', POSITION)
+        self.games     = self.map('games.bin'    , '<u4'   )
+        self.offsets   = self.map('offsets.bin'  , '<u8'   )
+
+    def map(self, name: str, dtype) -> np.ndarray:
+        """Memory map a file of the index, empty files give empty arrays."""
+        path = os.path.join(self.directory, name)
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r')
+
+    def __len__(self):
+        """Return number of distinct positions."""
+        return len(self.positions)
+
+    ########################################################################
+    #                            Query methods                             #
+    ########################################################################
+
+    def find(self, position) -> Optional[np.void]:
+        """Find the statistics of a position.
+
+            Parameters
+            ----------
+            position : Union[Board, int]
+                Board or Zobrist hash of position.
+
+            Returns
+            -------
+            statistics : Optional[np.void]
+                POSITION record of position with fields 'count' (number of
+                occurrences), 'games' (number of games), 'white', 'draw' and
+                'black' (results of those games) and 'other' (games without
+                a result, e.g., '*'), None if never reached.
+            """
+        # Get hash of position
+        key = position.zobrist_hash() if isinstance(position, Board) else position
+
+        # Binary search position
+        index = int(np.searchsorted(self.positions['hash'], np.uint64(key)))
+        if index < len(self.positions) and self.positions[index]['hash'] == key:
+            return self.positions[index]
+        return None
+
+    def find_games(self, position) -> np.ndarray:
+        """Return the numbers of all games reaching a position.
+
+            Parameters
+            ----------
+            position : Union[Board, int]
+                Board or Zobrist hash of position.
+
+            Returns
+            -------
+            games : np.ndarray
+                Numbers of games, in order of the collection.
+            """
+        record = self.find(position)
+        if record is None:
+            return np.empty(0, dtype='<u4')
+        return np.asarray(self.games[record['offset'] : record['offset'] + record['games']])
+
+    def read_game(self, game: int) -> str:
+        """Read a game from the source file of the index."""
+        with open(self.meta['source'], 'rb') as infile:
+            infile.seek(int(self.offsets[game]))
+            if self.meta['source'].endswith('.pgn'):
+                return '\n'.join(next(split_pgn(infile))[1])
+            return infile.readline().decode().strip()
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser   = argparse.ArgumentParser(description="Index positions of game collections")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parser_build = commands.add_parser('build', help="build index of a game collection")
+    parser_build.add_argument('games'     , help="PGN file, or file with one game per line")
+    parser_build.add_argument('directory' , help="directory of index")
+    parser_build.add_argument('--run-size', type=int, default=1 << 20, help="records sorted in memory")
+
+    parser_query = commands.add_parser('query', help="find games reaching a position")
+    parser_query.add_argument('directory', help="directory of index")
+    parser_query.add_argument('fen'      , help="position in FEN notation")
+    parser_query.add_argument('--show'   , type=int, default=10, help="number of games to print")
+    args = parser.parse_args()
+
+    # Build index
+    if args.command == 'build':
+        games   = read_pgn(args.games) if args.games.endswith('.pgn') else read_games(args.games)
+        n_games = build(games, args.directory, args.run_size, args.games)
+        index   = PositionIndex(args.directory)
+        print(f"indexed {n_games} games, {len(index)} distinct positions")
+
+    # Query index
+    else:
+        index  = PositionIndex(args.directory)
+        record = index.find(Board.from_fen(args.fen))
+        if record is None:
+            print("position not found")
+        else:
+            print(
+                f"occurrences {record['count']} games {record['games']} "
+                f"+{record['white']} ={record['draw']} -{record['black']} "
+                f"unfinished {record['other']}"
+            )
+            for game in index.find_games(Board.from_fen(args.fen))[:args.show]:
+                print(f"{game}: {index.read_game(game)}")
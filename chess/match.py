@@ -0,0 +1,438 @@
+import argparse
+import datetime
+import math
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing   import Dict, List, Optional, Tuple, Union
+from .        import pieces
+from .board   import Board
+from .move    import Move
+from .search  import Search
+from .timeman import TimeManager
+
+# Default opening suite, each opening is played with both colors
+OPENINGS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2",
+    "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2",
+    "rnbqkbnr/pppp1ppp/4p3/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
+    "rnbqkbnr/pp1ppppp/2p5/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
+    "rnbqkbnr/ppp1pppp/8/3p4/3P4/8/PPP1PPPP/RNBQKBNR w KQkq d6 0 2",
+    "rnbqkb1r/pppppppp/5n2/8/3P4/8/PPP1PPPP/RNBQKBNR w KQkq - 1 2",
+    "rnbqkbnr/pppppppp/8/8/2P5/8/PP1PPPPP/RNBQKBNR b KQkq c3 0 1",
+]
+
+# Configuration keys limiting the search, not passed to Search()
+LIMITS = ('depth', 'time', 'clock', 'increment', 'moves_to_go')
+
+# Values accepted for boolean configuration keys
+BOOLEANS = {
+    'true' : True , 'yes': True , 'on' : True ,
+    'false': False, 'no' : False, 'off': False,
+}
+
+################################################################################
+#                               Worker functions                               #
+################################################################################
+
+def play(
+        fen       : str,
+        white     : Dict[str, float],
+        black     : Dict[str, float],
+        max_plies : int = 200,
+    ) -> Tuple[List[Tuple], str, str]:
+    """Play a single game between two engines, executed in a worker process.
+
+        Parameters
+        ----------
+        fen : str
+            FEN notation of starting position.
+
+        white : Dict[str, float]
+            Configuration of engine playing white, see parse_config().
+
+        black : Dict[str, float]
+            Configuration of engine playing black, see parse_config().
+
+        max_plies : int, default=200
+            Number of plies after which the game is adjudicated as a draw.
+
+        Returns
+        -------
+        moves : List[Tuple]
+            Moves played, as tuples.
+
+        result : str ('1-0'|'0-1'|'1/2-1/2')
+            Result of game.
+
+        termination : str
+            Reason the game ended, 'normal', 'time forfeit' or 'adjudication'.
+        """
+    # Initialise game
+    board = Board.from_fen(fen)
+    moves = list()
+
+    # Initialise clocks of engines playing with a clock
+    clocks = {
+        pieces.Color.WHITE.value: white.get('clock'),
+        pieces.Color.BLACK.value: black.get('clock'),
+    }
+
+    # Play until the game is over
+    while (result := board.result()) is None:
+        # Adjudicate long games as a draw
+        if len(moves) >= max_plies:
+            return moves, '1/2-1/2', 'adjudication'
+
+        # Search move within the time limit of the engine to move
+        config = white if board.color == pieces.Color.WHITE.value else black
+        start  = time.perf_counter()
+        move   = think(board, config, clocks[board.color])
+
+        # Update clock, the engine loses if it runs out of time
+        if clocks[board.color] is not None:
+            clocks[board.color] -= time.perf_counter() - start
+            if clocks[board.color] < 0:
+                return moves, '0-1' if board.color == pieces.Color.WHITE.value else '1-0', 'time forfeit'
+            clocks[board.color] += config.get('increment', 0)
+
+        # Perform move
+        board.push(move)
+        moves.append(tuple(move))
+
+    # Return result
+    return moves, result, 'normal'
+
+def think(board: Board, config: Dict[str, float], clock: Optional[float] = None) -> Move:
+    """Search a move, aborting the search when the time per move is used or
+        when the time manager of a clock says so."""
+    # Stop search when time is up
+    stop  = threading.Event()
+    timer = threading.Timer(config['time'], stop.set) if config.get('time') else None
+
+    # Allocate time from clock
+    manager = None
+    if clock is not None:
+        manager = TimeManager(
+            remaining   = clock,
+            increment   = config.get('increment', 0),
+            moves_to_go = config.get('moves_to_go'),
+        )
+
+    # Search move
+    if timer is not None:
+        timer.start()
+    try:
+        move, _ = Search(
+            board.copy(),
+            stop  = stop,
+            timer = manager,
+            **{key: value for key, value in config.items() if key not in LIMITS},
+        ).run(int(config.get('depth', 64)))
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+    # Return move
+    return move
+
+################################################################################
+#                                  Statistics                                  #
+################################################################################
+
+def elo(wins: int, draws: int, losses: int) -> Tuple[float, float, float]:
+    """Compute the Elo difference from a match result.
+
+        Parameters
+        ----------
+        wins : int
+            Number of games won by the first engine.
+
+        draws : int
+            Number of games drawn.
+
+        losses : int
+            Number of games lost by the first engine.
+
+        Returns
+        -------
+        score : float
+            Score of the first engine, between 0 and 1.
+
+        difference : float
+            Elo difference of the first engine over the second engine.
+
+        error : float
+            Half width of the 95% confidence interval of the Elo difference,
+            infinite if all games had the same outcome, as the variance can
+            not be estimated from such a match.
+        """
+    # Convert score to Elo difference, bounded for a perfect score
+    def difference(score):
+        score = min(max(score, 1e-6), 1 - 1e-6)
+        return -400 * math.log10(1 / score - 1) + 0.0
+
+    # Get score
+    games = wins + draws + losses
+    if games == 0:
+        return 0.5, 0.0, math.inf
+    score = (wins + 0.5 * draws) / games
+
+    # Get standard error of score over games, unknown without variance
+    variance = (
+        wins   * (1.0 - score) ** 2 +
+        draws  * (0.5 - score) ** 2 +
+        losses * (0.0 - score) ** 2
+    ) / games
+    if variance == 0:
+        return score, difference(score), math.inf
+    error = 1.96 * math.sqrt(variance / games)
+
+    # Return result
+    return (
+        score,
+        difference(score),
+        (difference(score + error) - difference(score - error)) / 2,
+    )
+
+################################################################################
+#                                     PGN                                      #
+################################################################################
+
+def pgn(
+        fen         : str,
+        moves       : List[Tuple],
+        result      : str,
+        white       : str,
+        black       : str,
+        round       : int,
+        termination : str = 'normal',
+    ) -> str:
+    """Format a game in PGN notation."""
+    # Create tags
+    lines = [
+        '[Event "Engine match"]',
+        f'[Date "{datetime.date.today():%Y.%m.%d}"]',
+        f'[Round "{round}"]',
+        f'[White "{white}"]',
+        f'[Black "{black}"]',
+        f'[Result "{result}"]',
+        f'[Termination "{termination}"]',
+        '[SetUp "1"]',
+        f'[FEN "{fen}"]',
+        '',
+    ]
+
+    # Create move text
+    board = Board.from_fen(fen)
+    text  = list()
+    for index, move in enumerate(moves):
+        move = Move(*move)
+        # Add move number
+        if board.color == pieces.Color.WHITE.value:
+            text.append(f"{board.fullmove}.")
+        elif index == 0:
+            text.append(f"{board.fullmove}...")
+
+        # Add move
+        text.append(board.san(move))
+        board.push(move)
+    text.append(result)
+
+    # Wrap move text at 80 characters
+    line = ''
+    for word in text:
+        if len(line) + len(word) + 1 > 80:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    lines.append(line)
+
+    # Return result
+    return '\n'.join(lines) + '\n\n'
+
+################################################################################
+#                                    Match                                     #
+################################################################################
+
+def parse_config(text: str) -> Dict[str, Union[bool, float]]:
+    """Parse an engine configuration such as 'depth=4,time=0.5'.
+
+        Keys 'depth' (maximum depth in plies), 'time' (seconds per move) and
+        'clock', 'increment', 'moves_to_go' (seconds per game, seconds added
+        per move and moves per time control) limit the search, all other keys
+        are passed to Search(), e.g., 'depth=4,null_move=false' disables
+        null-move pruning. Values are numbers or booleans (true/false, yes/no,
+        on/off).
+
+        Raises
+        ------
+        ValueError
+            If an item is not a key=value pair or a value is invalid.
+        """
+    # Initialise result
+    result = dict()
+
+    # Parse key value pairs
+    for item in filter(None, text.split(',')):
+        key, separator, value = item.partition('=')
+        key, value = key.strip(), value.strip()
+        if not separator or not key:
+            raise ValueError(f"invalid item '{item}' in '{text}', expected key=value")
+
+        # Parse value as boolean or number
+        if value.lower() in BOOLEANS:
+            result[key] = BOOLEANS[value.lower()]
+        else:
+            try:
+                result[key] = float(value) if '.' in value else int(value)
+            except ValueError:
+                raise ValueError(
+                    f"invalid value '{value}' for '{key}', expected a number "
+                    f"or a boolean (true/false)"
+                ) from None
+
+    # Return result
+    return result
+
+def match(
+        engine_1  : str,
+        engine_2  : str,
+        games     : int,
+        openings  : List[str] = OPENINGS,
+        jobs      : Optional[int] = None,
+        max_plies : int = 200,
+        output    : Optional[str] = None,
+    ) -> Tuple[int, int, int]:
+    """Play a match between two engine configurations.
+
+        Games are played in a process pool. Each opening is played twice,
+        with both engines playing white once. Results are printed, and games
+        are written to a PGN file, as soon as each game finishes.
+
+        Parameters
+        ----------
+        engine_1 : str
+            Configuration of the first engine, see parse_config().
+
+        engine_2 : str
+            Configuration of the second engine, see parse_config().
+
+        games : int
+            Number of games to play.
+
+        openings : List[str], default=OPENINGS
+            FEN notation of starting positions.
+
+        jobs : Optional[int]
+            Number of processes, defaults to the number of CPUs.
+
+        max_plies : int, default=200
+            Number of plies after which a game is adjudicated as a draw.
+
+        output : Optional[str]
+            If given, path of PGN file to which games are appended.
+
+        Returns
+        -------
+        wins : int
+            Number of games won by the first engine.
+
+        draws : int
+            Number of games drawn.
+
+        losses : int
+            Number of games lost by the first engine.
+        """
+    # Initialise result
+    wins = draws = losses = 0
+    configs = (parse_config(engine_1), parse_config(engine_2))
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Schedule games, alternating colors per opening
+        futures = dict()
+        for game in range(games):
+            fen = openings[(game // 2) % len(openings)]
+            first_white  = game % 2 == 0
+            white, black = (engine_1, engine_2) if first_white else (engine_2, engine_1)
+            config_white = configs[0] if first_white else configs[1]
+            config_black = configs[1] if first_white else configs[0]
+            future = pool.submit(play, fen, config_white, config_black, max_plies)
+            futures[future] = (game + 1, fen, white, black, first_white)
+
+        # Handle games as they finish
+        for future in as_completed(futures):
+            round, fen, white, black, first_white = futures[future]
+            moves, result, termination = future.result()
+
+            # Update score of first engine
+            if result == '1/2-1/2':
+                draws += 1
+            elif (result == '1-0') == first_white:
+                wins += 1
+            else:
+                losses += 1
+
+            # Write game
+            if output is not None:
+                with open(output, 'a') as outfile:
+                    outfile.write(pgn(fen, moves, result, white, black, round, termination))
+
+            # Print statistics
+            score, difference, error = elo(wins, draws, losses)
+            print(
+                f"game {round:>4} {result:>7}  "
+                f"+{wins} ={draws} -{losses}  "
+                f"score {score:.3f}  elo {difference:+.1f} +/- {error:.1f}",
+                flush = True,
+            )
+
+    # Return result
+    return wins, draws, losses
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Play a match between two engine configurations")
+    parser.add_argument('engine_1'   , help="configuration of first engine, e.g. depth=3,time=0.5 or clock=60,increment=0.5")
+    parser.add_argument('engine_2'   , help="configuration of second engine, e.g. depth=2")
+    parser.add_argument('--games'    , type=int, default=100, help="number of games")
+    parser.add_argument('--openings' , help="file with one FEN per line")
+    parser.add_argument('--jobs'     , type=int, help="number of processes")
+    parser.add_argument('--max-plies', type=int, default=200, help="adjudicate games as draw after this many plies")
+    parser.add_argument('--pgn'      , help="file to append games to")
+    args = parser.parse_args()
+
+    # Load openings
+    openings = OPENINGS
+    if args.openings is not None:
+        with open(args.openings) as infile:
+            openings = [line.strip() for line in infile if line.strip()]
+
+    # Check configurations
+    for config in (args.engine_1, args.engine_2):
+        try:
+            parse_config(config)
+        except ValueError as error:
+            parser.error(str(error))
+
+    # Play match
+    start = time.perf_counter()
+    wins, draws, losses = match(
+        engine_1  = args.engine_1,
+        engine_2  = args.engine_2,
+        games     = args.games,
+        openings  = openings,
+        jobs      = args.jobs,
+        max_plies = args.max_plies,
+        output    = args.pgn,
+    )
+
+    # Print summary
+    score, difference, error = elo(wins, draws, losses)
+    print(
+        f"{args.engine_1} vs {args.engine_2}: +{wins} ={draws} -{losses}, "
+        f"score {score:.3f}, elo {difference:+.1f} +/- {error:.1f}, "
+        f"{time.perf_counter() - start:.1f}s"
+    )
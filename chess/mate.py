@@ -0,0 +1,401 @@
+import argparse
+import threading
+import time
+from typing   import Dict, List, Optional, Tuple
+from .        import pieces
+from .board   import Board
+from .move    import Move
+
+# Proof and disproof numbers of solved positions
+INFINITY = 1 << 30
+
+class LimitReached(Exception):
+    """Raised inside the mate search when a node or time limit is reached."""
+    pass
+
+class MateSearch(object):
+
+    def __init__(
+            self,
+            board       : Board,
+            max_entries : int = 1 << 20,
+            max_nodes   : Optional[int] = None,
+            max_time    : Optional[float] = None,
+            stop        : Optional[threading.Event] = None,
+        ):
+        """Prove forced mates using depth-first proof-number search (df-pn).
+
+            The color to move in the root is the attacker. A position is proven
+            if the attacker can force mate, and disproven if the defender can
+            avoid mate, e.g., by stalemate, repetition or by surviving beyond
+            the maximum depth. Each position stores a pair (phi, delta) from
+            the perspective of the color to move: phi is the number of
+            positions that must be solved to prove the goal of that color, the
+            proof number for the attacker and the disproof number for the
+            defender, and delta vice versa. The search always expands the most
+            proving child and only returns to the parent once the thresholds of
+            the parent are exceeded.
+
+            Parameters
+            ----------
+            board : Board
+                Board to search, the board is modified during the search and
+                restored afterwards.
+
+            max_entries : int, default=1048576
+                Maximum number of positions stored in the table. When full,
+                the half of the positions that took least work to solve are
+                removed.
+
+            max_nodes : Optional[int]
+                If given, maximum number of nodes to search.
+
+            max_time : Optional[float]
+                If given, maximum time in seconds to search.
+
+            stop : Optional[threading.Event]
+                If given, the search stops as soon as the event is set.
+            """
+        # Set parameters
+        self.board       = board
+        self.max_entries = max_entries
+        self.max_nodes   = max_nodes
+        self.max_time    = max_time
+        self.stop        = stop if stop is not None else threading.Event()
+
+        # Table of (phi, delta, work) indexed by (position hash, remaining plies)
+        self.table : Dict[Tuple[int, Optional[int]], Tuple[int, int, int]] = dict()
+        self.nodes = 0
+
+    ########################################################################
+    #                             Solve method                             #
+    ########################################################################
+
+    def solve(self, depth: Optional[int] = None) -> Optional[List[Move]]:
+        """Search for a forced mate by the color to move.
+
+            Parameters
+            ----------
+            depth : Optional[int]
+                If given, only search for mates in at most depth moves of the
+                attacker.
+
+            Returns
+            -------
+            line : Optional[List[Move]]
+                Shortest mating line, alternating attacker and defender moves
+                and ending in mate, None if no mate was proven within the
+                limits.
+            """
+        # Start clock
+        self.started = time.perf_counter()
+
+        # Without a depth, first prove any mate to bound the depth
+        if depth is None:
+            line = self.search(None)
+            if line is None:
+                return None
+            depth = (len(line) + 1) // 2
+
+        # Deepen one move at a time, the first proven mate is the shortest
+        for moves in range(1, depth + 1):
+            line = self.search(2 * moves - 1)
+            if line is not None:
+                return line
+
+        # No mate within depth
+        return None
+
+    def search(self, plies: Optional[int]) -> Optional[List[Move]]:
+        """Search for a mate within a number of plies, see solve()."""
+        # Search until the root is solved
+        try:
+            phi, delta = self.mid(INFINITY - 1, INFINITY - 1, plies, attacker=True)
+        except LimitReached:
+            return None
+
+        # Return mating line if proven
+        if phi != 0:
+            return None
+        return self.line(plies)
+
+    ########################################################################
+    #                            Search methods                            #
+    ########################################################################
+
+    def mid(
+            self,
+            phi      : int,
+            delta    : int,
+            plies    : Optional[int],
+            attacker : bool,
+        ) -> Tuple[int, int]:
+        """Expand the current position until its thresholds are exceeded.
+
+            Parameters
+            ----------
+            phi : int
+                Threshold of phi of position.
+
+            delta : int
+                Threshold of delta of position.
+
+            plies : Optional[int]
+                Remaining plies, None if unbounded.
+
+            attacker : bool
+                True if the attacker is to move.
+
+            Returns
+            -------
+            phi : int
+                Phi of position.
+
+            delta : int
+                Delta of position.
+            """
+        # Count node and check limits
+        self.nodes += 1
+        self.check()
+
+        # Get children
+        moves = self.board.legal_moves()
+        key   = (self.board.zobrist_hash(), plies)
+
+        # Evaluate terminal positions
+        terminal = self.terminal(moves, plies, attacker)
+        if terminal is not None:
+            self.store(key, *terminal, work=1)
+            return terminal
+
+        # Initialise work spent on this position and keys of children
+        work = 0
+        keys = [self.key(move, plies) for move in moves]
+
+        # Expand children until the thresholds are exceeded
+        while True:
+            # Get phi and delta of children from the table
+            children = [self.table.get(key, (1, 1, 0))[:2] for key in keys]
+
+            # Compute phi and delta of position
+            node_phi   = min(child_delta for child_phi, child_delta in children)
+            node_delta = min(INFINITY, sum(child_phi for child_phi, child_delta in children))
+
+            # Return if thresholds are exceeded
+            if node_phi >= phi or node_delta >= delta:
+                self.store(key, node_phi, node_delta, work + 1)
+                return node_phi, node_delta
+
+            # Select most proving child, and the delta of the second best child
+            order = sorted(range(len(moves)), key=lambda index: children[index][1])
+            best  = order[0]
+            second_delta = children[order[1]][1] if len(order) > 1 else INFINITY
+
+            # Compute thresholds of child
+            child_phi, child_delta = children[best]
+            threshold_phi   = delta + child_phi - node_delta
+            threshold_delta = min(phi, second_delta + 1)
+
+            # Expand child
+            nodes = self.nodes
+            self.board.push(moves[best])
+            try:
+                self.mid(
+                    threshold_phi,
+                    threshold_delta,
+                    None if plies is None else plies - 1,
+                    not attacker,
+                )
+            finally:
+                self.board.pop()
+            work += self.nodes - nodes
+
+    def terminal(
+            self,
+            moves    : List[Move],
+            plies    : Optional[int],
+            attacker : bool,
+        ) -> Optional[Tuple[int, int]]:
+        """Return (phi, delta) of a position where the search ends, None for
+            positions that need to be expanded."""
+        # Value of a won and lost position for the color to move
+        won  = (0, INFINITY)
+        lost = (INFINITY, 0)
+
+        # Checkmate is a loss for the color to move, stalemate a win for the
+        # defender
+        if not moves:
+            if self.board.is_in_check(pieces.Color(self.board.color)):
+                return lost
+            return lost if attacker else won
+
+        # Draws and running out of plies are wins for the defender
+        if (
+                (plies is not None and plies <= 0) or
+                self.board.is_repetition(count=2) or
+                self.board.is_fifty_moves()
+            ):
+            return lost if attacker else won
+
+        # Position is not terminal
+        return None
+
+    def key(self, move: Move, plies: Optional[int]) -> Tuple[int, Optional[int]]:
+        """Return key in the table of the position after a move."""
+        self.board.push(move)
+        key = (self.board.zobrist_hash(), None if plies is None else plies - 1)
+        self.board.pop()
+        return key
+
+    def child(self, move: Move, plies: Optional[int]) -> Tuple[int, int]:
+        """Return (phi, delta) of a child from the table, (1, 1) if unknown."""
+        return self.table.get(self.key(move, plies), (1, 1, 0))[:2]
+
+    def line(self, plies: Optional[int]) -> List[Move]:
+        """Follow proven positions from the root to extract the mating line."""
+        # Initialise result
+        result   = list()
+        attacker = True
+
+        try:
+            while True:
+                # Get moves
+                moves = self.board.legal_moves()
+                if not moves:
+                    break
+
+                # Get children proven to lead to mate, the attacker needs a
+                # single one, the defender needs all of them
+                proven = [
+                    move for move in moves
+                    if self.child(move, plies)[1 if attacker else 0] == 0
+                ]
+
+                # Solve children that were removed from the table
+                for move in moves:
+                    if (attacker and proven) or move in proven:
+                        continue
+                    self.board.push(move)
+                    try:
+                        phi, delta = self.mid(
+                            INFINITY - 1, INFINITY - 1,
+                            None if plies is None else plies - 1,
+                            not attacker,
+                        )
+                    except LimitReached:
+                        phi, delta = INFINITY, INFINITY
+                    finally:
+                        self.board.pop()
+                    if (delta if attacker else phi) == 0:
+                        proven.append(move)
+
+                # Stop if the line can not be completed within the limits
+                if not proven or (not attacker and len(proven) < len(moves)):
+                    break
+
+                # Attacker plays a move proven to mate, the defender plays the
+                # move that took most work to prove, as it resists longest
+                if attacker:
+                    move = proven[0]
+                else:
+                    move = max(proven, key=lambda move: self.work(move, plies))
+
+                # Perform move
+                result.append(move)
+                self.board.push(move)
+                attacker = not attacker
+                plies    = None if plies is None else plies - 1
+
+        # Restore board
+        finally:
+            for _ in result:
+                self.board.pop()
+
+        # Return result
+        return result
+
+    ########################################################################
+    #                          Auxiliary methods                           #
+    ########################################################################
+
+    def store(self, key, phi: int, delta: int, work: int) -> None:
+        """Store phi and delta of a position, bounding the size of the table."""
+        # Remove least valuable half of the table when full
+        if len(self.table) >= self.max_entries and key not in self.table:
+            entries = sorted(self.table.items(), key=lambda item: item[1][2])
+            self.table = dict(entries[len(entries) // 2:])
+
+        # Store entry
+        self.table[key] = (phi, delta, work)
+
+    def work(self, move: Move, plies: Optional[int]) -> int:
+        """Return the work stored for the position after a move."""
+        return self.table.get(self.key(move, plies), (0, 0, 0))[2]
+
+    def check(self) -> None:
+        """Raise LimitReached if the search should stop."""
+        if (
+                self.stop.is_set() or
+                (self.max_nodes is not None and self.nodes >= self.max_nodes) or
+                (self.max_time  is not None and self.nodes % 64 == 0 and
+                 time.perf_counter() - self.started >= self.max_time)
+            ):
+            raise LimitReached()
+
+def solve(
+        board     : Board,
+        depth     : Optional[int] = None,
+        max_nodes : Optional[int] = None,
+        max_time  : Optional[float] = None,
+    ) -> Optional[List[Move]]:
+    """Search for a forced mate by the color to move, see MateSearch.
+
+        Parameters
+        ----------
+        board : Board
+            Board to search.
+
+        depth : Optional[int]
+            If given, only search for mates in at most depth moves.
+
+        max_nodes : Optional[int]
+            If given, maximum number of nodes to search.
+
+        max_time : Optional[float]
+            If given, maximum time in seconds to search.
+
+        Returns
+        -------
+        line : Optional[List[Move]]
+            Mating line, None if no mate was proven within the limits.
+        """
+    return MateSearch(
+        board.copy(),
+        max_nodes = max_nodes,
+        max_time  = max_time,
+    ).solve(depth)
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Prove forced mates")
+    parser.add_argument('fen'        , help="position in FEN notation")
+    parser.add_argument('--depth'    , type=int, help="maximum number of moves until mate")
+    parser.add_argument('--max-nodes', type=int, help="maximum number of nodes")
+    parser.add_argument('--max-time' , type=float, help="maximum time in seconds")
+    args = parser.parse_args()
+
+    # Solve position
+    board  = Board.from_fen(args.fen)
+    search = MateSearch(board, max_nodes=args.max_nodes, max_time=args.max_time)
+    start  = time.perf_counter()
+    line   = search.solve(args.depth)
+
+    # Print result
+    if line is None:
+        print(f"no mate found, nodes {search.nodes} time {time.perf_counter() - start:.3f}s")
+    else:
+        print(
+            f"mate in {(len(line) + 1) // 2}: " + ' '.join(
+                board.uci(move) for move in line
+            ) + f", nodes {search.nodes} time {time.perf_counter() - start:.3f}s"
+        )
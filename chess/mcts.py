@@ -0,0 +1,437 @@
+import math
+import numpy as np
+import threading
+from typing   import List, Optional, Tuple
+from .        import pieces
+from .board   import Board
+from .move    import Move
+from .timeman import TimeManager
+
+# Promotion pieces, encoded by their position, 0 means no promotion
+PROMOTIONS = (None, 'n', 'b', 'r', 'q')
+
+################################################################################
+#                                  Evaluators                                  #
+################################################################################
+
+class MaterialEvaluator(object):
+
+    def __init__(self, scale: float = 400.0, temperature: float = 200.0):
+        """Vectorized evaluator scoring a batch of positions by material.
+
+            Evaluators are called with a batch of boards and the legal moves of
+            each board, and return a value per board and a prior probability
+            per move. Any object implementing __call__ with the same signature
+            can be used by MCTS, e.g., a neural network evaluating the whole
+            batch at once.
+
+            Parameters
+            ----------
+            scale : float, default=400.0
+                Material difference in centipawns mapped to a value of
+                tanh(1) ~ 0.76.
+
+            temperature : float, default=200.0
+                Temperature in centipawns of the softmax over captured material
+                used as prior, higher temperatures give more uniform priors.
+            """
+        self.scale       = scale
+        self.temperature = temperature
+
+        # Value of each piece index for white, the last index is empty
+        values = [
+            piece(pieces.Color.WHITE).value for piece in (
+                pieces.Pawn, pieces.Knight, pieces.Bishop,
+                pieces.Rook, pieces.Queen , pieces.King  ,
+            )
+        ]
+        self.values = np.asarray(values + [-value for value in values] + [0], dtype=np.float32)
+
+    def __call__(
+            self,
+            boards : List[Board],
+            moves  : List[List[Move]],
+        ) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Evaluate a batch of positions.
+
+            Parameters
+            ----------
+            boards : List[Board]
+                Positions to evaluate, all of the same size.
+
+            moves : List[List[Move]]
+                Legal moves of each position, never empty.
+
+            Returns
+            -------
+            values : np.ndarray of shape=(n_boards,)
+                Value of each position between -1 and 1 from the perspective
+                of the color to move.
+
+            priors : List[np.ndarray]
+                Prior probability of each legal move of each position.
+            """
+        # Encode boards as piece index per square, shape=(n_boards, n_squares)
+        indices = encode(boards)
+
+        # Material of white, from the perspective of the color to move
+        material = self.values[indices].sum(axis=1)
+        sign     = np.asarray([
+            1 if board.color == pieces.Color.WHITE.value else -1 for board in boards
+        ], dtype=np.float32)
+        values   = np.tanh(sign * material / self.scale)
+
+        # Score moves of all boards at once by the value of the captured piece
+        lengths  = np.asarray([len(board_moves) for board_moves in moves])
+        offsets  = np.repeat(np.arange(len(boards)), lengths)
+        n_files  = boards[0].n_files
+        targets  = np.asarray([
+            move.dst_rank * n_files + move.dst_file
+            for board_moves in moves for move in board_moves
+        ], dtype=np.intp)
+        captured = np.abs(self.values[indices[offsets, targets]])
+
+        # Convert scores to priors per board with a softmax
+        scores = np.exp((captured - captured.max(initial=0)) / self.temperature)
+        priors = np.split(scores, np.cumsum(lengths)[:-1])
+
+        # Return result
+        return values, [prior / prior.sum() for prior in priors]
+
+def encode(boards: List[Board]) -> np.ndarray:
+    """Encode boards as the piece index on each square, 12 for empty squares.
+
+        Returns
+        -------
+        indices : np.ndarray of shape=(n_boards, n_ranks * n_files)
+            Piece index of each square of each board.
+        """
+    return np.asarray([
+        [12 if piece is None else piece.index for piece in board.board.flat]
+        for board in boards
+    ], dtype=np.intp)
+
+################################################################################
+#                                     MCTS                                     #
+################################################################################
+
+class MCTS(object):
+
+    def __init__(
+            self,
+            board        : Board,
+            evaluator    = None,
+            batch_size   : int = 16,
+            max_nodes    : int = 1 << 16,
+            c_puct       : float = 1.5,
+            virtual_loss : float = 1.0,
+            stop         : Optional[threading.Event] = None,
+            timer        : Optional[TimeManager] = None,
+        ):
+        """Monte Carlo tree search with PUCT selection and batched evaluation.
+
+            Every iteration selects up to batch_size leaves. A virtual loss is
+            added along the path to each selected leaf, such that subsequent
+            selections in the same batch explore other leaves. All leaves are
+            then evaluated with a single call of the evaluator, expanded and
+            their values backed up.
+
+            Nodes are stored in preallocated arrays indexed by node, where the
+            children of a node occupy a contiguous range of indices. Values are
+            stored from the perspective of the color that made the move leading
+            to a node, such that a parent selects the child of maximum value.
+
+            Parameters
+            ----------
+            board : Board
+                Board to search, the board is modified during the search and
+                restored afterwards.
+
+            evaluator : Optional[Callable], default=MaterialEvaluator()
+                Vectorized evaluator, see MaterialEvaluator.__call__().
+
+            batch_size : int, default=16
+                Maximum number of leaves evaluated at once.
+
+            max_nodes : int, default=65536
+                Number of preallocated nodes, the search stops when all nodes
+                are used.
+
+            c_puct : float, default=1.5
+                Weight of prior and exploration in selection.
+
+            virtual_loss : float, default=1.0
+                Loss added per pending evaluation of a path.
+
+            stop : Optional[threading.Event]
+                If given, the search stops as soon as the event is set.
+
+            timer : Optional[TimeManager]
+                If given, the search stops at its soft deadline.
+            """
+        # Set parameters
+        self.board        = board
+        self.evaluator    = evaluator if evaluator is not None else MaterialEvaluator()
+        self.batch_size   = batch_size
+        self.max_nodes    = max_nodes
+        self.c_puct       = c_puct
+        self.virtual_loss = virtual_loss
+        self.stop         = stop if stop is not None else threading.Event()
+        self.timer        = timer
+
+        # Move leading to each node and its prior
+        self.move     = np.zeros(max_nodes, dtype=np.int32)
+        self.prior    = np.zeros(max_nodes, dtype=np.float32)
+        # First child and number of children, -1 if not expanded
+        self.children = np.zeros(max_nodes, dtype=np.int32)
+        self.count    = np.full (max_nodes, -1, dtype=np.int32)
+        # Visits, pending evaluations and sum of values
+        self.visits   = np.zeros(max_nodes, dtype=np.int32)
+        self.pending  = np.zeros(max_nodes, dtype=np.int32)
+        self.value    = np.zeros(max_nodes, dtype=np.float32)
+
+        # The root is the first node
+        self.nodes = 1
+
+    ########################################################################
+    #                              Run method                              #
+    ########################################################################
+
+    def run(self, playouts: int = 800) -> Tuple[Optional[Move], float]:
+        """Search the board for a number of playouts.
+
+            Parameters
+            ----------
+            playouts : int, default=800
+                Number of leaves to evaluate.
+
+            Returns
+            -------
+            move : Optional[Move]
+                Most visited move, None if there are no legal moves.
+
+            value : float
+                Value of the most visited move between -1 and 1 from the
+                perspective of the color to move.
+            """
+        # Perform iterations until all playouts are evaluated
+        while self.visits[0] < playouts:
+            # Check if we should stop
+            if self.stop.is_set() or (
+                    self.timer is not None and self.timer.soft_expired()
+                ):
+                break
+
+            # Stop if no leaves can be expanded or the game is over in the root
+            if not self.iterate(min(self.batch_size, playouts - self.visits[0])):
+                break
+            if self.count[0] < 0:
+                break
+
+        # Get most visited child of root
+        if self.count[0] <= 0:
+            return None, 0.0
+        best = self.best(0)
+
+        # Return result
+        return self.decode(self.move[best]), float(self.value[best] / max(1, self.visits[best]))
+
+    def pv(self) -> List[Move]:
+        """Return the principal variation, following the most visited child."""
+        # Initialise result
+        result = list()
+        node   = 0
+
+        # Follow most visited children
+        while self.count[node] > 0 and self.visits[node] > 1:
+            node = self.best(node)
+            result.append(self.decode(self.move[node]))
+
+        # Return result
+        return result
+
+    def best(self, node: int) -> int:
+        """Return the most visited child of an expanded node."""
+        start = self.children[node]
+        return start + int(np.argmax(self.visits[start : start + self.count[node]]))
+
+    ########################################################################
+    #                           Iterate methods                            #
+    ########################################################################
+
+    def iterate(self, batch_size: int) -> bool:
+        """Select, evaluate, expand and back up a batch of leaves.
+
+            Returns
+            -------
+            progress : bool
+                False if no leaf could be evaluated, e.g., as the tree is full.
+            """
+        # Initialise batch of leaves to evaluate
+        paths    = list()
+        boards   = list()
+        moves    = list()
+        terminal = 0
+
+        # Select leaves
+        for _ in range(batch_size):
+            # Select leaf and its legal moves
+            path, legal, value = self.select()
+
+            # Stop collecting when reaching a leaf that is already pending
+            if path is None:
+                break
+
+            # Back up terminal nodes immediately
+            if value is not None:
+                self.backup(path, value)
+                terminal += 1
+                continue
+
+            # Stop if there is no room to expand the leaf
+            if self.nodes + len(legal) > self.max_nodes:
+                self.remove_virtual_loss(path)
+                for _ in path[1:]:
+                    self.board.pop()
+                break
+
+            # Reserve children of leaf, such that it is not selected again
+            leaf = path[-1]
+            self.children[leaf] = self.nodes
+            self.count   [leaf] = 0
+            self.nodes         += len(legal)
+
+            # Add leaf to batch
+            paths .append(path)
+            boards.append(self.board.copy())
+            moves .append(legal)
+
+            # Restore board to root
+            for _ in path[1:]:
+                self.board.pop()
+
+        # Evaluate all leaves at once
+        if boards:
+            values, priors = self.evaluator(boards, moves)
+            for path, legal, value, prior in zip(paths, moves, values, priors):
+                # Expand leaf
+                leaf  = path[-1]
+                start = self.children[leaf]
+                self.count[leaf] = len(legal)
+                self.move [start : start + len(legal)] = [self.encode(move) for move in legal]
+                self.prior[start : start + len(legal)] = prior
+
+                # Back up value
+                self.backup(path, float(value))
+
+        # Return whether any leaf was evaluated
+        return bool(boards) or terminal > 0
+
+    def select(self) -> Tuple[Optional[List[int]], List[Move], Optional[float]]:
+        """Select a leaf by PUCT, making the moves to the leaf on the board.
+
+            Returns
+            -------
+            path : Optional[List[int]]
+                Nodes from the root to the leaf, None if the selected leaf is
+                already pending evaluation.
+
+            moves : List[Move]
+                Legal moves in the leaf.
+
+            value : Optional[float]
+                Value of the leaf from the perspective of the color to move if
+                the game is over in the leaf, None otherwise.
+            """
+        # Start at root
+        path = [0]
+        node = 0
+
+        # Descend through expanded nodes
+        while self.count[node] > 0:
+            node = self.select_child(node)
+            path.append(node)
+            self.board.push(self.decode(self.move[node]))
+
+        # Leaf is pending evaluation by the current batch
+        if self.count[node] == 0:
+            for _ in path[1:]:
+                self.board.pop()
+            return None, list(), None
+
+        # Add virtual loss along path
+        self.pending[path] += 1
+
+        # Score end of game, repetitions within the tree are draws
+        moves = self.board.legal_moves()
+        value = None
+        if not moves:
+            value = -1.0 if self.board.is_in_check(pieces.Color(self.board.color)) else 0.0
+        elif len(path) > 1 and (self.board.is_repetition(count=2) or self.board.is_fifty_moves()):
+            value = 0.0
+
+        # Restore board for terminal leaves, which are not evaluated
+        if value is not None:
+            for _ in path[1:]:
+                self.board.pop()
+
+        # Return result
+        return path, moves, value
+
+    def select_child(self, node: int) -> int:
+        """Select child of node maximising the PUCT score."""
+        # Get children
+        start    = self.children[node]
+        children = slice(start, start + self.count[node])
+        visits   = self.visits [children] + self.pending[children]
+
+        # Average value, counting pending evaluations as losses
+        q = np.where(
+            visits > 0,
+            (self.value[children] - self.virtual_loss * self.pending[children]) / np.maximum(visits, 1),
+            0.0,
+        )
+
+        # Exploration term
+        total = self.visits[node] + self.pending[node]
+        u     = self.c_puct * self.prior[children] * math.sqrt(max(1, total)) / (1 + visits)
+
+        # Return best child
+        return start + int(np.argmax(q + u))
+
+    def backup(self, path: List[int], value: float) -> None:
+        """Back up the value of a leaf from the perspective of the color to
+            move in the leaf, and remove the virtual loss along the path."""
+        # Update nodes from leaf to root, alternating perspectives
+        for node in reversed(path):
+            self.visits [node] += 1
+            self.value  [node] -= value
+            value = -value
+        self.remove_virtual_loss(path)
+
+    def remove_virtual_loss(self, path: List[int]) -> None:
+        """Remove virtual loss along path."""
+        self.pending[path] -= 1
+
+    ########################################################################
+    #                          Auxiliary methods                           #
+    ########################################################################
+
+    def encode(self, move: Move) -> int:
+        """Encode move as a single integer."""
+        n_squares = self.board.n_ranks * self.board.n_files
+        return (
+            (move.src_rank * self.board.n_files + move.src_file) * n_squares +
+            (move.dst_rank * self.board.n_files + move.dst_file)
+        ) * len(PROMOTIONS) + PROMOTIONS.index(move.promotion)
+
+    def decode(self, code: int) -> Move:
+        """Decode move from a single integer."""
+        n_squares       = self.board.n_ranks * self.board.n_files
+        code, promotion = divmod(int(code), len(PROMOTIONS))
+        src, dst        = divmod(code, n_squares)
+        return Move(
+            *divmod(src, self.board.n_files),
+            *divmod(dst, self.board.n_files),
+            PROMOTIONS[promotion],
+        )
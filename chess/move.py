@@ -0,0 +1,27 @@
+from typing import NamedTuple, Optional
+
+class Move(NamedTuple):
+    """Move of a piece from a source square to a destination square.
+
+        Attributes
+        ----------
+        src_rank : int
+            Rank of source square to move from.
+
+        src_file : int
+            File of source square to move from.
+
+        dst_rank : int
+            Rank of destination square to move to.
+
+        dst_file : int
+            File of destination square to move to.
+
+        promotion : Optional[str] ('n'|'b'|'r'|'q')
+            Piece to promote to if the move promotes a pawn, None otherwise.
+        """
+    src_rank  : int
+    src_file  : int
+    dst_rank  : int
+    dst_file  : int
+    promotion : Optional[str] = None
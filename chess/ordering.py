@@ -0,0 +1,208 @@
+import numpy as np
+from typing import List, Optional
+from .      import pieces
+from .board import Board
+from .move  import Move
+
+# Priorities of move categories, a higher category is always searched first
+HASH_MOVE = 1 << 30
+CAPTURE   = 1 << 24
+KILLER    = 1 << 20
+
+class MoveOrdering(object):
+
+    def __init__(
+            self,
+            n_ranks : int = 8,
+            n_files : int = 8,
+            max_ply : int = 128,
+        ):
+        """Order moves such that moves likely to cause a cutoff come first.
+
+            Moves are ordered by the following categories:
+            1. The hash move, i.e., the best move found earlier in the position.
+            2. Captures, most valuable victim first, least valuable attacker
+               second (MVV-LVA). Captures losing material according to static
+               exchange evaluation are searched after all other moves.
+            3. Killer moves, i.e., quiet moves that caused a cutoff at the same
+               ply in a sibling position.
+            4. Quiet moves, ordered by how often they caused cutoffs before
+               (history heuristic).
+
+            Parameters
+            ----------
+            n_ranks : int
+                Number of ranks on chess board.
+
+            n_files : int
+                Number of files on chess board.
+
+            max_ply : int, default=128
+                Maximum ply for which killer moves are stored.
+            """
+        # Set geometry
+        self.n_ranks = n_ranks
+        self.n_files = n_files
+        self.max_ply = max_ply
+
+        # MVV-LVA score indexed by [victim index, attacker index]
+        values = np.asarray([
+            piece(pieces.Color.WHITE).value for piece in (
+                pieces.Pawn, pieces.Knight, pieces.Bishop,
+                pieces.Rook, pieces.Queen , pieces.King,
+            )
+        ] * 2, dtype=np.int32)
+        # Kings cannot be captured, but order a capturing king last
+        values[values == 0] = values.max() + 1
+        self.mvv_lva = 16 * values[:, None] - values[None, :] // 100
+
+        # Two killer moves per ply, encoded as source and destination square
+        self.killers = np.full((max_ply, 2), -1, dtype=np.int32)
+
+        # History score indexed by [piece index, destination square]
+        self.history = np.zeros((12, n_ranks * n_files), dtype=np.int32)
+
+    ########################################################################
+    #                            Order methods                             #
+    ########################################################################
+
+    def order(
+            self,
+            board     : Board,
+            moves     : List[Move],
+            ply       : int,
+            hash_move : Optional[Move] = None,
+        ) -> List[Move]:
+        """Sort moves, from most to least promising.
+
+            Parameters
+            ----------
+            board : Board
+                Board on which moves are made.
+
+            moves : List[Move]
+                Moves to order.
+
+            ply : int
+                Number of plies from the root of the search.
+
+            hash_move : Optional[Move]
+                Best move previously found in this position, if any.
+
+            Returns
+            -------
+            moves : List[Move]
+                Moves ordered such that the most promising move comes first.
+            """
+        return sorted(
+            moves,
+            key     = lambda move: self.score(board, move, ply, hash_move),
+            reverse = True,
+        )
+
+    def score(
+            self,
+            board     : Board,
+            move      : Move,
+            ply       : int,
+            hash_move : Optional[Move] = None,
+        ) -> int:
+        """Score a move for ordering, higher scores are searched first."""
+        # Hash move is searched first
+        if move == hash_move:
+            return HASH_MOVE
+
+        # Get moving piece
+        attacker = board.board[move.src_rank, move.src_file]
+
+        # Score captures by MVV-LVA, en passant always captures a pawn
+        if board.is_capture(move):
+            victim = board.board[move.dst_rank, move.dst_file]
+            score  = int(self.mvv_lva[
+                victim.index if victim is not None else 0,
+                attacker.index,
+            ])
+
+            # Search captures losing material last, static exchange evaluation
+            # is only required if the attacker is worth more than the victim
+            if (
+                    attacker.value > (victim.value if victim is not None else 0)
+                    and board.see(move) < 0
+                ):
+                return score - CAPTURE
+
+            # Return score of capture
+            return CAPTURE + score
+
+        # Score promotions as captures of the promoted piece
+        if move.promotion == 'q':
+            return CAPTURE
+
+        # Score killer moves
+        if ply < self.max_ply and self.encode(move) in self.killers[ply]:
+            return KILLER
+
+        # Score quiet moves by history
+        return int(self.history[
+            attacker.index,
+            move.dst_rank * self.n_files + move.dst_file,
+        ])
+
+    ########################################################################
+    #                            Update methods                            #
+    ########################################################################
+
+    def update(self, board: Board, move: Move, depth: int, ply: int) -> None:
+        """Update killer moves and history after a move caused a cutoff.
+
+            Parameters
+            ----------
+            board : Board
+                Board on which move caused a cutoff, before making the move.
+
+            move : Move
+                Move that caused a cutoff.
+
+            depth : int
+                Remaining depth at which the move caused a cutoff.
+
+            ply : int
+                Number of plies from the root of the search.
+            """
+        # Captures are already ordered well by MVV-LVA
+        if board.is_capture(move):
+            return
+
+        # Store as killer move, keeping the previous killer
+        encoded = self.encode(move)
+        if ply < self.max_ply and self.killers[ply, 0] != encoded:
+            self.killers[ply, 1] = self.killers[ply, 0]
+            self.killers[ply, 0] = encoded
+
+        # Reward move in history, deeper cutoffs are more valuable
+        index = (
+            board.board[move.src_rank, move.src_file].index,
+            move.dst_rank * self.n_files + move.dst_file,
+        )
+        self.history[index] += depth * depth
+
+        # Age history such that scores stay below killer moves
+        if self.history[index] >= KILLER:
+            self.history //= 2
+
+    def clear(self) -> None:
+        """Clear killer moves and history, e.g., before a new game."""
+        self.killers.fill(-1)
+        self.history.fill(0)
+
+    ########################################################################
+    #                          Auxiliary methods                           #
+    ########################################################################
+
+    def encode(self, move: Move) -> int:
+        """Encode move as a single integer from its source and destination."""
+        n_squares = self.n_ranks * self.n_files
+        return (
+            (move.src_rank * self.n_files + move.src_file) * n_squares +
+            (move.dst_rank * self.n_files + move.dst_file)
+        )
@@ -0,0 +1,318 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing    import Dict, Iterator, List, Optional, Tuple
+from .board    import Board
+from .cache    import NodeCache
+from .move     import Move
+from .snapshot import Snapshot
+
+# Starting position
+START = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+def perft(board: Board, depth: int, cache: Optional[NodeCache] = None) -> int:
+    """Count leaf nodes of the legal move tree, used to verify move generation.
+
+        Parameters
+        ----------
+        board : Board
+            Board from which to count, restored afterwards.
+
+        depth : int
+            Depth in plies to count.
+
+        cache : Optional[NodeCache]
+            If given, the count of the position is looked up in this cache. If
+            it is missing, the position is counted per move as in divide(),
+            which stores the count after each move and the total count.
+
+        Returns
+        -------
+        nodes : int
+            Number of positions reachable in exactly depth plies.
+        """
+    # Count the position itself
+    if depth <= 0:
+        return 1
+
+    # Look up cached count, counting per move if it is missing
+    if cache is not None:
+        nodes = cache.get(board.zobrist_hash(), depth)
+        if nodes is None:
+            nodes = sum(divide(board, depth, cache).values())
+        return nodes
+
+    # Get moves
+    moves = board.legal_moves()
+
+    # Moves are fully legal, so the last ply needs no moves to be made
+    if depth == 1:
+        return len(moves)
+
+    # Count nodes of all moves
+    nodes = 0
+    for move in moves:
+        board.push(move)
+        try:
+            nodes += perft(board, depth-1)
+        finally:
+            board.pop()
+
+    # Return result
+    return nodes
+
+def divide(
+        board : Board,
+        depth : int,
+        cache : Optional[NodeCache] = None,
+    ) -> Dict[Move, int]:
+    """Count leaf nodes of the legal move tree per root move.
+
+        Parameters
+        ----------
+        board : Board
+            Board from which to count, restored afterwards.
+
+        depth : int
+            Depth in plies to count, at least 1.
+
+        cache : Optional[NodeCache]
+            If given, the count after each move is looked up in and stored to
+            this cache, and the total count is stored as well.
+
+        Returns
+        -------
+        nodes : Dict[Move, int]
+            Number of positions reachable in exactly depth plies per move.
+        """
+    # Initialise result
+    result = dict()
+
+    # Count nodes of each move
+    for move in board.legal_moves():
+        board.push(move)
+        try:
+            result[move] = lookup(board, depth-1, cache)
+        finally:
+            board.pop()
+
+    # Store total count
+    if cache is not None:
+        cache.set(board.zobrist_hash(), depth, sum(result.values()))
+
+    # Return result
+    return result
+
+def lookup(board: Board, depth: int, cache: Optional[NodeCache] = None) -> int:
+    """Count leaf nodes, only looking up and storing the count of the
+        position itself in the cache."""
+    # Count without cache
+    if cache is None or depth <= 0:
+        return perft(board, depth)
+
+    # Look up cached count
+    nodes = cache.get(board.zobrist_hash(), depth)
+    if nodes is None:
+        nodes = perft(board, depth)
+        cache.set(board.zobrist_hash(), depth, nodes)
+    return nodes
+
+################################################################################
+#                               Parallel counting                              #
+################################################################################
+
+def count(state: Snapshot, depth: int) -> int:
+    """Count leaf nodes from a snapshot, executed in a worker process."""
+    return perft(Board.from_snapshot(state), depth)
+
+def tasks(
+        board : Board,
+        depth : int,
+        split : int,
+        moves : Optional[List[Move]] = None,
+    ) -> Iterator[Tuple[Move, Snapshot, int]]:
+    """Split the tree into subtrees below the first split plies.
+
+        Tasks are generated lazily, such that workers can start on the first
+        tasks while the remaining ones are created. The board must not be
+        modified while the generator is suspended.
+
+        Parameters
+        ----------
+        board : Board
+            Board from which to count, restored afterwards.
+
+        depth : int
+            Depth in plies to count, greater than split.
+
+        split : int (1|2)
+            Number of plies to expand before creating tasks.
+
+        moves : Optional[List[Move]]
+            If given, only create tasks for these root moves, by default for
+            all legal moves.
+
+        Yields
+        ------
+        task : Tuple[Move, Snapshot, int]
+            Root move, snapshot of the position to count from and the
+            remaining depth of the task.
+        """
+    # Create a task per root move, or per reply to each root move
+    for move in (moves if moves is not None else board.legal_moves()):
+        board.push(move)
+        try:
+            if split == 1:
+                yield move, board.snapshot(), depth-1
+            else:
+                for reply in board.legal_moves():
+                    board.push(reply)
+                    try:
+                        yield move, board.snapshot(), depth-2
+                    finally:
+                        board.pop()
+        finally:
+            board.pop()
+
+def parallel_divide(
+        board : Board,
+        depth : int,
+        jobs  : int,
+        split : Optional[int] = None,
+        cache : Optional[NodeCache] = None,
+    ) -> Dict[Move, int]:
+    """Count leaf nodes per root move using a pool of processes.
+
+        The tree is split into one task per root move, or per reply to each
+        root move, and tasks are handed to whichever worker is idle, such that
+        large subtrees do not leave other workers waiting. The counts of all
+        tasks are summed per root move.
+
+        Parameters
+        ----------
+        board : Board
+            Board from which to count, restored afterwards.
+
+        depth : int
+            Depth in plies to count, at least 1.
+
+        jobs : int
+            Number of worker processes.
+
+        split : Optional[int] (1|2)
+            Number of plies to expand before creating tasks. By default,
+            replies are expanded if there are fewer than 4 root moves per
+            worker and the depth allows it.
+
+        cache : Optional[NodeCache]
+            If given, the count after each root move is looked up in and
+            stored to this cache by the main process, and the total count is
+            stored as well.
+
+        Returns
+        -------
+        nodes : Dict[Move, int]
+            Number of positions reachable in exactly depth plies per move.
+        """
+    # Count small trees without a pool
+    if depth <= 1:
+        return divide(board, depth, cache)
+
+    # Initialise result with cached counts
+    result = dict()
+    for move in board.legal_moves():
+        board.push(move)
+        try:
+            result[move] = cache.get(board.zobrist_hash(), depth-1) if cache is not None else None
+        finally:
+            board.pop()
+    missing = [move for move, nodes in result.items() if nodes is None]
+
+    # Choose where to split the tree
+    if split is None:
+        split = 2 if depth > 2 and len(missing) < 4 * jobs else 1
+    split = min(split, depth-1)
+
+    # Count missing root moves in the pool, if any, submitting tasks as they
+    # are created such that workers start immediately
+    for move in missing:
+        result[move] = 0
+    if missing:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(count, state, remaining): move
+                for move, state, remaining in tasks(board, depth, split, missing)
+            }
+            for future in as_completed(futures):
+                result[futures[future]] += future.result()
+
+    # Store counts of root moves and the total count
+    if cache is not None:
+        for move in missing:
+            board.push(move)
+            try:
+                cache.set(board.zobrist_hash(), depth-1, result[move])
+            finally:
+                board.pop()
+        cache.set(board.zobrist_hash(), depth, sum(result.values()))
+
+    # Return result
+    return result
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Count legal move tree nodes")
+    parser.add_argument('depth'       , type=int, help="depth in plies")
+    parser.add_argument('--fen'       , default=START, help="position to count from")
+    parser.add_argument('--file'      , help="count every FEN in file, one per line, '-' for stdin")
+    parser.add_argument('--divide'    , action='store_true', help="count per root move")
+    parser.add_argument('--cache'     , help="path of node count cache")
+    parser.add_argument('--cache-size', type=int, default=1_000_000, help="maximum number of cached counts")
+    parser.add_argument('--no-cache'  , action='store_true', help="do not use the node count cache")
+    parser.add_argument('--jobs'      , type=int, default=1, help="number of worker processes")
+    parser.add_argument('--split'     , type=int, choices=(1, 2), help="plies to expand before creating tasks")
+    args = parser.parse_args()
+
+    # Get positions
+    if args.file is None:
+        fens = [args.fen]
+    else:
+        with (sys.stdin if args.file == '-' else open(args.file)) as infile:
+            fens = [line.strip() for line in infile if line.strip()]
+
+    # Open cache
+    cache = None
+    if not args.no_cache:
+        cache = NodeCache(args.cache, max_entries=args.cache_size)
+
+    try:
+        for fen in fens:
+            # Load board
+            board = Board.from_fen(fen)
+            start = time.perf_counter()
+
+            # Count nodes per move, in parallel or if required
+            if args.jobs > 1 or args.divide:
+                if args.jobs > 1:
+                    counts = parallel_divide(board, args.depth, args.jobs, args.split, cache)
+                else:
+                    counts = divide(board, args.depth, cache)
+                if args.divide:
+                    for move, nodes in counts.items():
+                        print(f"{board.uci(move)}: {nodes}")
+                nodes = sum(counts.values())
+            else:
+                nodes = perft(board, args.depth, cache)
+
+            # Print result
+            elapsed = time.perf_counter() - start
+            print(
+                (f"{fen}: " if args.file is not None else '') +
+                f"nodes {nodes} time {elapsed:.3f}s nps {nodes / max(elapsed, 1e-9):.0f}"
+            )
+
+    # Close cache
+    finally:
+        if cache is not None:
+            cache.close()
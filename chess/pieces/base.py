@@ -1,3 +1,4 @@
+from . import geometry
 from enum import Enum
 import numpy as np
 
@@ -5,6 +6,11 @@ class Color(Enum):
     WHITE = 'w'
     BLACK = 'b'
 
+    @property
+    def opposite(self):
+        """Return the opposite color."""
+        return Color.BLACK if self == Color.WHITE else Color.WHITE
+
 class PieceRepresentation(Enum):
     # Regular piece representations
     BISHOP = 'B'
@@ -22,8 +28,21 @@ class PieceRepresentation(Enum):
     UNICODE_QUEEN  = '♕'
     UNICODE_ROOK   = '♖'
 
+# Order of piece types used to index pieces
+PIECES = [
+    PieceRepresentation.PAWN,
+    PieceRepresentation.KNIGHT,
+    PieceRepresentation.BISHOP,
+    PieceRepresentation.ROOK,
+    PieceRepresentation.QUEEN,
+    PieceRepresentation.KING,
+]
+
 class Piece(object):
 
+    # Material value of piece in centipawns
+    value = 0
+
     def __init__(self, color, symbol, n_files=8, n_ranks=8):
         """Initialise chess piece, sets color of piece."""
         # Check if color is corredt
@@ -33,10 +52,16 @@ class Piece(object):
         self.color  = color
         self.symbol = symbol
 
+        # Set index of piece, unique for each combination of symbol and color
+        self.index = PIECES.index(symbol) + len(PIECES) * (color == Color.BLACK)
+
         # Set files and ranks
         self.n_files = n_files
         self.n_ranks = n_ranks
 
+        # Set move tables of board size
+        self.geometry = geometry.get(n_ranks, n_files)
+
 
     def moves(self, rank, file, mask_black=None, mask_white=None):
         """Return the possible moves for a piece on a given rank and file.
@@ -66,6 +91,33 @@ class Piece(object):
     #                       Auxiliary move functions                       #
     ########################################################################
 
+    def masks(self, mask_black=None, mask_white=None):
+        """Return masks of own pieces and of all pieces on the board.
+
+            Parameters
+            ----------
+            mask_black : np.array of shape=(n_ranks, n_files), optional
+                Optional mask indicating location of black pieces on board.
+
+            mask_white : np.array of shape=(n_ranks, n_files), optional
+                Optional mask indicating location of white pieces on board.
+
+            Returns
+            -------
+            own : np.array of shape=(n_ranks, n_files)
+                Mask of pieces with the same color as this piece.
+
+            occupied : np.array of shape=(n_ranks, n_files)
+                Mask of all pieces.
+            """
+        # Replace missing masks by empty masks
+        empty = np.zeros((self.n_ranks, self.n_files), dtype=bool)
+        black = empty if mask_black is None else mask_black
+        white = empty if mask_white is None else mask_white
+
+        # Return result
+        return white if self.color == Color.WHITE else black, black | white
+
     def capture_mask(self, index, black, white):
         # Perform check
         assert black.shape == white.shape, "Black and white should be of same shape."
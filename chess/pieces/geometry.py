@@ -0,0 +1,155 @@
+import numpy as np
+from functools import lru_cache
+
+# Directions as (delta rank, delta file) in which pieces move
+ORTHOGONAL = ((-1,  0), ( 1, 0), (0, -1), (0, 1))
+DIAGONAL   = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+KNIGHT     = (
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    ( 1, -2), ( 1, 2), ( 2, -1), ( 2, 1),
+)
+
+class Geometry(object):
+
+    def __init__(self, n_ranks : int = 8, n_files : int = 8):
+        """Precomputed move tables for a board of a given size.
+
+            Tables are computed once per board size, such that pieces only
+            combine them with the occupancy of the board instead of building
+            their moves from scratch. Boards need not be square, e.g., 10x8 or
+            10x10 variants use the same tables as standard chess.
+
+            Parameters
+            ----------
+            n_ranks : int
+                Number of ranks on chess board.
+
+            n_files : int
+                Number of files on chess board.
+            """
+        # Set geometry
+        self.n_ranks = n_ranks
+        self.n_files = n_files
+
+        # Masks of knight and king moves indexed by [rank, file]
+        self.knight = self.leaper(KNIGHT)
+        self.king   = self.leaper(ORTHOGONAL + DIAGONAL)
+
+        # Flat indices of squares along a ray indexed by [direction][rank, file]
+        self.rays = {
+            direction: [[self.ray(rank, file, direction)
+                for file in range(n_files)]
+                for rank in range(n_ranks)]
+            for direction in ORTHOGONAL + DIAGONAL
+        }
+
+    ########################################################################
+    #                            Table methods                             #
+    ########################################################################
+
+    def leaper(self, deltas) -> np.ndarray:
+        """Compute masks of squares reached by a single step in any direction.
+
+            Parameters
+            ----------
+            deltas : Iterable[Tuple[int, int]]
+                Steps as (delta rank, delta file).
+
+            Returns
+            -------
+            masks : np.ndarray of shape=(n_ranks, n_files, n_ranks, n_files)
+                Mask of squares reached from each square.
+            """
+        # Initialise result
+        result = np.zeros(
+            (self.n_ranks, self.n_files, self.n_ranks, self.n_files),
+            dtype = bool,
+        )
+
+        # Add each step that stays on the board
+        for rank in range(self.n_ranks):
+            for file in range(self.n_files):
+                for delta_rank, delta_file in deltas:
+                    if (
+                            0 <= rank + delta_rank < self.n_ranks and
+                            0 <= file + delta_file < self.n_files
+                        ):
+                        result[rank, file, rank+delta_rank, file+delta_file] = True
+
+        # Return result
+        return result
+
+    def ray(self, rank : int, file : int, direction) -> np.ndarray:
+        """Compute flat indices of squares from a square towards the edge."""
+        # Initialise result
+        result = list()
+
+        # Walk in direction until the edge of the board
+        rank, file = rank + direction[0], file + direction[1]
+        while 0 <= rank < self.n_ranks and 0 <= file < self.n_files:
+            result.append(rank * self.n_files + file)
+            rank, file = rank + direction[0], file + direction[1]
+
+        # Return result
+        return np.asarray(result, dtype=np.intp)
+
+    ########################################################################
+    #                             Move methods                             #
+    ########################################################################
+
+    def slide(
+            self,
+            rank       : int,
+            file       : int,
+            directions,
+            own        : np.ndarray,
+            occupied   : np.ndarray,
+        ) -> np.ndarray:
+        """Compute moves of a sliding piece.
+
+            Parameters
+            ----------
+            rank : int
+                Rank of piece.
+
+            file : int
+                File of piece.
+
+            directions : Iterable[Tuple[int, int]]
+                Directions in which the piece slides.
+
+            own : np.ndarray of shape=(n_ranks, n_files)
+                Mask of pieces of the same color as the sliding piece.
+
+            occupied : np.ndarray of shape=(n_ranks, n_files)
+                Mask of all pieces on the board.
+
+            Returns
+            -------
+            moves : np.ndarray of shape=(n_ranks, n_files)
+                Mask of squares up to and including the first piece in each
+                direction, excluding pieces of the same color.
+            """
+        # Initialise result
+        result = np.zeros(self.n_ranks * self.n_files, dtype=bool)
+
+        # Get flat masks
+        own      = own     .reshape(-1)
+        occupied = occupied.reshape(-1)
+
+        # Add squares of each ray up to and including the first blocker
+        for direction in directions:
+            ray      = self.rays[direction][rank][file]
+            blockers = np.flatnonzero(occupied[ray])
+            if blockers.size:
+                ray = ray[:blockers[0]+1]
+            result[ray] = True
+
+        # Remove own pieces and return as board
+        result &= ~own
+        return result.reshape(self.n_ranks, self.n_files)
+
+@lru_cache(maxsize=None)
+def get(n_ranks : int = 8, n_files : int = 8) -> Geometry:
+    """Get the move tables for a given board size, created once per size."""
+    return Geometry(n_ranks, n_files)
@@ -1,8 +1,10 @@
 from .base import Color, Piece, PieceRepresentation
-import numpy as np
 
 class King(Piece):
 
+    # Material value of piece in centipawns
+    value = 0
+
     def __init__(self, color, *args, **kwargs):
         """Initialise bishop, sets color of piece."""
         # Initialise bishop with correct symbol
@@ -42,48 +44,27 @@ class King(Piece):
             moves : np.array of shape=(n_ranks, n_files)
                 Mask of available moves on board.
             """
-        # Initialise result
-        result = np.zeros((self.n_ranks, self.n_files), dtype=bool)
-
-        # Get mask of other pieces
-        other_pieces = np.zeros((self.n_ranks, self.n_files), dtype=bool)
-        if mask_black is not None:
-            other_pieces = np.logical_or(other_pieces, mask_black)
-        if mask_white is not None:
-            other_pieces = np.logical_or(other_pieces, mask_white)
-
-        # Set squares surrounding king to True
-        result[
-            max(0, rank-1) : rank+2,
-            max(0, file-1) : file+2,
-        ] = True
-
-        # Add castling moves
-        if 'K' in castling and self.color == Color.WHITE:
-            assert rank == self.n_ranks-1 and file == 4, "Cannot castle, king has moved!"
-            if not other_pieces[rank, file+1]:
+        # Get own and all pieces
+        own, occupied = self.masks(mask_black, mask_white)
+
+        # Get precomputed king moves
+        result = self.geometry.king[rank, file].copy()
+
+        # Add castling moves, the king moves two squares towards the rook in
+        # the corner of its own rank, wherever it starts on that rank
+        home = self.n_ranks-1 if self.color == Color.WHITE else 0
+        king_side, queen_side = ('K', 'Q') if self.color == Color.WHITE else ('k', 'q')
+        if king_side in castling:
+            assert rank == home, "Cannot castle, king has moved!"
+            if file+2 < self.n_files-1 and not occupied[rank, file+1:self.n_files-1].any():
                 result[rank, file+2] = True
-        if 'Q' in castling and self.color == Color.WHITE:
-            assert rank == self.n_ranks-1 and file == 4, "Cannot castle, king has moved!"
-            if not other_pieces[rank, file-1]:
-                result[rank, file-2] = True
-        if 'k' in castling and self.color == Color.BLACK:
-            assert rank == 0 and file == 4, "Cannot castle, king has moved!"
-            if not other_pieces[rank, file+1]:
-                result[rank, file+2] = True
-        if 'q' in castling and self.color == Color.BLACK:
-            assert rank == 0 and file == 4, "Cannot castle, king has moved!"
-            if not other_pieces[rank, file-1]:
+        if queen_side in castling:
+            assert rank == home, "Cannot castle, king has moved!"
+            if file-2 > 0 and not occupied[rank, 1:file].any():
                 result[rank, file-2] = True
 
         # Ensure king does not capture own pieces
-        if mask_white is not None and self.color == Color.WHITE:
-            result = np.logical_and(result, ~mask_white)
-        if mask_black is not None and self.color == Color.BLACK:
-            result = np.logical_and(result, ~mask_black)
-
-        # Remove own rank and file as moves
-        result[rank, file] = False
+        result &= ~own
 
         # Return result
         return result
@@ -1,8 +1,10 @@
-from .base import Color, Piece, PieceRepresentation
-import numpy as np
+from .base import Piece, PieceRepresentation
 
 class Knight(Piece):
 
+    # Material value of piece in centipawns
+    value = 320
+
     def __init__(self, color, *args, **kwargs):
         """Initialise bishop, sets color of piece."""
         # Initialise bishop with correct symbol
@@ -39,36 +41,11 @@ class Knight(Piece):
             moves : np.array of shape=(n_ranks, n_files)
                 Mask of available moves on board.
             """
-        # Initialise result
-        result = np.zeros((self.n_ranks, self.n_files), dtype=bool)
-
-        # Set squares surrounding knight to True
-        result[
-            max(0, rank-2) : rank+3,
-            max(0, file-2) : file+3,
-        ] = True
-
-        # Remove "queen" moves
-        # Set complete file and rank as possible moves
-        result[rank, :] = False
-        result[:, file] = False
-
-        # Set diagonals as possible moves
-        diagonal_lr = ~np.eye(self.n_files, self.n_ranks, file-rank, dtype=bool)
-        diagonal_rl = np.flip(~np.eye(
-            self.n_files,
-            self.n_ranks,
-            self.n_ranks-1 - rank - file,
-            dtype=bool
-        ), axis=1)
-        result = np.logical_and(result, diagonal_lr)
-        result = np.logical_and(result, diagonal_rl)
+        # Get own pieces
+        own, _ = self.masks(mask_black, mask_white)
 
-        # Ensure knight does not capture own pieces
-        if mask_white is not None and self.color == Color.WHITE:
-            result = np.logical_and(result, ~mask_white)
-        if mask_black is not None and self.color == Color.BLACK:
-            result = np.logical_and(result, ~mask_black)
+        # Get precomputed knight moves, knight does not capture own pieces
+        result = self.geometry.knight[rank, file] & ~own
 
         # Return result
         return result
@@ -3,6 +3,9 @@ import numpy as np
 
 class Pawn(Piece):
 
+    # Material value of piece in centipawns
+    value = 100
+
     def __init__(self, color, *args, **kwargs):
         """Initialise bishop, sets color of piece."""
         # Initialise bishop with correct symbol
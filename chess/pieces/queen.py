@@ -1,8 +1,11 @@
+from .     import geometry
 from .base import Piece, PieceRepresentation
-import numpy as np
 
 class Queen(Piece):
 
+    # Material value of piece in centipawns
+    value = 900
+
     def __init__(self, color, *args, **kwargs):
         """Initialise bishop, sets color of piece."""
         # Initialise bishop with correct symbol
@@ -39,39 +42,13 @@ class Queen(Piece):
             moves : np.array of shape=(n_ranks, n_files)
                 Mask of available moves on board.
             """
-        # Initialise result
-        result = np.zeros((self.n_ranks, self.n_files), dtype=bool)
-
-        # Set file as possible moves
-        result[rank, :] = self.capture_mask(
-            index = file,
-            black = mask_black[rank, :],
-            white = mask_white[rank, :],
-        )
+        # Get own and all pieces
+        own, occupied = self.masks(mask_black, mask_white)
 
-        # Set rank as possible moves
-        result[:, file] = self.capture_mask(
-            index = rank,
-            black = mask_black[:, file],
-            white = mask_white[:, file],
+        # Slide along rank, file and diagonals
+        result = self.geometry.slide(
+            rank, file, geometry.ORTHOGONAL + geometry.DIAGONAL, own, occupied,
         )
 
-        # Set black side -> white side diagonal as possible moves
-        result = np.logical_or(result, np.diag(self.capture_mask(
-            index = min(rank, file),
-            black = np.diag(mask_black, file-rank),
-            white = np.diag(mask_white, file-rank),
-        ), file-rank))
-
-        # Set white side -> black side diagonal as possible moves
-        result = np.logical_or(result, np.flip(np.diag(self.capture_mask(
-            index = min(rank, self.n_files - file - 1),
-            black = np.diag(np.flip(mask_black, axis=1), self.n_ranks-1 - rank - file),
-            white = np.diag(np.flip(mask_white, axis=1), self.n_ranks-1 - rank - file),
-        ), self.n_ranks-1 - rank - file), axis=1))
-
-        # Remove own rank and file as moves
-        result[rank, file] = False
-
         # Return result
         return result
@@ -1,8 +1,11 @@
+from .     import geometry
 from .base import Piece, PieceRepresentation
-import numpy as np
 
 class Rook(Piece):
 
+    # Material value of piece in centipawns
+    value = 500
+
     def __init__(self, color, *args, **kwargs):
         """Initialise bishop, sets color of piece."""
         # Initialise bishop with correct symbol
@@ -39,25 +42,11 @@ class Rook(Piece):
             moves : np.array of shape=(n_ranks, n_files)
                 Mask of available moves on board.
             """
-        # Initialise result
-        result = np.zeros((self.n_ranks, self.n_files), dtype=bool)
-
-        # Set file as possible moves
-        result[rank, :] = self.capture_mask(
-            index = file,
-            black = mask_black[rank, :],
-            white = mask_white[rank, :],
-        )
-
-        # Set rank as possible moves
-        result[:, file] = self.capture_mask(
-            index = rank,
-            black = mask_black[:, file],
-            white = mask_white[:, file],
-        )
+        # Get own and all pieces
+        own, occupied = self.masks(mask_black, mask_white)
 
-        # Remove own rank and file as moves
-        result[rank, file] = False
+        # Slide along rank and file
+        result = self.geometry.slide(rank, file, geometry.ORTHOGONAL, own, occupied)
 
         # Return result
         return result
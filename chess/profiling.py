@@ -0,0 +1,242 @@
+import functools
+import json
+import time
+from typing  import Dict, Optional
+from .       import pieces
+from .board  import Board
+from .search import Search
+
+class Profiler(object):
+
+    def __init__(self):
+        """Count calls and time phases of move generation and search.
+
+            Instrumentation is opt-in: functions are only wrapped while the
+            profiler is enabled, so a disabled profiler costs nothing. The
+            profiler can be used as a context manager::
+
+                with Profiler() as profiler:
+                    Search(board).run(depth=3)
+                profiler.to_json('profile.json')
+
+            Counters
+            --------
+            nodes : Nodes visited by the search, including quiescence nodes.
+            moves_{piece} : Calls of Piece.moves() per piece type.
+            mask_rebuilds : Calls of Board.piece_mask() for a single color,
+                            a mask of both colors counts as 2 rebuilds.
+            tt_hits, tt_misses : Lookups of a best move for a position hash.
+
+            Phases
+            ------
+            generate : Time spent in Board.move_masks() and
+                       Board.select_moves(), used by Board.legal_moves() and
+                       Board.iter_moves().
+            make : Time spent in Board.push() and Board.pop().
+            evaluate : Time spent in Search.evaluate().
+
+            Note
+            ----
+            Phase times are inclusive, legality checks of en passant captures
+            during move generation make moves, so time spent in make may also
+            be counted in generate.
+            """
+        # Initialise counters and timers
+        self.counters = dict()
+        self.timers   = dict()
+        self.calls    = dict()
+
+        # Original functions replaced while enabled
+        self.originals = list()
+
+    ########################################################################
+    #                        Enable/disable methods                        #
+    ########################################################################
+
+    def enable(self) -> 'Profiler':
+        """Instrument move generation and search."""
+        # Check if already enabled
+        if self.originals:
+            return self
+
+        # Count moves calls per piece type
+        for piece in (
+                pieces.Bishop, pieces.King, pieces.Knight,
+                pieces.Pawn  , pieces.Queen, pieces.Rook,
+            ):
+            self.count_calls(piece, 'moves', f"moves_{piece.__name__.lower()}")
+
+        # Count mask rebuilds per color, as a mask of both colors is combined
+        # from the masks of each color
+        self.count_calls(
+            Board, 'piece_mask', 'mask_rebuilds',
+            when = lambda board, color=None: color is not None,
+        )
+
+        # Count search nodes
+        self.count_calls(Search, 'negamax'   , 'nodes')
+        self.count_calls(Search, 'quiescence', 'nodes')
+
+        # Count lookups of position hashes
+        self.count_lookup(Search, 'probe', 'tt_hits', 'tt_misses')
+
+        # Time phases
+        self.time_phase(Board , 'move_masks'  , 'generate')
+        self.time_phase(Board , 'select_moves', 'generate')
+        self.time_phase(Board , 'push'        , 'make')
+        self.time_phase(Board , 'pop'         , 'make')
+        self.time_phase(Search, 'evaluate'    , 'evaluate')
+
+        # Return self
+        return self
+
+    def disable(self) -> 'Profiler':
+        """Remove all instrumentation, restoring the original functions."""
+        # Restore original functions in reverse order
+        while self.originals:
+            cls, name, function = self.originals.pop()
+            setattr(cls, name, function)
+
+        # Return self
+        return self
+
+    def reset(self) -> 'Profiler':
+        """Clear all counters and timers."""
+        self.counters.clear()
+        self.timers  .clear()
+        self.calls   .clear()
+        return self
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, type, value, traceback):
+        self.disable()
+
+    ########################################################################
+    #                           Wrapping methods                           #
+    ########################################################################
+
+    def wrap(self, cls, name, wrapper):
+        """Replace function of class by wrapper of the original function."""
+        # Store original function
+        original = cls.__dict__[name]
+        self.originals.append((cls, name, original))
+        # Replace function
+        setattr(cls, name, functools.wraps(original)(wrapper(original)))
+
+    def count_calls(self, cls, name, counter, when=None):
+        """Count calls of a function, only those for which when() returns
+            True with the arguments of the call, if given."""
+        def wrapper(function):
+            def wrapped(*args, **kwargs):
+                if when is None or when(*args, **kwargs):
+                    self.counters[counter] = self.counters.get(counter, 0) + 1
+                return function(*args, **kwargs)
+            return wrapped
+        self.wrap(cls, name, wrapper)
+
+    def count_lookup(self, cls, name, hits, misses):
+        """Count calls of a function returning None (miss) or a value (hit)."""
+        def wrapper(function):
+            def wrapped(*args, **kwargs):
+                result  = function(*args, **kwargs)
+                counter = misses if result is None else hits
+                self.counters[counter] = self.counters.get(counter, 0) + 1
+                return result
+            return wrapped
+        self.wrap(cls, name, wrapper)
+
+    def time_phase(self, cls, name, phase):
+        """Time calls of a function as part of a phase."""
+        def wrapper(function):
+            def wrapped(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.timers[phase] = self.timers.get(phase, 0) + time.perf_counter() - start
+                    self.calls [phase] = self.calls .get(phase, 0) + 1
+            return wrapped
+        self.wrap(cls, name, wrapper)
+
+    ########################################################################
+    #                            Export methods                            #
+    ########################################################################
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return all counters and timers as a dictionary."""
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'seconds' : dict(sorted(self.timers  .items())),
+            'calls'   : dict(sorted(self.calls   .items())),
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Export counters and timers as JSON.
+
+            Parameters
+            ----------
+            path : Optional[str]
+                If given, write JSON to this file.
+
+            Returns
+            -------
+            json : str
+                JSON representation of counters and timers.
+            """
+        # Create JSON
+        result = json.dumps(self.to_dict(), indent=4)
+
+        # Write to file, if required
+        if path is not None:
+            with open(path, 'w') as outfile:
+                outfile.write(result + '\n')
+
+        # Return result
+        return result
+
+    def to_prometheus(self, path: Optional[str] = None) -> str:
+        """Export counters and timers in the Prometheus text format, e.g., to
+            be collected by the node exporter textfile collector.
+
+            Parameters
+            ----------
+            path : Optional[str]
+                If given, write metrics to this file.
+
+            Returns
+            -------
+            metrics : str
+                Metrics in Prometheus text format.
+            """
+        # Initialise result
+        lines = list()
+
+        # Add counters
+        lines.append("# HELP chess_events_total Number of profiled events.")
+        lines.append("# TYPE chess_events_total counter")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'chess_events_total{{event="{name}"}} {value}')
+
+        # Add timers
+        lines.append("# HELP chess_phase_seconds_total Time spent per phase.")
+        lines.append("# TYPE chess_phase_seconds_total counter")
+        for name, value in sorted(self.timers.items()):
+            lines.append(f'chess_phase_seconds_total{{phase="{name}"}} {value:.9f}')
+
+        lines.append("# HELP chess_phase_calls_total Number of calls per phase.")
+        lines.append("# TYPE chess_phase_calls_total counter")
+        for name, value in sorted(self.calls.items()):
+            lines.append(f'chess_phase_calls_total{{phase="{name}"}} {value}')
+
+        # Create result
+        result = '\n'.join(lines) + '\n'
+
+        # Write to file, if required
+        if path is not None:
+            with open(path, 'w') as outfile:
+                outfile.write(result)
+
+        # Return result
+        return result
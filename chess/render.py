@@ -0,0 +1,190 @@
+import itertools
+import sys
+from functools    import lru_cache
+from typing       import Iterable, Iterator, Optional, TextIO
+from .pieces.base import PIECES, PieceRepresentation
+
+class Renderer(object):
+
+    def __init__(self, n_ranks : int = 8, n_files : int = 8, unicode : bool = False):
+        """Precomputed text rendering of boards of a given size.
+
+            Borders and the cell of every piece are formatted once, such that
+            rendering a board only looks up its cells and joins them into rows.
+
+            Parameters
+            ----------
+            n_ranks : int
+                Number of ranks on chess board.
+
+            n_files : int
+                Number of files on chess board.
+
+            unicode : bool, default=False
+                If True, draw pieces using their Unicode symbols instead of
+                letters.
+            """
+        # Set dimensions
+        self.n_ranks = n_ranks
+        self.n_files = n_files
+        self.width   = 4 * n_files + 1
+
+        # Borders between ranks
+        self.top       = "╔" + "╤".join(["═══"] * n_files) + "╗"
+        self.separator = "╟" + "┼".join(["───"] * n_files) + "╢"
+        self.bottom    = "╚" + "╧".join(["═══"] * n_files) + "╝"
+        self.blank     = " " * self.width
+
+        # Cells indexed by piece index, highlighted cells are used for
+        # destination squares of moves
+        symbols     = [self.symbol(index, unicode) for index in range(2 * len(PIECES))]
+        self.cells  = [f" {symbol} " for symbol in symbols]
+        self.marked = [f"[{symbol}]" for symbol in symbols]
+        self.empty  = "   "
+        self.target = " . "
+
+    @staticmethod
+    def symbol(index: int, unicode: bool) -> str:
+        """Return symbol of piece with a given index."""
+        # Get piece type and color
+        piece = PIECES[index % len(PIECES)]
+        black = index >= len(PIECES)
+
+        # Unicode symbols of black pieces follow those of white pieces
+        if unicode:
+            symbol = PieceRepresentation[f"UNICODE_{piece.name}"].value
+            return chr(ord(symbol) + 6) if black else symbol
+
+        # Letters of black pieces are lowercase
+        return piece.value.lower() if black else piece.value
+
+    ########################################################################
+    #                            Render methods                            #
+    ########################################################################
+
+    def lines(self, board, moves=None) -> Iterator[str]:
+        """Iterate over the lines of a rendered board.
+
+            Parameters
+            ----------
+            board : Board
+                Board to render.
+
+            moves : Optional[np.ndarray]
+                If given, boolean mask of squares to highlight, e.g., the
+                destination squares of a piece.
+
+            Yields
+            ------
+            line : str
+                Line of rendered board, without newline.
+            """
+        # Get cells
+        cells  = self.cells
+        marked = self.marked
+        empty  = self.empty
+        target = self.target
+
+        # Yield top border
+        yield self.top
+
+        # Yield ranks
+        highlight = moves.tolist() if moves is not None else None
+        for rank, row in enumerate(board.board.tolist()):
+            # Render squares of rank
+            if highlight is None:
+                squares = [empty if piece is None else cells[piece.index] for piece in row]
+            else:
+                squares = [
+                    (target if piece is None else marked[piece.index]) if mark else
+                    (empty  if piece is None else cells [piece.index])
+                    for piece, mark in zip(row, highlight[rank])
+                ]
+            yield "║" + "│".join(squares) + "║"
+
+            # Yield border below rank
+            yield self.separator if rank < self.n_ranks - 1 else self.bottom
+
+    def render(self, board, moves=None) -> str:
+        """Render a board as a string, see lines()."""
+        return "\n".join(self.lines(board, moves))
+
+@lru_cache(maxsize=None)
+def get(n_ranks : int = 8, n_files : int = 8, unicode : bool = False) -> Renderer:
+    """Get the renderer for a given board size, created once per size."""
+    return Renderer(n_ranks, n_files, unicode)
+
+################################################################################
+#                               Stream boards                                  #
+################################################################################
+
+def write_boards(
+        boards    : Iterable,
+        file      : Optional[TextIO] = None,
+        columns   : Optional[int] = None,
+        separator : str  = ' ',
+        end       : str  = '\n',
+        unicode   : bool = False,
+    ) -> None:
+    """Write boards side by side to a file object.
+
+        Boards are consumed lazily and written one line at a time, such that
+        many boards can be streamed without building the output in memory.
+
+        Parameters
+        ----------
+        boards : Iterable[Union[Board, str]]
+            Boards to write, strings are taken as already rendered boards.
+
+        file : Optional[TextIO]
+            File object to write to, defaults to sys.stdout.
+
+        columns : Optional[int]
+            If given, maximum number of boards per row, otherwise all boards
+            are written on a single row.
+
+        separator : str, default=' '
+            Separator between boards on the same row.
+
+        end : str, default='\\n'
+            Written after the last line of every row of boards.
+
+        unicode : bool, default=False
+            If True, draw pieces using their Unicode symbols.
+        """
+    # Default to standard output
+    file   = file if file is not None else sys.stdout
+    boards = iter(boards)
+
+    # Loop over rows of boards
+    while True:
+        row = list(itertools.islice(boards, columns))
+        if not row:
+            break
+
+        # Get lines of each board and padding of shorter boards
+        lines   = list()
+        padding = list()
+        for board in row:
+            if isinstance(board, str):
+                lines  .append(board.split('\n'))
+                padding.append(' ' * len(lines[-1][0]))
+            else:
+                renderer = get(board.n_ranks, board.n_files, unicode)
+                lines  .append(renderer.lines(board))
+                padding.append(renderer.blank)
+
+        # Write row line by line
+        previous = None
+        for line in itertools.zip_longest(*lines):
+            if previous is not None:
+                file.write(previous + '\n')
+            previous = separator.join([
+                text if text is not None else blank
+                for text, blank in zip(line, padding)
+            ])
+        file.write(previous + end)
+
+        # Stop after a single row if no columns were given
+        if columns is None:
+            break
@@ -0,0 +1,536 @@
+import threading
+from typing    import Callable, Iterator, List, Optional, Tuple
+from .         import pieces
+from .board    import Board
+from .move     import Move
+from .ordering import KILLER, HASH_MOVE, MoveOrdering
+from .timeman  import TimeManager
+
+# Score of a checkmate in centipawns, mates are scored relative to this value
+MATE = 100000
+
+# Drop of score in centipawns between iterations for which time is extended
+SCORE_DROP = 30
+
+# Scores beyond this bound are mate scores, which are never pruned
+MATE_BOUND = MATE - 1000
+
+# Depth reduction of the search after a null move
+NULL_MOVE_REDUCTION = 2
+
+# Number of moves searched at full depth before late moves are reduced
+REDUCTION_MOVES = 3
+
+# Half width in centipawns of the initial aspiration window
+ASPIRATION_WINDOW = 50
+
+# Margin in centipawns by which a quiet move must be able to raise the static
+# evaluation to be searched, indexed by remaining depth
+FUTILITY_MARGIN = (0, 200, 500)
+
+class SearchAborted(Exception):
+    """Raised inside the search when it is asked to stop."""
+    pass
+
+class Search(object):
+
+    def __init__(
+            self,
+            board    : Board,
+            callback : Optional[Callable[[dict], None]] = None,
+            stop     : Optional[threading.Event] = None,
+            timer    : Optional[TimeManager] = None,
+            null_move  : bool = True,
+            reductions : bool = True,
+            aspiration : bool = True,
+            futility   : bool = True,
+        ):
+        """Create an alpha-beta search over a given board.
+
+            Parameters
+            ----------
+            board : Board
+                Board to search, the board is modified during the search and
+                restored afterwards.
+
+            callback : Optional[Callable[[dict], None]]
+                If given, called after every completed iteration with a
+                dictionary containing the 'depth', 'score', 'pv' and 'nodes' of
+                that iteration.
+
+            stop : Optional[threading.Event]
+                If given, the search aborts as soon as the event is set and
+                returns the result of the last completed iteration.
+
+            timer : Optional[TimeManager]
+                If given, no iteration is started after its soft deadline and
+                the search aborts at its hard deadline. The clock is polled
+                every timer.poll nodes.
+
+            null_move : bool, default=True
+                If True, use null-move pruning: if passing the turn still
+                fails high in a reduced search, the position is cut off.
+
+            reductions : bool, default=True
+                If True, use late move reductions: quiet moves ordered after
+                the first moves are searched with reduced depth, and searched
+                again at full depth if they raise alpha.
+
+            aspiration : bool, default=True
+                If True, search each iteration with a narrow window around the
+                score of the previous iteration, widening it on failure.
+
+            futility : bool, default=True
+                If True, use futility pruning: quiet moves close to the leaves
+                are skipped if the static evaluation is too far below alpha.
+            """
+        self.board    = board
+        self.callback = callback
+        self.stop     = stop if stop is not None else threading.Event()
+        self.timer    = timer
+        self.nodes    = 0
+
+        # Selectivity features, each can be disabled to measure its effect
+        self.null_move  = bool(null_move)
+        self.reductions = bool(reductions)
+        self.aspiration = bool(aspiration)
+        self.futility   = bool(futility)
+
+        # Move ordering and best move found per position hash
+        self.ordering = MoveOrdering(board.n_ranks, board.n_files)
+        self.table    = dict()
+
+    ########################################################################
+    #                              Run method                              #
+    ########################################################################
+
+    def run(self, depth: int) -> Tuple[Optional[Move], int]:
+        """Search the board using iterative deepening up to a given depth.
+
+            Parameters
+            ----------
+            depth : int
+                Maximum depth in plies to search.
+
+            Returns
+            -------
+            move : Optional[Move]
+                Best move found, None if there are no legal moves.
+
+            score : int
+                Score of best move in centipawns from the perspective of the
+                color to move.
+            """
+        # Initialise result
+        best_move  = None
+        best_score = 0
+        previous   = None
+
+        # Iteratively deepen the search
+        for iteration in range(1, depth+1):
+            try:
+                score, pv = self.iterate(iteration, previous)
+            except SearchAborted:
+                break
+
+            # Store result of completed iteration
+            if pv:
+                best_move  = pv[0]
+                best_score = score
+
+            # Report progress
+            if self.callback is not None:
+                self.callback({
+                    'depth': iteration,
+                    'score': score,
+                    'pv'   : pv,
+                    'nodes': self.nodes,
+                })
+
+            # Stop if there is nothing left to search
+            if not pv or abs(score) >= MATE - iteration:
+                break
+
+            # Stop if the next iteration is unlikely to finish in time, give
+            # the search more time if the score dropped
+            if self.timer is not None:
+                if previous is not None and score < previous - SCORE_DROP:
+                    self.timer.extend()
+                if self.timer.elapsed() >= 0.6 * self.timer.soft:
+                    break
+            previous = score
+
+        # Fall back to any legal move if aborted before the first iteration
+        if best_move is None:
+            moves = self.board.legal_moves()
+            if moves:
+                best_move = moves[0]
+
+        # Return result
+        return best_move, best_score
+
+    def iterate(self, depth: int, previous: Optional[int] = None) -> Tuple[int, List[Move]]:
+        """Search a single iteration, using an aspiration window if enabled.
+
+            Parameters
+            ----------
+            depth : int
+                Depth in plies to search.
+
+            previous : Optional[int]
+                Score of the previous iteration, if any.
+
+            Returns
+            -------
+            score : int
+                Score of position from the perspective of the color to move.
+
+            pv : List[Move]
+                Principal variation from the current position.
+            """
+        # Search full window without a previous score
+        if not self.aspiration or previous is None:
+            return self.negamax(depth, -MATE-1, MATE+1, ply=0)
+
+        # Search window around previous score, widening the side that failed
+        window = ASPIRATION_WINDOW
+        alpha  = max(-MATE-1, previous - window)
+        beta   = min( MATE+1, previous + window)
+        while True:
+            score, pv = self.negamax(depth, alpha, beta, ply=0)
+            if score <= alpha and alpha > -MATE-1:
+                alpha = max(-MATE-1, alpha - window)
+            elif score >= beta and beta < MATE+1:
+                beta  = min( MATE+1, beta + window)
+            else:
+                return score, pv
+            window *= 4
+
+    ########################################################################
+    #                             Search method                            #
+    ########################################################################
+
+    def negamax(
+            self,
+            depth : int,
+            alpha : int,
+            beta  : int,
+            ply   : int,
+            null  : bool = True,
+        ) -> Tuple[int, List[Move]]:
+        """Perform a negamax alpha-beta search.
+
+            Parameters
+            ----------
+            depth : int
+                Remaining depth in plies to search.
+
+            alpha : int
+                Lower bound of score window.
+
+            beta : int
+                Upper bound of score window.
+
+            ply : int
+                Number of plies from the root of the search.
+
+            null : bool, default=True
+                If False, null-move pruning is not tried in this position,
+                used to prevent two null moves in a row.
+
+            Returns
+            -------
+            score : int
+                Score of position from the perspective of the color to move.
+
+            pv : List[Move]
+                Principal variation from the current position.
+            """
+        # Count node
+        self.nodes += 1
+
+        # Check if we should stop
+        if self.stop.is_set() or (
+                self.timer is not None and
+                self.nodes % self.timer.poll == 0 and
+                self.timer.hard_expired()
+            ):
+            raise SearchAborted()
+
+        # Score draws, a repetition within the search is scored as a draw as
+        # the side to move could repeat it again
+        if ply > 0 and (
+                self.board.is_repetition(count=2) or
+                self.board.is_fifty_moves()
+            ):
+            return 0, list()
+
+        # Resolve captures in leaf nodes
+        if depth <= 0:
+            return self.quiescence(alpha, beta, ply)
+
+        # Initialise principal variation
+        key     = self.board.zobrist_hash()
+        best_pv = list()
+        legal   = False
+
+        # Get state required by selectivity features
+        color    = pieces.Color(self.board.color)
+        in_check = (
+            (self.null_move or self.reductions or self.futility) and
+            self.board.is_in_check(color)
+        )
+
+        # Null-move pruning, if passing the turn still fails high in a reduced
+        # search, a real move will most likely fail high as well. Positions
+        # with only pawns are skipped, as passing may be the best move there.
+        if (
+                self.null_move and null and ply > 0 and not in_check and
+                depth > NULL_MOVE_REDUCTION and abs(beta) < MATE_BOUND and
+                self.has_pieces(color) and self.evaluate() >= beta
+            ):
+            self.board.make_null_move()
+            try:
+                score, _ = self.negamax(
+                    depth-1-NULL_MOVE_REDUCTION, -beta, -beta+1, ply+1, null=False,
+                )
+            finally:
+                self.board.unmake_null_move()
+            if -score >= beta:
+                return beta, list()
+
+        # Futility pruning, quiet moves near the leaves cannot raise alpha if
+        # the static evaluation is too far below it
+        futile = (
+            self.futility and not in_check and
+            depth < len(FUTILITY_MARGIN) and abs(alpha) < MATE_BOUND and
+            self.evaluate() + FUTILITY_MARGIN[depth] <= alpha
+        )
+
+        # Loop over all moves, generated lazily starting with the best move
+        # found earlier
+        for index, (move, order) in enumerate(self.moves(ply, self.probe(key))):
+            legal = True
+
+            # Quiet moves are ordered after captures and killer moves
+            quiet = 0 <= order < KILLER
+
+            # Search move
+            self.board.push(move)
+            try:
+                # Get whether the move gives check, which is never pruned
+                check = (
+                    quiet and (futile or self.reductions) and
+                    self.board.is_in_check(color.opposite)
+                )
+
+                # Skip futile quiet moves
+                if futile and quiet and not check:
+                    continue
+
+                # Search late quiet moves with reduced depth and a null
+                # window, search again at full depth if they raise alpha
+                if (
+                        self.reductions and quiet and not check and not in_check
+                        and depth >= 3 and index >= REDUCTION_MOVES
+                    ):
+                    score, pv = self.negamax(depth-2, -alpha-1, -alpha, ply+1)
+                    if -score <= alpha:
+                        continue
+
+                score, pv = self.negamax(depth-1, -beta, -alpha, ply+1)
+            finally:
+                self.board.pop()
+            score = -score
+
+            # Check for cutoff
+            if score >= beta:
+                self.table[key] = move
+                self.ordering.update(self.board, move, depth, ply)
+                return beta, list()
+
+            # Check for improvement
+            if score > alpha:
+                alpha   = score
+                best_pv = [move] + pv
+
+        # Score checkmate and stalemate
+        if not legal:
+            if self.board.is_in_check(pieces.Color(self.board.color)):
+                return -MATE + ply, list()
+            else:
+                return 0, list()
+
+        # Store best move
+        if best_pv:
+            self.table[key] = best_pv[0]
+
+        # Return result
+        return alpha, best_pv
+
+    def moves(
+            self,
+            ply       : int,
+            hash_move : Optional[Move] = None,
+        ) -> Iterator[Tuple[Move, int]]:
+        """Iterate over legal moves in search order, generated in stages.
+
+            Captures losing material according to static exchange evaluation
+            are deferred until after the quiet moves.
+
+            Parameters
+            ----------
+            ply : int
+                Number of plies from the root of the search.
+
+            hash_move : Optional[Move]
+                Best move previously found in this position, if any.
+
+            Yields
+            ------
+            move : Move
+                Legal move, most promising first.
+
+            score : int
+                Ordering score of move, see MoveOrdering.score().
+            """
+        # Initialise scores of generated moves and deferred captures
+        scores = {hash_move: HASH_MOVE}
+        losing = list()
+
+        # Order each stage by score
+        def order(moves):
+            for move in moves:
+                scores[move] = self.ordering.score(self.board, move, ply, hash_move)
+            return sorted(moves, key=scores.__getitem__, reverse=True)
+
+        # Yield moves, deferring losing captures
+        for move in self.board.iter_moves(hash_move, order):
+            if scores[move] < 0:
+                losing.append((move, scores[move]))
+            else:
+                yield move, scores[move]
+
+        # Yield losing captures
+        yield from losing
+
+    def probe(self, key: int) -> Optional[Move]:
+        """Get the best move found earlier for a position hash, if any."""
+        return self.table.get(key)
+
+    def has_pieces(self, color: pieces.Color) -> bool:
+        """Check whether a color has pieces other than pawns and its king."""
+        return any(
+            piece is not None and piece.color == color and
+            not isinstance(piece, (pieces.Pawn, pieces.King))
+            for piece in self.board.board.flat
+        )
+
+    def quiescence(
+            self,
+            alpha : int,
+            beta  : int,
+            ply   : int,
+        ) -> Tuple[int, List[Move]]:
+        """Search captures until the position is quiet.
+
+            Captures that lose material according to static exchange
+            evaluation are not searched.
+
+            Parameters
+            ----------
+            alpha : int
+                Lower bound of score window.
+
+            beta : int
+                Upper bound of score window.
+
+            ply : int
+                Number of plies from the root of the search.
+
+            Returns
+            -------
+            score : int
+                Score of position from the perspective of the color to move.
+
+            pv : List[Move]
+                Principal variation from the current position.
+            """
+        # Count node
+        self.nodes += 1
+
+        # Check if we should stop
+        if self.stop.is_set() or (
+                self.timer is not None and
+                self.nodes % self.timer.poll == 0 and
+                self.timer.hard_expired()
+            ):
+            raise SearchAborted()
+
+        # The color to move may decline all captures
+        score = self.evaluate()
+        if score >= beta:
+            return beta, list()
+        alpha = max(alpha, score)
+
+        # Initialise principal variation
+        best_pv = list()
+
+        # Loop over all captures, most valuable victim first
+        for move in self.ordering.order(
+                self.board,
+                self.board.legal_moves(captures=True),
+                ply,
+            ):
+            # Prune captures losing material
+            if self.board.see(move) < 0:
+                continue
+
+            # Search move
+            self.board.push(move)
+            try:
+                score, pv = self.quiescence(-beta, -alpha, ply+1)
+            finally:
+                self.board.pop()
+            score = -score
+
+            # Check for cutoff
+            if score >= beta:
+                return beta, list()
+
+            # Check for improvement
+            if score > alpha:
+                alpha   = score
+                best_pv = [move] + pv
+
+        # Return result
+        return alpha, best_pv
+
+    ########################################################################
+    #                           Evaluation method                          #
+    ########################################################################
+
+    def evaluate(self) -> int:
+        """Evaluate the board by counting material.
+
+            Returns
+            -------
+            score : int
+                Score of position in centipawns from the perspective of the
+                color to move.
+            """
+        # Initialise score
+        score = 0
+
+        # Add value of white pieces and subtract value of black pieces
+        for piece in self.board.board[self.board.piece_mask()]:
+            if piece.color == pieces.Color.WHITE:
+                score += piece.value
+            else:
+                score -= piece.value
+
+        # Return score from perspective of color to move
+        if self.board.color == pieces.Color.WHITE.value:
+            return score
+        else:
+            return -score
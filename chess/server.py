@@ -0,0 +1,278 @@
+import argparse
+import asyncio
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing    import Dict, List, Optional, Tuple
+from .board    import Board
+from .move     import Move
+from .search   import Search
+from .snapshot import Snapshot
+
+# Starting position of a new game
+START = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+################################################################################
+#                               Worker functions                               #
+################################################################################
+
+def analyse(state: Snapshot, depth: int) -> Tuple[Optional[Tuple], int]:
+    """Search a position, executed in a worker process.
+
+        Parameters
+        ----------
+        state : Snapshot
+            Snapshot of position to search, including the hashes of positions
+            since the last irreversible move to score repetitions as draws.
+
+        depth : int
+            Maximum depth in plies to search.
+
+        Returns
+        -------
+        move : Optional[Tuple]
+            Best move found as a tuple, None if there are no legal moves.
+
+        score : int
+            Score of best move in centipawns from the perspective of the color
+            to move.
+        """
+    move, score = Search(Board.from_snapshot(state)).run(depth)
+    return (tuple(move) if move is not None else None), score
+
+################################################################################
+#                                    Server                                    #
+################################################################################
+
+class UnknownGame(Exception):
+    """Raised when a request refers to a game that does not exist."""
+    pass
+
+class Server(object):
+
+    def __init__(
+            self,
+            host      : str = '127.0.0.1',
+            port      : int = 8765,
+            workers   : Optional[int] = None,
+            max_depth : int = 4,
+        ):
+        """Serve many games over TCP using a line-based protocol.
+
+            Every request is a single line of whitespace separated words, every
+            response is a single line starting with 'ok' or 'error'.
+
+            Commands
+            --------
+            new [fen]         : Create game, responds with the id of the game.
+            fen <id>          : Get position of game in FEN notation.
+            moves <id>        : Get all legal moves of game.
+            move <id> <move>  : Perform move, e.g., e2e4 or e7e8q.
+            result <id>       : Get result of game, '*' if game is not over.
+            go <id> [depth]   : Search best move of game, without playing it.
+            delete <id>       : Delete game.
+            quit              : Close connection.
+
+            Games are stored as immutable snapshots, which include the hashes
+            of the positions since the last irreversible move to detect
+            repetitions, and only loaded into a Board while handling a
+            request, so idle games take little memory. Searches are offloaded
+            to a process pool such that the event loop never stalls on them.
+
+            Parameters
+            ----------
+            host : str, default='127.0.0.1'
+                Host to listen on.
+
+            port : int, default=8765
+                Port to listen on.
+
+            workers : Optional[int]
+                Number of processes used for searching, defaults to the number
+                of CPUs.
+
+            max_depth : int, default=4
+                Maximum depth a client may request a search for.
+            """
+        # Initialise variables
+        self.host      = host
+        self.port      = port
+        self.workers   = workers
+        self.max_depth = max_depth
+
+        # Snapshot of each game by id
+        self.games : Dict[int, Snapshot] = dict()
+        self.ids   = itertools.count(1)
+
+        # Process pool, created when serving
+        self.pool = None
+
+    ########################################################################
+    #                             Serve method                             #
+    ########################################################################
+
+    async def serve(self) -> None:
+        """Serve games until cancelled."""
+        # Create process pool for searches
+        with ProcessPoolExecutor(max_workers=self.workers) as self.pool:
+            # Start server
+            server = await asyncio.start_server(self.handle, self.host, self.port)
+            # Serve forever
+            async with server:
+                await server.serve_forever()
+
+    async def handle(
+            self,
+            reader : asyncio.StreamReader,
+            writer : asyncio.StreamWriter,
+        ) -> None:
+        """Handle all requests of a single connection."""
+        try:
+            # Read requests line by line
+            while line := await reader.readline():
+                # Get command
+                command = line.decode(errors='replace').split()
+
+                # Close connection on request
+                if command == ['quit']:
+                    break
+
+                # Respond to command
+                writer.write((await self.execute(command) + '\n').encode())
+                await writer.drain()
+
+        # Reject lines exceeding the limit of the reader, the rest of the
+        # line can not be told apart from the next request
+        except ValueError:
+            try:
+                writer.write(b"error line too long\n")
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+        # Ignore clients that disconnect
+        except ConnectionError:
+            pass
+
+        # Close connection
+        finally:
+            writer.close()
+
+    ########################################################################
+    #                           Command methods                            #
+    ########################################################################
+
+    async def execute(self, command: List[str]) -> str:
+        """Execute a command and return the response.
+
+            Parameters
+            ----------
+            command : List[str]
+                Words of request line.
+
+            Returns
+            -------
+            response : str
+                Response line, without newline.
+            """
+        # Get method of command
+        method = getattr(self, f"command_{command[0]}", None) if command else None
+
+        # Check if command exists
+        if method is None:
+            return "error unknown command"
+
+        # Execute command
+        try:
+            return "ok " + await method(*command[1:])
+        except UnknownGame:
+            return "error unknown game"
+        except (AssertionError, TypeError, ValueError, IndexError) as error:
+            return f"error {error}"
+
+    def get(self, game: str) -> Snapshot:
+        """Get snapshot of a game by id, raises UnknownGame if it does not exist."""
+        try:
+            return self.games[int(game)]
+        except KeyError:
+            raise UnknownGame(game) from None
+
+    async def command_new(self, *fen: str) -> str:
+        """Create a new game, optionally from a FEN position."""
+        # Validate position
+        board = Board.from_fen(' '.join(fen) if fen else START)
+
+        # Store game
+        game = next(self.ids)
+        self.games[game] = board.snapshot()
+
+        # Return game id
+        return str(game)
+
+    async def command_fen(self, game: str) -> str:
+        """Get position of game in FEN notation."""
+        return Board.from_snapshot(self.get(game)).to_fen()
+
+    async def command_moves(self, game: str) -> str:
+        """Get all legal moves of game."""
+        board = Board.from_snapshot(self.get(game))
+        return ' '.join(board.uci(move) for move in board.legal_moves())
+
+    async def command_move(self, game: str, move: str) -> str:
+        """Perform a move, responds with the new position."""
+        # Load game
+        board = Board.from_snapshot(self.get(game))
+
+        # Perform move, never asking for a promotion piece
+        board.push(board.parse_uci(move))
+
+        # Store game
+        self.games[int(game)] = board.snapshot()
+
+        # Return new position
+        return board.to_fen()
+
+    async def command_result(self, game: str) -> str:
+        """Get result of game, '*' if the game is not over."""
+        return Board.from_snapshot(self.get(game)).result() or '*'
+
+    async def command_go(self, game: str, depth: str = '3') -> str:
+        """Search best move of game in the process pool."""
+        # Get position and depth
+        state = self.get(game)
+        depth = min(int(depth), self.max_depth)
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        # Search in process pool
+        move, score = await asyncio.get_running_loop().run_in_executor(
+            self.pool, analyse, state, depth,
+        )
+
+        # Return result
+        if move is None:
+            return f"none {score}"
+        return f"{Board.from_snapshot(state).uci(Move(*move))} {score}"
+
+    async def command_delete(self, game: str) -> str:
+        """Delete a game."""
+        self.get(game)
+        del self.games[int(game)]
+        return game
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Chess game server")
+    parser.add_argument('--host'     , default='127.0.0.1', help="host to listen on")
+    parser.add_argument('--port'     , type=int, default=8765, help="port to listen on")
+    parser.add_argument('--workers'  , type=int, default=os.cpu_count(), help="search processes")
+    parser.add_argument('--max-depth', type=int, default=4, help="maximum search depth")
+    args = parser.parse_args()
+
+    # Run server
+    asyncio.run(Server(
+        host      = args.host,
+        port      = args.port,
+        workers   = args.workers,
+        max_depth = args.max_depth,
+    ).serve())
@@ -0,0 +1,99 @@
+import numpy as np
+from functools import lru_cache
+from typing    import NamedTuple, Tuple
+from .         import pieces
+
+# Piece types by index, see pieces.Piece.index
+TYPES = (
+    pieces.Pawn, pieces.Knight, pieces.Bishop,
+    pieces.Rook, pieces.Queen , pieces.King  ,
+)
+
+class Snapshot(NamedTuple):
+    """Immutable state of a board, see Board.snapshot().
+
+        Snapshots only contain integers and strings, so they are hashable and
+        can be shared between threads or sent to other processes as is.
+
+        Attributes
+        ----------
+        n_ranks : int
+            Number of ranks on chess board.
+
+        n_files : int
+            Number of files on chess board.
+
+        pieces : Tuple[int, ...]
+            Bitboard of each piece index, where bit rank * n_files + file is
+            set if the piece is on that square.
+
+        color : str ('w'|'b')
+            Color to move.
+
+        castling : str
+            Remaining castling rights, e.g., 'KQkq'.
+
+        en_passant : str
+            En passant square, '-' if none.
+
+        halfmove : int
+            Number of halfmoves since the last capture or pawn move.
+
+        fullmove : int
+            Number of the current move.
+
+        hashes : Tuple[int, ...]
+            Zobrist hashes of positions since the last irreversible move, the
+            last is the current position.
+        """
+    n_ranks    : int
+    n_files    : int
+    pieces     : Tuple[int, ...]
+    color      : str
+    castling   : str
+    en_passant : str
+    halfmove   : int
+    fullmove   : int
+    hashes     : Tuple[int, ...]
+
+def encode_pieces(board: np.ndarray) -> Tuple[int, ...]:
+    """Encode an array of pieces as a bitboard per piece index."""
+    # Initialise result
+    result = [0] * 2 * len(TYPES)
+
+    # Set bit of each piece
+    n_files = board.shape[1]
+    for rank, file in zip(*np.nonzero(board != None)):
+        result[board[rank, file].index] |= 1 << int(rank * n_files + file)
+
+    # Return result
+    return tuple(result)
+
+@lru_cache(maxsize=1024)
+def decode_pieces(n_ranks: int, n_files: int, bitboards: Tuple[int, ...]) -> np.ndarray:
+    """Decode bitboards as a read-only array of pieces.
+
+        Arrays are cached per position, such that boards created from the same
+        snapshot share a single array. The array is never modified, as boards
+        copy their array before making a move.
+        """
+    # Initialise result
+    result = np.full((n_ranks, n_files), None, dtype=object)
+
+    # Create a single piece per index and place it on all its squares
+    for index, bitboard in enumerate(bitboards):
+        if not bitboard:
+            continue
+        piece = TYPES[index % len(TYPES)](
+            pieces.Color.BLACK if index >= len(TYPES) else pieces.Color.WHITE,
+            n_files = n_files,
+            n_ranks = n_ranks,
+        )
+        while bitboard:
+            square    = (bitboard & -bitboard).bit_length() - 1
+            bitboard &= bitboard - 1
+            result[divmod(square, n_files)] = piece
+
+    # Return result as read-only array
+    result.flags.writeable = False
+    return result
@@ -0,0 +1,103 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Modules of which to measure the import time
+MODULES = [
+    'chess',
+    'chess.move',
+    'chess.timeman',
+    'chess.board',
+    'chess.search',
+    'chess.gui',
+    'chess.gui.gui',
+]
+
+# Heavy dependencies of which to report whether an import pulls them in
+HEAVY = ['numpy', 'pygame', 'sqlite3']
+
+def measure(statement: str, repeat: int = 10) -> float:
+    """Measure median wall time in seconds of running a statement in a fresh
+        interpreter."""
+    # Initialise result
+    times = list()
+
+    # Run statement in new interpreters
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+
+    # Return result
+    return statistics.median(times)
+
+def loaded(module: str) -> List[str]:
+    """Return heavy dependencies loaded by importing a module."""
+    output = subprocess.run(
+        [sys.executable, '-c', f"import sys, {module}; print(' '.join(sys.modules))"],
+        check = True, capture_output = True, text = True,
+    ).stdout.split()
+    return [heavy for heavy in HEAVY if heavy in output]
+
+def benchmark(
+        modules : List[str] = MODULES,
+        repeat  : int = 10,
+    ) -> Dict[str, Dict[str, object]]:
+    """Measure the import time of modules, excluding interpreter startup.
+
+        Parameters
+        ----------
+        modules : List[str], default=MODULES
+            Modules to import.
+
+        repeat : int, default=10
+            Number of fresh interpreters per module.
+
+        Returns
+        -------
+        result : Dict[str, Dict[str, object]]
+            Import time in milliseconds and heavy dependencies per module.
+        """
+    # Measure interpreter startup
+    baseline = measure('pass', repeat)
+
+    # Measure imports
+    result = dict()
+    for module in modules:
+        # Skip modules with missing dependencies
+        try:
+            heavy = loaded(module)
+        except subprocess.CalledProcessError:
+            continue
+
+        result[module] = {
+            'milliseconds': round(1000 * max(0.0, measure(f"import {module}", repeat) - baseline), 1),
+            'loads'       : heavy,
+        }
+
+    # Return result
+    return result
+
+if __name__ == "__main__":
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Measure import time of the chess package")
+    parser.add_argument('modules' , nargs='*', default=MODULES, help="modules to import")
+    parser.add_argument('--repeat', type=int, default=10, help="interpreters per module")
+    parser.add_argument('--json'  , help="write results to this file")
+    args = parser.parse_args()
+
+    # Run benchmark
+    result = benchmark(args.modules, args.repeat)
+
+    # Print result
+    for module, stats in result.items():
+        print(f"{module:<16} {stats['milliseconds']:>7.1f} ms  {' '.join(stats['loads'])}")
+
+    # Write result, if required
+    if args.json is not None:
+        with open(args.json, 'w') as outfile:
+            json.dump(result, outfile, indent=4)
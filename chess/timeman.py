@@ -0,0 +1,85 @@
+import time
+from typing import Optional
+
+class TimeManager(object):
+
+    def __init__(
+            self,
+            remaining   : float,
+            increment   : float = 0.0,
+            moves_to_go : Optional[int] = None,
+            overhead    : float = 0.05,
+            poll        : int = 256,
+        ):
+        """Allocate thinking time for a single move from the clock.
+
+            The soft deadline is the time we aim to spend on the move, a new
+            iteration is not started once it is passed. It is extended when the
+            score drops, as the position may need more time. The hard deadline
+            is never passed, the search is aborted when it is reached.
+
+            Parameters
+            ----------
+            remaining : float
+                Remaining time on the clock in seconds.
+
+            increment : float, default=0.0
+                Time added to the clock after each move in seconds.
+
+            moves_to_go : Optional[int]
+                Number of moves until the next time control, if None, the time
+                is divided as if 30 moves remain.
+
+            overhead : float, default=0.05
+                Time in seconds reserved for communication per move.
+
+            poll : int, default=256
+                Number of nodes between checks of the clock by the search.
+            """
+        # Set clock
+        self.remaining   = remaining
+        self.increment   = increment
+        self.moves_to_go = moves_to_go
+        self.overhead    = overhead
+        self.poll        = poll
+
+        # Never use more time than available after the overhead
+        available = max(0.0, remaining - overhead)
+
+        # Divide remaining time over remaining moves
+        moves     = max(1, moves_to_go or 30)
+        self.soft = min(available, available / moves + 0.75 * increment)
+
+        # Allow up to a few times the soft budget, but keep a reserve
+        self.hard = min(available, 4 * self.soft, 0.5 * available + increment)
+        if moves_to_go == 1:
+            self.hard = available
+        self.soft = min(self.soft, self.hard)
+
+        # Start clock
+        self.start()
+
+    ########################################################################
+    #                            Clock methods                             #
+    ########################################################################
+
+    def start(self) -> None:
+        """Start the clock of the move."""
+        self.started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Return time in seconds spent on the move."""
+        return time.perf_counter() - self.started
+
+    def soft_expired(self) -> bool:
+        """Return True if no new iteration should be started."""
+        return self.elapsed() >= self.soft
+
+    def hard_expired(self) -> bool:
+        """Return True if the search must stop immediately."""
+        return self.elapsed() >= self.hard
+
+    def extend(self, factor: float = 1.5) -> None:
+        """Extend the soft deadline, e.g., when the score drops, without
+            passing the hard deadline."""
+        self.soft = min(self.soft * factor, self.hard)
@@ -1,13 +1,22 @@
-def print_boards_line(boards, separator=' ', end='\n'):
+from .render import write_boards
+
+def print_boards_line(boards, separator=' ', end='\n', file=None, unicode=False):
     """Print multiple boards on a single line."""
-    for line in zip(*[board.split('\n') for board in boards]):
-        print(separator.join(line))
+    write_boards(
+        boards    = boards,
+        file      = file,
+        separator = separator,
+        end       = end,
+        unicode   = unicode,
+    )
 
-def print_boards_grid(boards, width, separator=' ', end='\n\n'):
-    """Print multiple boards in a grid."""
-    for chunk in range(0, len(boards), width):
-        print_boards_line(
-            boards    = boards[chunk:chunk+width],
-            separator = separator,
-            end       = end,
-        )
+def print_boards_grid(boards, width, separator=' ', end='\n\n', file=None, unicode=False):
+    """Print multiple boards in a grid of width boards per line."""
+    write_boards(
+        boards    = boards,
+        file      = file,
+        columns   = width,
+        separator = separator,
+        end       = end,
+        unicode   = unicode,
+    )
@@ -0,0 +1,42 @@
+import numpy as np
+from functools import lru_cache
+
+class Zobrist(object):
+
+    def __init__(self, n_ranks : int = 8, n_files : int = 8, seed : int = 0):
+        """Random keys used to hash positions of a given board size.
+
+            Parameters
+            ----------
+            n_ranks : int
+                Number of ranks on chess board.
+
+            n_files : int
+                Number of files on chess board.
+
+            seed : int, default=0
+                Seed used to generate keys, fixed such that hashes are equal
+                between runs.
+            """
+        # Initialise random generator
+        generator = np.random.default_rng(seed)
+
+        # Generate a random 64-bit key for every feature of a position
+        def generate(size):
+            return generator.integers(
+                0, 2**64, size=size, dtype=np.uint64, endpoint=False,
+            ).tolist()
+
+        # Key for each piece index on each square
+        self.pieces     = generate((12, n_ranks, n_files))
+        # Key for black to move
+        self.color      = generate(1)[0]
+        # Key for each castling right
+        self.castling   = dict(zip('KQkq', generate(4)))
+        # Key for each file of an en passant square
+        self.en_passant = generate(n_files)
+
+@lru_cache(maxsize=None)
+def get(n_ranks : int = 8, n_files : int = 8) -> Zobrist:
+    """Get the Zobrist keys for a given board size, created once per size."""
+    return Zobrist(n_ranks, n_files)
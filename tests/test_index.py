@@ -0,0 +1,29 @@
+from chess.board import Board
+from chess.index import START, Game, PositionIndex, build
+
+def game(moves, result='*'):
+    """Return game from the starting position with moves in SAN."""
+    board  = Board.from_fen(START)
+    parsed = list()
+    for move in moves:
+        parsed.append(board.parse_san(move))
+        board.push(parsed[-1])
+    return Game(START, parsed, result), board
+
+def test_transpositions_share_record(tmp_path):
+    """Move orders reaching the same position are counted in one record."""
+    first , board = game(['Nf3', 'd5', 'd4'], '1-0')
+    second, _     = game(['d4', 'd5', 'Nf3'], '0-1')
+    build([first, second], str(tmp_path))
+
+    record = PositionIndex(str(tmp_path)).find(board)
+    assert record['games'] == 2
+    assert (record['white'], record['black']) == (1, 1)
+
+def test_find_without_en_passant_square(tmp_path):
+    """A FEN without en passant square finds the position after a double push."""
+    build([game(['e4', 'e5'])[0]], str(tmp_path))
+
+    fen    = "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"
+    record = PositionIndex(str(tmp_path)).find(Board.from_fen(fen))
+    assert record is not None and record['other'] == 1
@@ -0,0 +1,14 @@
+from chess.board import Board
+from chess.mate  import solve
+
+def test_shortest_mate():
+    """A longer mate proven first must not be reported instead of the mate in 2."""
+    board = Board.from_fen("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1")
+    for depth in (None, 2, 3):
+        line = solve(board, depth=depth)
+        assert [board.uci(move) for move in line] == ['a1a6', 'b7a6', 'b6b7']
+
+def test_no_mate_within_depth():
+    """No mate in 1 exists in the same position."""
+    board = Board.from_fen("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1")
+    assert solve(board, depth=1) is None